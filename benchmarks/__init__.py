@@ -0,0 +1 @@
+"""Benchmarks for the pythonbible-parser library."""
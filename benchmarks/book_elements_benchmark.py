@@ -0,0 +1,68 @@
+"""Benchmark the lookup of the book elements before the books are parsed.
+
+Compare one XPath search of the whole tree per book with the single-pass index
+built by OSISParser._get_book_elements.
+
+Usage: python -m benchmarks.book_elements_benchmark [VERSION ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from functools import partial
+from typing import TYPE_CHECKING
+
+import pythonbible as bible
+
+from pythonbible_parser.osis.constants import BOOK_IDS
+from pythonbible_parser.osis.osis_parser import XPATH_BOOK
+from pythonbible_parser.osis.osis_parser import OSISParser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+REPEAT: int = 5
+
+
+def main(version_values: list[str]) -> None:
+    for version_value in version_values or ["KJV"]:
+        parser = OSISParser(bible.Version(version_value))
+
+        xpath_time: float = _best_time(partial(_find_book_elements, parser))
+        index_time: float = _best_time(parser._get_book_elements)  # noqa: SLF001
+
+        print(
+            f"{version_value}: "
+            f"XPath per book {xpath_time * 1000:.1f} ms, "
+            f"single-pass index {index_time * 1000:.1f} ms "
+            f"({xpath_time / index_time:.1f}x faster)",
+        )
+
+
+def _find_book_elements(parser: OSISParser) -> dict[bible.Book, object]:
+    book_elements: dict[bible.Book, object] = {}
+
+    for book in bible.Book:
+        xpath: str = XPATH_BOOK.format(BOOK_IDS.get(book))
+        book_element = parser.tree.find(xpath, namespaces=parser.namespaces)
+
+        if book_element is not None:
+            book_elements[book] = book_element
+
+    return book_elements
+
+
+def _best_time(function: Callable[[], object]) -> float:
+    times: list[float] = []
+
+    for _ in range(REPEAT):
+        start_time: float = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start_time)
+
+    return min(times)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
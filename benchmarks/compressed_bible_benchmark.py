@@ -0,0 +1,100 @@
+"""Benchmark the size and the verse latency of the compressed output formats.
+
+Write the html rendering of each version as a Python module (see
+OSISParser.write), a packed file and a zlib and an lzma compressed file, and
+compare their sizes. Then read every verse from each compressed file, in a
+random order, with a cold cache (each chunk is decompressed for every verse) and
+with a warm cache (every chunk stays in memory). Each read is timed on a second
+pass, so the warm cache already holds every chunk.
+
+Usage: python -m benchmarks.compressed_bible_benchmark [VERSION ...]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pythonbible as bible
+
+from pythonbible_parser.compressed_bible import COMPRESSIONS
+from pythonbible_parser.compressed_bible import CompressedBible
+from pythonbible_parser.compressed_bible import write_compressed_bible
+from pythonbible_parser.osis.osis_parser import OSISParser
+from pythonbible_parser.osis.osis_parser import _write_file
+from pythonbible_parser.packed_bible import write_packed_bible
+
+RENDERING: str = "html"
+SEED: int = 0
+MICROSECOND: float = 1e-6
+
+
+def main(version_values: list[str]) -> None:
+    for version_value in version_values or ["KJV"]:
+        version = bible.Version(version_value)
+        parser = OSISParser(version, renderings=[RENDERING])
+        parser.parse()
+
+        with tempfile.TemporaryDirectory() as folder:
+            _benchmark(parser, Path(folder))
+
+
+def _benchmark(parser: OSISParser, folder: Path) -> None:
+    arguments = (
+        parser.version,
+        getattr(parser, RENDERING),
+        parser.verse_start_indices[RENDERING],
+        parser.verse_end_indices[RENDERING],
+    )
+    _write_file(folder, "module.py", *arguments, is_html=True)
+    module_size: int = (folder / "module.py").stat().st_size
+
+    packed_path: Path = folder / "packed.bin"
+    write_packed_bible(packed_path, *arguments, is_html=True)
+
+    print(f"{parser.version.value} ({RENDERING}):")
+    print(f"  {'module':<8} {module_size:>10,} bytes")
+    _print_size("packed", packed_path.stat().st_size, module_size)
+
+    verse_ids: list[int] = sorted(parser.verse_start_indices[RENDERING])
+    random.Random(SEED).shuffle(verse_ids)  # noqa: S311
+
+    for compression in COMPRESSIONS:
+        file_path: Path = folder / f"{compression}.cbin"
+        write_compressed_bible(
+            file_path,
+            *arguments,
+            is_html=True,
+            compression=compression,
+        )
+        _print_size(compression, file_path.stat().st_size, module_size)
+
+        for cache, cache_size in (("cold", 0), ("warm", None)):
+            with CompressedBible(file_path, cache_size=cache_size) as reader:
+                _read_verses(reader, verse_ids)
+                elapsed_time: float = _read_verses(reader, verse_ids)
+
+            print(
+                f"    {cache} cache: "
+                f"{elapsed_time / len(verse_ids) / MICROSECOND:8.1f} µs/verse",
+            )
+
+
+def _read_verses(reader: CompressedBible, verse_ids: list[int]) -> float:
+    start_time: float = time.perf_counter()
+
+    for verse_id in verse_ids:
+        reader.get_scripture(verse_id)
+
+    return time.perf_counter() - start_time
+
+
+def _print_size(name: str, size: int, module_size: int) -> None:
+    print(f"  {name:<8} {size:>10,} bytes ({size / module_size:6.1%} of the module)")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
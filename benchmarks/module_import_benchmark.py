@@ -0,0 +1,111 @@
+"""Benchmark importing the modules written by OSISParser.write.
+
+Write every rendering of each version twice, once with the verse indices as dict
+literals in the modules and once with the verse indices in marshal files, and
+import all six modules in a new interpreter. A cold import compiles the modules
+(there is no bytecode cache yet, as after an install or an upgrade), and a warm
+import loads them from their bytecode cache.
+
+Usage: python -m benchmarks.module_import_benchmark [VERSION ...]
+"""
+
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import pythonbible as bible
+
+from pythonbible_parser.osis.osis_parser import OSISParser
+from pythonbible_parser.osis.osis_parser import _write_file
+from pythonbible_parser.renderers import RENDERINGS
+from pythonbible_parser.renderers import is_html_rendering
+
+REPEAT: int = 3
+MEGABYTE: int = 1024 * 1024
+
+IMPORT_SCRIPT: str = """
+import importlib.util
+import sys
+import time
+from pathlib import Path
+
+import pythonbible  # imported first, so only the modules themselves are timed
+
+start_time = time.perf_counter()
+
+for module_path in sorted(Path(sys.argv[1]).glob("*.py")):
+    spec = importlib.util.spec_from_file_location(module_path.stem, module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+print(time.perf_counter() - start_time)
+"""
+
+
+def main(version_values: list[str]) -> None:
+    for version_value in version_values or ["KJV"]:
+        version = bible.Version(version_value)
+        parser = OSISParser(version)
+        parser.parse()
+
+        print(f"{version_value} ({len(RENDERINGS)} renderings):")
+
+        for name, index_files in (("dict literals", False), ("marshal", True)):
+            with tempfile.TemporaryDirectory() as folder:
+                _write_modules(parser, Path(folder), index_files)
+                size: int = sum(path.stat().st_size for path in Path(folder).iterdir())
+                cold_time: float = min(
+                    _import_modules(Path(folder), cold=True) for _ in range(REPEAT)
+                )
+                _import_modules(Path(folder), cold=False)
+                warm_time: float = min(
+                    _import_modules(Path(folder), cold=False) for _ in range(REPEAT)
+                )
+
+            print(
+                f"  {name:<14} {size / MEGABYTE:6.1f} MB "
+                f"cold {cold_time * 1000:7.1f} ms "
+                f"warm {warm_time * 1000:7.1f} ms",
+            )
+
+
+def _write_modules(parser: OSISParser, folder: Path, index_files: bool) -> None:
+    for rendering in RENDERINGS:
+        _write_file(
+            folder,
+            f"{rendering}.py",
+            parser.version,
+            getattr(parser, rendering),
+            parser.verse_start_indices[rendering],
+            parser.verse_end_indices[rendering],
+            is_html=is_html_rendering(rendering),
+            index_file=index_files,
+        )
+
+
+def _import_modules(folder: Path, cold: bool) -> float:
+    environment: dict[str, str] = dict(os.environ)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+
+    if cold:
+        shutil.rmtree(folder / "__pycache__", ignore_errors=True)
+        environment["PYTHONDONTWRITEBYTECODE"] = "1"
+
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", IMPORT_SCRIPT, str(folder)],
+        capture_output=True,
+        check=True,
+        env=environment,
+        text=True,
+    )
+
+    return float(result.stdout)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,117 @@
+"""Benchmark the lookup of the paragraphs of a passage in OldOSISParser.
+
+Use the verse ids of the complex passage of the tests (verses of Psalms,
+Jeremiah, Matthew and Luke). Compare finding the parent element of the first
+verse of each paragraph with an XPath search of the whole tree, as
+OldOSISParser used to, with the verse index built on the first query, and time
+the whole query with the caches of the parser cleared.
+
+Usage: python -m benchmarks.old_osis_parser_benchmark [VERSION ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from functools import partial
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pythonbible as bible
+
+from pythonbible_parser.osis.constants import BOOK_IDS
+from pythonbible_parser.osis.old_osis_parser import XPATH_VERSE_PARENT
+from pythonbible_parser.osis.old_osis_parser import OldOSISParser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+REPEAT: int = 5
+
+VERSE_IDS_COMPLEX: list[int] = [
+    19130004,
+    19130008,
+    24029032,
+    *range(24030001, 24030011),
+    24031012,
+    *range(40001018, 40001026),
+    *range(40002001, 40002019),
+    42003005,
+    42003006,
+    42003007,
+]
+
+
+def main(version_values: list[str]) -> None:
+    for version_value in version_values or ["KJV"]:
+        parser = OldOSISParser(bible.Version(version_value))
+
+        index_time: float = _time(parser.get_verse_locations)
+        paragraph_verse_ids: list[int] = _get_paragraph_verse_ids(parser)
+        xpath_time: float = _best_time(
+            partial(_find_with_xpath, parser, paragraph_verse_ids),
+        )
+        lookup_time: float = _best_time(
+            partial(_find_with_index, parser, paragraph_verse_ids),
+        )
+        query_time: float = _best_time(partial(_query, parser))
+
+        print(
+            f"{version_value} ({len(VERSE_IDS_COMPLEX)} verses, "
+            f"{len(paragraph_verse_ids)} paragraphs):\n"
+            f"  build the verse index once  {index_time * 1000:8.1f} ms\n"
+            f"  XPath per paragraph         {xpath_time * 1000:8.3f} ms\n"
+            f"  verse index per paragraph   {lookup_time * 1000:8.3f} ms\n"
+            f"  uncached query              {query_time * 1000:8.3f} ms",
+        )
+
+
+def _get_paragraph_verse_ids(parser: OldOSISParser) -> list[int]:
+    """Return the first requested verse of each paragraph of the passage."""
+    verse_locations = parser.get_verse_locations()
+    paragraph_verse_ids: list[int] = []
+    paragraph_elements: list[Any] = []
+
+    for verse_id in VERSE_IDS_COMPLEX:
+        paragraph_element: Any = verse_locations[verse_id][0]
+
+        if not paragraph_elements or paragraph_elements[-1] is not paragraph_element:
+            paragraph_verse_ids.append(verse_id)
+            paragraph_elements.append(paragraph_element)
+
+    return paragraph_verse_ids
+
+
+def _find_with_xpath(parser: OldOSISParser, verse_ids: list[int]) -> list[Any]:
+    elements: list[Any] = []
+
+    for verse_id in verse_ids:
+        book, chapter, verse = bible.get_book_chapter_verse(verse_id)
+        xpath: str = XPATH_VERSE_PARENT.format(BOOK_IDS.get(book), chapter, verse)
+        elements.append(parser.tree.find(xpath, parser.namespaces))
+
+    return elements
+
+
+def _find_with_index(parser: OldOSISParser, verse_ids: list[int]) -> list[Any]:
+    verse_locations = parser.get_verse_locations()
+    return [verse_locations[verse_id][0] for verse_id in verse_ids]
+
+
+def _query(parser: OldOSISParser) -> None:
+    parser.clear()
+    parser.get_scripture_passage_text(list(VERSE_IDS_COMPLEX))
+
+
+def _time(function: Callable[[], object]) -> float:
+    start_time: float = time.perf_counter()
+    function()
+    return time.perf_counter() - start_time
+
+
+def _best_time(function: Callable[[], object]) -> float:
+    return min(_time(function) for _ in range(REPEAT))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
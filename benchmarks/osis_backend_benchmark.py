@@ -0,0 +1,98 @@
+"""Benchmark the OSIS backends that turn an XML file into book events.
+
+Compare building the whole element tree and walking each book element, reading
+the book elements one at a time with iterparse (streaming mode), and emitting
+the events from expat callbacks (expat mode). Each backend is timed on its own
+and then run again under tracemalloc to measure its peak memory.
+
+Usage: python -m benchmarks.osis_backend_benchmark [VERSION ...]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import tracemalloc
+from functools import partial
+from typing import TYPE_CHECKING
+
+import pythonbible as bible
+
+from pythonbible_parser.osis.osis_book_parser import OSISBookParser
+from pythonbible_parser.osis.osis_expat_reader import OSISExpatReader
+from pythonbible_parser.osis.osis_parser import OSISParser
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+REPEAT: int = 3
+MEGABYTE: int = 1024 * 1024
+
+
+def main(version_values: list[str]) -> None:
+    for version_value in version_values or ["KJV"]:
+        version = bible.Version(version_value)
+        input_size: float = OSISParser(version, expat=True).input_path.stat().st_size
+        backends: dict[str, Callable[[], int]] = {
+            "tree": partial(_read_tree, version),
+            "streaming": partial(_read_streaming, version),
+            "expat": partial(_read_expat, version),
+        }
+
+        print(f"{version_value} ({input_size / MEGABYTE:.1f} MB):")
+
+        for name, function in backends.items():
+            elapsed_time: float = _best_time(function)
+            peak_memory: int = _peak_memory(function)
+
+            print(
+                f"  {name:<10} {elapsed_time * 1000:7.1f} ms "
+                f"{input_size / MEGABYTE / elapsed_time:6.1f} MB/s "
+                f"peak {peak_memory / MEGABYTE:6.1f} MB",
+            )
+
+
+def _read_tree(version: bible.Version) -> int:
+    parser = OSISParser(version)
+    book_elements = parser._get_book_elements()  # noqa: SLF001
+    return sum(len(_walk(element)) for element in book_elements.values())
+
+
+def _read_streaming(version: bible.Version) -> int:
+    parser = OSISParser(version, streaming=True)
+    book_elements = parser._iter_book_elements_streaming()  # noqa: SLF001
+    return sum(len(_walk(element)) for _, element in book_elements)
+
+
+def _read_expat(version: bible.Version) -> int:
+    reader = OSISExpatReader(OSISParser(version, expat=True).input_path)
+    return sum(len(book_events) for _, book_events in reader.iter_book_events())
+
+
+def _walk(book_element: object) -> list[object]:
+    return OSISBookParser(book_element, 0, 0, 0, 0, 0, 0, renderings=()).walk()
+
+
+def _best_time(function: Callable[[], object]) -> float:
+    times: list[float] = []
+
+    for _ in range(REPEAT):
+        start_time: float = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start_time)
+
+    return min(times)
+
+
+def _peak_memory(function: Callable[[], object]) -> int:
+    tracemalloc.start()
+
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
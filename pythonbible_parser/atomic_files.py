@@ -0,0 +1,125 @@
+"""Contains the AtomicFiles class."""
+
+from __future__ import annotations
+
+import os
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+TEMPORARY_FILE_SUFFIX: str = ".tmp"
+
+
+class AtomicFiles:
+    """Write a set of files so that either all of them or none of them change.
+
+    Each file is written to a temporary file next to it, which can be done from
+    several threads at the same time. When the AtomicFiles context exits without
+    an error, every temporary file is renamed over its target with os.replace(),
+    which is atomic; if an error was raised, the temporary files are removed and
+    the existing files are left untouched. A crash while the files are written
+    therefore never leaves a half-written file behind. The renames themselves
+    are not atomic as a set: if one of them fails, the files renamed before it
+    are already replaced, and the temporary files that are left are removed.
+
+    With fsync, each file is flushed to disk before it is renamed, and the
+    folders are flushed after the files are renamed, so the new files survive a
+    power loss once the context exits.
+    """
+
+    def __init__(self: AtomicFiles, fsync: bool = False) -> None:
+        """Initialize an empty set of files.
+
+        :param fsync: True to flush the files and their folders to disk
+        """
+        self.fsync: bool = fsync
+        self._paths: list[tuple[Path, Path]] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def __enter__(self: AtomicFiles) -> AtomicFiles:  # noqa: PYI034
+        """Return the set of files itself."""
+        return self
+
+    def __exit__(self: AtomicFiles, exc_type: object, *_exc_info: object) -> None:
+        """Move the files into place, or discard them if an error was raised."""
+        if exc_type is None:
+            self.commit()
+        else:
+            self.discard()
+
+    @contextmanager
+    def open(
+        self: AtomicFiles,
+        file_path: Path,
+        mode: str = "w",
+        encoding: str | None = None,
+        newline: str | None = None,
+    ) -> Iterator[IO[Any]]:
+        """Open a temporary file to write the content of the given file to.
+
+        :param file_path: the path of the file
+        :param mode: the mode to open the file in ("w" or "wb")
+        :param encoding: the encoding of a text file
+        :param newline: the newline mode of a text file
+        :return: a context manager of the temporary file
+        """
+        temporary_path = Path(
+            file_path.parent
+            / f".{file_path.name}.{uuid.uuid4().hex}{TEMPORARY_FILE_SUFFIX}",
+        )
+
+        with self._lock:
+            self._paths.append((temporary_path, file_path))
+
+        with temporary_path.open(
+            mode=mode,
+            encoding=encoding,
+            newline=newline,
+        ) as writer:
+            yield writer
+
+            if self.fsync:
+                writer.flush()
+                os.fsync(writer.fileno())
+
+    def commit(self: AtomicFiles) -> None:
+        """Rename every temporary file over its target.
+
+        If a rename fails, the temporary files that were not renamed are removed
+        before the error is raised again.
+        """
+        with self._lock:
+            paths, self._paths = self._paths, []
+
+        for index, (temporary_path, file_path) in enumerate(paths):
+            try:
+                temporary_path.replace(file_path)
+            except OSError:
+                for remaining_path, _ in paths[index:]:
+                    remaining_path.unlink(missing_ok=True)
+
+                raise
+
+        if self.fsync and os.name == "posix":
+            for folder in {file_path.parent for _, file_path in paths}:
+                folder_descriptor: int = os.open(folder, os.O_RDONLY)
+
+                try:
+                    os.fsync(folder_descriptor)
+                finally:
+                    os.close(folder_descriptor)
+
+    def discard(self: AtomicFiles) -> None:
+        """Remove every temporary file."""
+        with self._lock:
+            paths, self._paths = self._paths, []
+
+        for temporary_path, _ in paths:
+            temporary_path.unlink(missing_ok=True)
@@ -0,0 +1,141 @@
+"""Contains the BoundedCache class."""
+
+from __future__ import annotations
+
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Hashable
+
+DEFAULT_MAX_ENTRIES: int = 128
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+
+
+class BoundedCache:
+    """A least recently used cache with an entry and a byte budget.
+
+    Unlike functools.lru_cache on a method or a module level function, a
+    BoundedCache belongs to a single object, so it is freed with it, and it
+    counts its evictions as well as its hits and misses. When the number of
+    entries or the total size of the values goes over its budget, the least
+    recently used entries are evicted. A value larger than the whole byte budget
+    is returned without being stored.
+    """
+
+    def __init__(
+        self: BoundedCache,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        max_bytes: int | None = None,
+    ) -> None:
+        """Initialize an empty cache.
+
+        :param max_entries: the maximum number of entries (None for no limit)
+        :param max_bytes: the maximum total size in bytes of the values, as
+        measured by get_size() (None for no limit)
+        """
+        self.max_entries: int | None = max_entries
+        self.max_bytes: int | None = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._size: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._lock: threading.Lock = threading.Lock()
+
+    def __len__(self: BoundedCache) -> int:
+        """Return the number of entries in the cache."""
+        return len(self._entries)
+
+    @property
+    def stats(self: BoundedCache) -> CacheStats:
+        """Return the hits, misses and evictions so far, and the current size."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+            )
+
+    def get(self: BoundedCache, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return the value of the given key, computing and storing it if needed.
+
+        :param key: the key of the value
+        :param compute: a function that returns the value if it is not cached
+        :return: the value
+        """
+        with self._lock:
+            if key in self._entries:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key][0]
+
+            self._misses += 1
+
+        value: Any = compute()
+        size: int = get_size(value) if self.max_bytes is not None else 0
+
+        if self.max_entries == 0 or (
+            self.max_bytes is not None and size > self.max_bytes
+        ):
+            return value
+
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+
+            self._entries[key] = (value, size)
+            self._size += size
+            self._evict()
+
+        return value
+
+    def clear(self: BoundedCache) -> None:
+        """Remove every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def _evict(self: BoundedCache) -> None:
+        while (
+            self.max_entries is not None and len(self._entries) > self.max_entries
+        ) or (self.max_bytes is not None and self._size > self.max_bytes):
+            self._size -= self._entries.popitem(last=False)[1][1]
+            self._evictions += 1
+
+
+def get_size(value: Any) -> int:
+    """Return the approximate size in bytes of a value and its contents.
+
+    Dictionaries, lists and tuples are measured with their keys and items, so the
+    size of a scripture passage includes the size of its paragraph strings.
+
+    :param value: the value to measure
+    :return: the size in bytes
+    """
+    size: int = sys.getsizeof(value)
+
+    if isinstance(value, dict):
+        size += sum(get_size(key) + get_size(item) for key, item in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(get_size(item) for item in value)
+
+    return size
@@ -0,0 +1,256 @@
+"""Contains the command line interface of the pythonbible-parser library.
+
+Usage: python -m pythonbible_parser build [--versions VERSION ...] [--jobs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import as_completed
+from pathlib import Path
+
+import pythonbible as bible
+
+from pythonbible_parser.osis.osis_parser import INPUT_FOLDER
+from pythonbible_parser.osis.osis_parser import OUTPUT_FOLDER
+from pythonbible_parser.osis.osis_parser import OSISParser
+from pythonbible_parser.renderers import RENDERINGS
+from pythonbible_parser.sqlite_export import DATABASE_FILENAME
+
+EXIT_SUCCESS: int = 0
+EXIT_FAILURE: int = 1
+EXIT_USAGE_ERROR: int = 2
+
+OUTPUT_FORMATS: tuple[str, ...] = (
+    "python",
+    "marshal",
+    "lazy",
+    "packed",
+    "zlib",
+    "lzma",
+    "split",
+    "sqlite",
+)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the command line interface.
+
+    :param argv: the command line arguments (defaults to sys.argv[1:])
+    :return: the exit code
+    """
+    arguments: argparse.Namespace = _get_argument_parser().parse_args(argv)
+
+    try:
+        versions: list[bible.Version] = (
+            [_get_version(version) for version in arguments.versions]
+            if arguments.versions
+            else _get_available_versions()
+        )
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return EXIT_USAGE_ERROR
+
+    return build(
+        versions,
+        arguments.jobs,
+        streaming=arguments.streaming,
+        cache_folder=arguments.cache_folder,
+        renderings=arguments.renderings,
+        output_format=arguments.format,
+    )
+
+
+def build(
+    versions: list[bible.Version],
+    jobs: int | None = None,
+    *,
+    streaming: bool = False,
+    cache_folder: Path | None = None,
+    renderings: list[str] | None = None,
+    output_format: str = "python",
+) -> int:
+    """Parse and write the given versions in a pool of worker processes.
+
+    The versions with the largest input files are scheduled first, so the total
+    build time is close to the build time of the slowest version.
+
+    :param versions: the versions to build
+    :param jobs: the number of worker processes (defaults to one per CPU)
+    :param streaming: True to parse the versions in streaming mode
+    :param cache_folder: the folder to cache parsed books in, if any
+    :param renderings: the renderings to build (defaults to all renderings)
+    :param output_format: "python" to write Python modules (see OSISParser.write),
+    "marshal" for Python modules with their verse indices in marshal files, "lazy"
+    for lazy-loading modules, "packed" for packed binary files, "zlib" or "lzma"
+    for compressed files, "split" for one file per book or "sqlite" for a SQLite
+    database shared by all versions
+    :return: the exit code
+    """
+    start_time: float = time.perf_counter()
+    versions = sorted(versions, key=_get_input_size, reverse=True)
+    exit_code: int = EXIT_SUCCESS
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(
+                build_version,
+                version,
+                streaming=streaming,
+                cache_folder=cache_folder,
+                renderings=renderings,
+                output_format=output_format,
+            ): version
+            for version in versions
+        }
+
+        for future in as_completed(futures):
+            version: bible.Version = futures[future]
+
+            try:
+                elapsed_time: float = future.result()
+            except Exception as error:  # noqa: BLE001
+                print(f"{version.value}: failed ({error!r})", file=sys.stderr)
+                exit_code = EXIT_FAILURE
+                continue
+
+            print(f"{version.value}: {elapsed_time:.2f}s")
+
+    total_time: float = time.perf_counter() - start_time
+    print(f"Built {len(versions)} version(s) in {total_time:.2f}s")
+
+    return exit_code
+
+
+def build_version(
+    version: bible.Version,
+    *,
+    streaming: bool = False,
+    cache_folder: Path | None = None,
+    renderings: list[str] | None = None,
+    output_format: str = "python",
+) -> float:
+    """Parse and write the given version.
+
+    :param version: the version to build
+    :param streaming: True to parse the version in streaming mode
+    :param cache_folder: the folder to cache parsed books in, if any
+    :param renderings: the renderings to build (defaults to all renderings)
+    :param output_format: "python" to write Python modules (see OSISParser.write),
+    "marshal" for Python modules with their verse indices in marshal files, "lazy"
+    for lazy-loading modules, "packed" for packed binary files, "zlib" or "lzma"
+    for compressed files, "split" for one file per book or "sqlite" for a SQLite
+    database shared by all versions
+    :return: the elapsed time in seconds
+    """
+    start_time: float = time.perf_counter()
+
+    parser = OSISParser(
+        version,
+        streaming=streaming,
+        cache_folder=cache_folder,
+        renderings=renderings,
+    )
+
+    # Python modules can be written while the version is parsed, so the text of
+    # the whole version is never held in memory.
+    if streaming and cache_folder is None and output_format in {"python", "marshal"}:
+        parser.write_streaming(index_files=output_format == "marshal")
+        return time.perf_counter() - start_time
+
+    parser.parse()
+
+    if output_format == "marshal":
+        parser.write(index_files=True)
+    elif output_format == "lazy":
+        parser.write_lazy()
+    elif output_format == "packed":
+        parser.write_packed()
+    elif output_format in {"zlib", "lzma"}:
+        parser.write_compressed(output_format)
+    elif output_format == "split":
+        parser.write_split()
+    elif output_format == "sqlite":
+        OUTPUT_FOLDER.mkdir(exist_ok=True)
+        parser.write_sqlite(Path(OUTPUT_FOLDER / DATABASE_FILENAME))
+    else:
+        parser.write()
+
+    return time.perf_counter() - start_time
+
+
+def _get_argument_parser() -> argparse.ArgumentParser:
+    argument_parser = argparse.ArgumentParser(prog="python -m pythonbible_parser")
+    subparsers = argument_parser.add_subparsers(dest="command", required=True)
+
+    build_parser = subparsers.add_parser(
+        "build",
+        help="parse and write one or more versions of the Bible",
+    )
+    build_parser.add_argument(
+        "--versions",
+        nargs="+",
+        metavar="VERSION",
+        help="the versions to build, e.g. KJV ASV (defaults to every version with "
+        "an input file)",
+    )
+    build_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="the number of worker processes (defaults to the number of CPUs)",
+    )
+    build_parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="parse the input files in streaming mode to reduce memory use (Python "
+        "modules are then written as each book is parsed)",
+    )
+    build_parser.add_argument(
+        "--cache-folder",
+        type=Path,
+        help="cache the parsed books in this folder and only parse the books that "
+        "changed since the last build",
+    )
+    build_parser.add_argument(
+        "--renderings",
+        nargs="+",
+        choices=RENDERINGS,
+        metavar="RENDERING",
+        help=f"the renderings to build (defaults to all: {', '.join(RENDERINGS)})",
+    )
+    build_parser.add_argument(
+        "--format",
+        choices=OUTPUT_FORMATS,
+        default="python",
+        help="write Python modules (the default), Python modules that load their "
+        "verse indices from marshal files, lazy-loading Python modules with "
+        "their data in separate files, packed binary files for PackedBible, "
+        "zlib or lzma compressed files for CompressedBible, one file per book "
+        "for SplitBible, or a "
+        f"SQLite database ({DATABASE_FILENAME}) with a full-text index",
+    )
+
+    return argument_parser
+
+
+def _get_version(value: str) -> bible.Version:
+    for version in bible.Version:
+        if value.upper() in {version.value.upper(), version.name}:
+            return version
+
+    msg = f"Unknown version: {value}"
+    raise ValueError(msg)
+
+
+def _get_available_versions() -> list[bible.Version]:
+    return [version for version in bible.Version if _get_input_size(version) > 0]
+
+
+def _get_input_size(version: bible.Version) -> int:
+    input_path = Path(INPUT_FOLDER / f"{version.value.lower()}.xml")
+    return input_path.stat().st_size if input_path.exists() else 0
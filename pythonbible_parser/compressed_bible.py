@@ -0,0 +1,320 @@
+"""Write and read a rendering of a version of the Bible in a compressed file.
+
+The text is split into one chunk per book, and each chunk is compressed on its
+own with zlib or lzma, so a verse can be read by decompressing only its book.
+
+The file contains, in this order:
+
+* a header (magic bytes, format version, HTML flag, compression, length of the
+  version name, number of verses, number of chunks and size of the index)
+* the version name, encoded in UTF-8
+* the compressed index: the sorted verse ids, the start and end index of each
+  verse in the text (or MISSING), the index in the text of the start of each
+  chunk and the end of the last chunk, and the offset in the file of the start
+  of each chunk and the end of the last chunk, as little-endian unsigned 32-bit
+  integers
+* the compressed chunks of the text, encoded in UTF-8
+"""
+
+from __future__ import annotations
+
+import lzma
+import mmap
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from bisect import bisect_right
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pythonbible as bible
+
+from pythonbible_parser.errors import InvalidCompressedBibleError
+from pythonbible_parser.packed_bible import MISSING
+from pythonbible_parser.packed_bible import clean_scripture
+from pythonbible_parser.packed_bible import validate_verse_ids
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
+MAGIC: bytes = b"PBCZ"
+FORMAT_VERSION: int = 1
+BOOK_ID_DIVISOR: int = 1_000_000
+DEFAULT_CACHE_SIZE: int = 8
+
+HEADER: struct.Struct = struct.Struct("<4sHBBIIII")
+
+# The compression id stored in the header, and the functions to use for it.
+COMPRESSIONS: dict[
+    str,
+    tuple[int, Callable[[bytes], bytes], Callable[[bytes], bytes]],
+] = {
+    "zlib": (1, lambda data: zlib.compress(data, 9), zlib.decompress),
+    "lzma": (2, lzma.compress, lzma.decompress),
+}
+FILE_EXTENSION: str = ".cbin"
+
+
+def write_compressed_bible(
+    file_path: Path,
+    version: bible.Version,
+    scripture_content: str,
+    verse_start_indices: dict[int, int],
+    verse_end_indices: dict[int, int],
+    *,
+    is_html: bool = False,
+    compression: str = "zlib",
+) -> None:
+    """Write a rendering of a version of the Bible to a compressed file.
+
+    The arguments are the same as the arguments of pythonbible's Bible class.
+
+    :param file_path: the path of the compressed file
+    :param version: the version of the Bible
+    :param scripture_content: the text of the rendering
+    :param verse_start_indices: the index of the start of each verse in the text
+    :param verse_end_indices: the index of the end of each verse in the text
+    :param is_html: True if the text is HTML
+    :param compression: "zlib" or "lzma"
+    """
+    compression_id, compress, _ = COMPRESSIONS[compression]
+    verse_ids: list[int] = sorted({*verse_start_indices, *verse_end_indices})
+    boundaries: list[int] = _get_chunk_boundaries(
+        scripture_content,
+        verse_start_indices,
+    )
+
+    chunks: list[bytes] = [
+        compress(scripture_content[start : boundaries[chunk + 1]].encode("utf-8"))
+        for chunk, start in enumerate(boundaries[:-1])
+    ]
+    chunk_offsets: list[int] = [0]
+
+    for chunk in chunks:
+        chunk_offsets.append(chunk_offsets[-1] + len(chunk))
+
+    index: array[int] = array("I", verse_ids)
+    index.extend(verse_start_indices.get(verse_id, MISSING) for verse_id in verse_ids)
+    index.extend(verse_end_indices.get(verse_id, MISSING) for verse_id in verse_ids)
+    index.extend(boundaries)
+    index.extend(chunk_offsets)
+
+    if sys.byteorder == "big":
+        index.byteswap()
+
+    compressed_index: bytes = compress(index.tobytes())
+    version_name: bytes = version.value.encode("utf-8")
+
+    with file_path.open(mode="wb") as writer:
+        writer.write(
+            HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                is_html,
+                compression_id,
+                len(version_name),
+                len(verse_ids),
+                len(chunks),
+                len(compressed_index),
+            ),
+        )
+        writer.write(version_name)
+        writer.write(compressed_index)
+
+        for chunk in chunks:
+            writer.write(chunk)
+
+
+class CompressedBible:
+    """A rendering of a version of the Bible read from a compressed file.
+
+    CompressedBible has the same get_scripture() method as pythonbible's Bible
+    class. Only the chunks of the books a verse range spans are decompressed, and
+    the most recently used chunks are kept in a least recently used cache.
+    """
+
+    def __init__(
+        self: CompressedBible,
+        file_path: Path,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Open the compressed file and load its index.
+
+        :param file_path: the path of the compressed file
+        :param cache_size: the number of decompressed chunks to keep in memory
+        :raises InvalidCompressedBibleError: if the file is not a valid file
+        """
+        self._buffer: Any = None
+
+        try:
+            # mmap raises a ValueError for an empty file.
+            with file_path.open(mode="rb") as reader:
+                self._buffer = mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ)
+
+            self._load_index()
+        except (struct.error, ValueError, zlib.error, lzma.LZMAError) as error:
+            if self._buffer is not None:
+                self._buffer.close()
+
+            msg = f"{file_path} is not a valid compressed Bible file."
+            raise InvalidCompressedBibleError(msg) from error
+
+        self.get_chunk: Callable[[int], str] = lru_cache(maxsize=cache_size)(
+            self._decompress_chunk,
+        )
+
+    def __enter__(self: CompressedBible) -> CompressedBible:  # noqa: PYI034
+        """Return the compressed Bible itself."""
+        return self
+
+    def __exit__(self: CompressedBible, *_exc_info: object) -> None:
+        """Close the compressed Bible."""
+        self.close()
+
+    def close(self: CompressedBible) -> None:
+        """Clear the cache and unmap the file."""
+        self.get_chunk.cache_clear()
+        self._buffer.close()
+
+    def get_scripture(
+        self: CompressedBible,
+        start_verse_id: int,
+        end_verse_id: int | None = None,
+    ) -> str:
+        """Return the text from the start of a verse to the end of another verse.
+
+        :param start_verse_id: the id of the first verse
+        :param end_verse_id: the id of the last verse (defaults to the first verse)
+        :return: the text of the verses
+        :raises InvalidVerseError: if a verse id is not valid
+        :raises VersionMissingVerseError: if a verse is not in this version
+        """
+        end_verse_id = end_verse_id or start_verse_id
+
+        # Every verse in the file is valid, so the verse ids only need to be
+        # validated (which is slow in pythonbible) if one of them is missing.
+        try:
+            start_index: int = self._get_index(self._starts, start_verse_id)
+            end_index: int = self._get_index(self._ends, end_verse_id)
+        except bible.VersionMissingVerseError:
+            validate_verse_ids(start_verse_id, end_verse_id)
+            raise
+
+        return clean_scripture(self._get_text(start_index, end_index), self.is_html)
+
+    def _load_index(self: CompressedBible) -> None:
+        (
+            magic,
+            format_version,
+            is_html,
+            compression_id,
+            name_size,
+            verse_count,
+            chunk_count,
+            index_size,
+        ) = HEADER.unpack_from(self._buffer)
+
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            msg = f"not a compressed Bible file of version {FORMAT_VERSION}"
+            raise ValueError(msg)
+
+        decompressors: dict[int, Callable[[bytes], bytes]] = {
+            identifier: decompress
+            for identifier, _, decompress in COMPRESSIONS.values()
+        }
+
+        if compression_id not in decompressors:
+            msg = f"unknown compression ({compression_id})"
+            raise ValueError(msg)
+
+        self._decompress: Callable[[bytes], bytes] = decompressors[compression_id]
+
+        name_offset: int = HEADER.size
+        index_offset: int = name_offset + name_size
+        self._data_offset: int = index_offset + index_size
+
+        version_name: bytes = self._buffer[name_offset:index_offset]
+        self.version: bible.Version = bible.Version(version_name.decode("utf-8"))
+        self.is_html: bool = bool(is_html)
+
+        index: array[int] = array("I")
+        index.frombytes(
+            self._decompress(self._buffer[index_offset : self._data_offset]),
+        )
+
+        if sys.byteorder == "big":
+            index.byteswap()
+
+        if len(index) != 3 * verse_count + 2 * (chunk_count + 1):
+            msg = "the index has the wrong size"
+            raise ValueError(msg)
+
+        if len(self._buffer) != self._data_offset + index[-1]:
+            msg = "the file is truncated or corrupted"
+            raise ValueError(msg)
+
+        self._verse_ids: array[int] = index[:verse_count]
+        self._starts: array[int] = index[verse_count : 2 * verse_count]
+        self._ends: array[int] = index[2 * verse_count : 3 * verse_count]
+        self._boundaries: array[int] = index[
+            3 * verse_count : 3 * verse_count + chunk_count + 1
+        ]
+        self._chunk_offsets: array[int] = index[3 * verse_count + chunk_count + 1 :]
+
+    def _get_index(self: CompressedBible, indices: array[int], verse_id: int) -> int:
+        position: int = bisect_left(self._verse_ids, verse_id)
+
+        if position < len(self._verse_ids) and self._verse_ids[position] == verse_id:
+            index: int = indices[position]
+
+            if index != MISSING:
+                return index
+
+        raise bible.VersionMissingVerseError(self.version.value, verse_id)
+
+    def _get_text(self: CompressedBible, start_index: int, end_index: int) -> str:
+        if end_index <= start_index:
+            return ""
+
+        first_chunk: int = bisect_right(self._boundaries, start_index) - 1
+        last_chunk: int = bisect_left(self._boundaries, end_index) - 1
+        chunk_start: int = self._boundaries[first_chunk]
+
+        # Most ranges are in a single book, so slice it without copying it first.
+        if first_chunk == last_chunk:
+            return self.get_chunk(first_chunk)[
+                start_index - chunk_start : end_index - chunk_start
+            ]
+
+        text: str = "".join(
+            self.get_chunk(chunk) for chunk in range(first_chunk, last_chunk + 1)
+        )
+
+        return text[start_index - chunk_start : end_index - chunk_start]
+
+    def _decompress_chunk(self: CompressedBible, chunk: int) -> str:
+        start: int = self._data_offset + self._chunk_offsets[chunk]
+        end: int = self._data_offset + self._chunk_offsets[chunk + 1]
+        return self._decompress(self._buffer[start:end]).decode("utf-8")
+
+
+def _get_chunk_boundaries(
+    scripture_content: str,
+    verse_start_indices: dict[int, int],
+) -> list[int]:
+    """Return the indices in the text where each chunk starts, and its length.
+
+    Each chunk starts at the first verse of a book, except the first chunk, which
+    starts at the beginning of the text.
+    """
+    book_starts: dict[int, int] = {}
+
+    for verse_id, start_index in verse_start_indices.items():
+        book_id: int = verse_id // BOOK_ID_DIVISOR
+        book_starts[book_id] = min(start_index, book_starts.get(book_id, start_index))
+
+    return sorted({0, *book_starts.values(), len(scripture_content)})
@@ -5,3 +5,23 @@ from __future__ import annotations
 
 class InvalidBibleParserError(Exception):
     """Raised when the Bible parser is not valid."""
+
+
+class InvalidRenderingError(Exception):
+    """Raised when a rendering is not valid."""
+
+
+class InvalidEventsFileError(Exception):
+    """Raised when an events file is not valid."""
+
+
+class InvalidPackedBibleError(Exception):
+    """Raised when a packed Bible file is not valid."""
+
+
+class InvalidCompressedBibleError(Exception):
+    """Raised when a compressed Bible file is not valid."""
+
+
+class InvalidSplitBibleError(Exception):
+    """Raised when a split Bible folder is not valid."""
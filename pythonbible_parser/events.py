@@ -0,0 +1,33 @@
+"""Contains the events emitted by a walk of a book of the Bible.
+
+A book is walked once into a flat list of events, and every renderer builds its
+output from that list. Each event is a tuple of three values: the kind of the
+event and two values whose meaning depends on the kind.
+
+=================  ===========================  ==============================
+Kind               First value                  Second value
+=================  ===========================  ==============================
+PARAGRAPH_OPEN     None                         None
+PARAGRAPH_CLOSE    None                         None
+VERSE_START        the verse id                 the verse number
+VERSE_END          the verse id                 None
+TEXT               the text                     True to separate it with a space
+NOTE_TEXT          the text of a note           True to separate it with a space
+TITLE              the title of the book        the short title of the book
+=================  ===========================  ==============================
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from typing import Tuple
+
+PARAGRAPH_OPEN: int = 0
+PARAGRAPH_CLOSE: int = 1
+VERSE_START: int = 2
+VERSE_END: int = 3
+TEXT: int = 4
+NOTE_TEXT: int = 5
+TITLE: int = 6
+
+Event = Tuple[int, Any, Any]
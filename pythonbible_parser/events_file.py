@@ -0,0 +1,198 @@
+"""Save and load the events of parsed books in a compact binary file.
+
+An events file stores the intermediate representation of a version of the Bible
+(see pythonbible_parser.events), so any rendering can be built from it without
+parsing the XML input file again.
+
+The file starts with a header (magic bytes, format version and number of books),
+followed by one section per book. Each section has a header (book, number of
+events, integers, strings and text bytes) followed by:
+
+* one byte per event, its kind, with SEPARATE_FLAG set for separated text
+* the integers of the verse events, as little-endian 32-bit integers
+* the length in characters of each string, as little-endian 32-bit integers
+* the strings, concatenated and encoded in UTF-8
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import TYPE_CHECKING
+from typing import BinaryIO
+
+import pythonbible as bible
+
+from pythonbible_parser import events
+from pythonbible_parser.errors import InvalidEventsFileError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pythonbible_parser.events import Event
+
+MAGIC: bytes = b"PBEV"
+FORMAT_VERSION: int = 1
+SEPARATE_FLAG: int = 0x80
+
+FILE_HEADER: struct.Struct = struct.Struct("<4sHH")
+BOOK_HEADER: struct.Struct = struct.Struct("<HIIII")
+
+TEXT_KINDS: frozenset[int] = frozenset((events.TEXT, events.NOTE_TEXT))
+
+
+def save_events(file_path: Path, book_events: dict[bible.Book, list[Event]]) -> None:
+    """Save the events of the given books to a file.
+
+    :param file_path: the path of the events file
+    :param book_events: a dictionary of books to their events
+    """
+    with file_path.open(mode="wb") as writer:
+        writer.write(FILE_HEADER.pack(MAGIC, FORMAT_VERSION, len(book_events)))
+
+        for book, book_event_list in book_events.items():
+            _write_book(writer, book, book_event_list)
+
+
+def load_events(file_path: Path) -> dict[bible.Book, list[Event]]:
+    """Load the events of each book from a file.
+
+    :param file_path: the path of the events file
+    :return: a dictionary of books to their events, in the order they were saved
+    :raises InvalidEventsFileError: if the file is not a valid events file
+    """
+    with file_path.open(mode="rb") as reader:
+        header: bytes = reader.read(FILE_HEADER.size)
+
+        if len(header) < FILE_HEADER.size:
+            msg = f"{file_path} is not an events file."
+            raise InvalidEventsFileError(msg)
+
+        magic, format_version, number_of_books = FILE_HEADER.unpack(header)
+
+        if magic != MAGIC:
+            msg = f"{file_path} is not an events file."
+            raise InvalidEventsFileError(msg)
+
+        if format_version != FORMAT_VERSION:
+            msg = (
+                f"{file_path} has format version {format_version}, "
+                f"expected {FORMAT_VERSION}."
+            )
+            raise InvalidEventsFileError(msg)
+
+        try:
+            return dict(_read_book(reader) for _ in range(number_of_books))
+        except (struct.error, ValueError, IndexError, EOFError) as error:
+            msg = f"{file_path} is truncated or corrupted."
+            raise InvalidEventsFileError(msg) from error
+
+
+def _write_book(writer: BinaryIO, book: bible.Book, book_events: list[Event]) -> None:
+    kinds: bytearray = bytearray()
+    integers: array[int] = array("i")
+    lengths: array[int] = array("I")
+    strings: list[str] = []
+
+    for kind, value, argument in book_events:
+        if kind in TEXT_KINDS:
+            kinds.append(kind | SEPARATE_FLAG if argument else kind)
+            lengths.append(len(value))
+            strings.append(value)
+        elif kind == events.VERSE_START:
+            kinds.append(kind)
+            integers.extend((value, argument))
+        elif kind == events.VERSE_END:
+            kinds.append(kind)
+            integers.append(value)
+        elif kind == events.TITLE:
+            kinds.append(kind)
+            lengths.extend((len(value), len(argument)))
+            strings.extend((value, argument))
+        else:
+            kinds.append(kind)
+
+    text: bytes = "".join(strings).encode("utf-8")
+
+    writer.write(
+        BOOK_HEADER.pack(
+            book.value,
+            len(kinds),
+            len(integers),
+            len(lengths),
+            len(text),
+        ),
+    )
+    writer.write(kinds)
+    writer.write(_to_little_endian(integers))
+    writer.write(_to_little_endian(lengths))
+    writer.write(text)
+
+
+def _read_book(reader: BinaryIO) -> tuple[bible.Book, list[Event]]:
+    book_value, number_of_events, number_of_integers, number_of_strings, text_size = (
+        BOOK_HEADER.unpack(_read_exactly(reader, BOOK_HEADER.size))
+    )
+    kinds: bytes = _read_exactly(reader, number_of_events)
+    integers: array[int] = _read_array(reader, "i", number_of_integers)
+    lengths: array[int] = _read_array(reader, "I", number_of_strings)
+    text: str = _read_exactly(reader, text_size).decode("utf-8")
+
+    book_events: list[Event] = []
+    append = book_events.append
+    integer_index: int = 0
+    string_index: int = 0
+    text_index: int = 0
+
+    for kind_byte in kinds:
+        kind: int = kind_byte & ~SEPARATE_FLAG
+
+        if kind in TEXT_KINDS:
+            end: int = text_index + lengths[string_index]
+            append((kind, text[text_index:end], kind_byte != kind))
+            string_index += 1
+            text_index = end
+        elif kind == events.VERSE_START:
+            append((kind, integers[integer_index], integers[integer_index + 1]))
+            integer_index += 2
+        elif kind == events.VERSE_END:
+            append((kind, integers[integer_index], None))
+            integer_index += 1
+        elif kind == events.TITLE:
+            title_end: int = text_index + lengths[string_index]
+            end = title_end + lengths[string_index + 1]
+            append((kind, text[text_index:title_end], text[title_end:end]))
+            string_index += 2
+            text_index = end
+        else:
+            append((kind, None, None))
+
+    return bible.Book(book_value), book_events
+
+
+def _read_exactly(reader: BinaryIO, size: int) -> bytes:
+    data: bytes = reader.read(size)
+
+    if len(data) < size:
+        raise EOFError
+
+    return data
+
+
+def _read_array(reader: BinaryIO, typecode: str, length: int) -> array[int]:
+    values: array[int] = array(typecode)
+    values.frombytes(_read_exactly(reader, length * values.itemsize))
+
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    return values
+
+
+def _to_little_endian(values: array[int]) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
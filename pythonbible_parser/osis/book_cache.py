@@ -0,0 +1,131 @@
+"""Contains the BookCache class."""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+
+from pythonbible_parser import __version__
+from pythonbible_parser.atomic_files import AtomicFiles
+from pythonbible_parser.osis.constants import BOOK_IDS
+from pythonbible_parser.osis.osis_utilities import serialize_element
+from pythonbible_parser.renderers import RENDERINGS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    import pythonbible as bible
+
+    from pythonbible_parser.osis.osis_book_parser import OSISBookParser
+
+# Increment this whenever the output of OSISBookParser changes without a new
+# release, so books parsed by an older parser are not loaded from the cache.
+CACHE_FORMAT_VERSION: int = 3
+
+
+class BookCache:
+    """On-disk cache of parsed books.
+
+    Each book is stored in its own file along with a hash of the book's XML, the
+    parser version and the renderings, so a book is only parsed again if it has
+    changed.
+
+    The cache files are written to temporary files that are renamed into place
+    (see AtomicFiles), and a cache file that cannot be loaded is treated as a
+    cache miss, so an interrupted build does not break the next ones.
+
+    The cache files are pickled, so the cache folder must only be writable by
+    trusted users.
+    """
+
+    def __init__(
+        self: BookCache,
+        folder: Path,
+        renderings: tuple[str, ...] = RENDERINGS,
+    ) -> None:
+        """Initialize the cache.
+
+        :param folder: the folder containing the cache files of one version
+        :param renderings: the renderings the books are parsed with
+        """
+        self.folder: Path = folder
+        self.renderings: tuple[str, ...] = renderings
+        self.digests: dict[bible.Book, str] = {}
+        self.cached_book_parsers: dict[bible.Book, OSISBookParser] = {}
+
+    def filter(
+        self: BookCache,
+        book_elements: Iterable[tuple[bible.Book, Any]],
+    ) -> Iterator[tuple[bible.Book, Any]]:
+        """Load the unchanged books from the cache and yield the changed ones.
+
+        The books found in the cache are available in cached_book_parsers once the
+        iterator is exhausted.
+
+        :param book_elements: the books and their book div elements
+        :return: an iterator of the books that need to be parsed
+        """
+        for book, element in book_elements:
+            digest: str = _get_digest(serialize_element(element), self.renderings)
+            self.digests[book] = digest
+            book_parser: OSISBookParser | None = self._load(book, digest)
+
+            if book_parser is None:
+                yield book, element
+            else:
+                self.cached_book_parsers[book] = book_parser
+
+    def save(
+        self: BookCache,
+        book_parsers: dict[bible.Book, OSISBookParser],
+    ) -> None:
+        """Store the given parsed books in the cache.
+
+        :param book_parsers: the parsed books that were yielded by filter()
+        """
+        self.folder.mkdir(parents=True, exist_ok=True)
+
+        with AtomicFiles() as files:
+            for book, book_parser in book_parsers.items():
+                with files.open(self._get_path(book), mode="wb") as writer:
+                    pickle.dump(
+                        (self.digests[book], book_parser),
+                        writer,
+                        protocol=pickle.HIGHEST_PROTOCOL,
+                    )
+
+    def _load(self: BookCache, book: bible.Book, digest: str) -> Any:
+        file_path: Path = self._get_path(book)
+
+        if not file_path.exists():
+            return None
+
+        try:
+            with file_path.open(mode="rb") as reader:
+                cached_digest, book_parser = pickle.load(reader)  # noqa: S301
+        except (
+            AttributeError,
+            EOFError,
+            ImportError,
+            OSError,
+            TypeError,
+            ValueError,
+            pickle.UnpicklingError,
+        ):
+            return None
+
+        return book_parser if cached_digest == digest else None
+
+    def _get_path(self: BookCache, book: bible.Book) -> Path:
+        return Path(self.folder / f"{BOOK_IDS.get(book)}.pickle")
+
+
+def _get_digest(book_xml: bytes, renderings: tuple[str, ...]) -> str:
+    hasher = hashlib.sha256(f"{__version__}:{CACHE_FORMAT_VERSION}:".encode())
+    hasher.update(",".join(renderings).encode())
+    hasher.update(book_xml)
+    return hasher.hexdigest()
@@ -0,0 +1,493 @@
+"""Contains a BibleParser that answers queries from the events of OSISParser."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from bisect import bisect_right
+from typing import TYPE_CHECKING
+from typing import Any
+
+from pythonbible import Book
+from pythonbible import InvalidVerseError
+from pythonbible import Version
+from pythonbible import VersionMissingVerseError
+
+from pythonbible_parser import events
+from pythonbible_parser.bible_parser import BibleParser
+from pythonbible_parser.bible_parser import sort_paragraphs
+from pythonbible_parser.osis.old_osis_parser import clean_paragraph
+from pythonbible_parser.osis.osis_parser import OSISParser
+from pythonbible_parser.packed_bible import validate_verse_ids
+from pythonbible_parser.renderers import PLAIN_NEWLINE
+from pythonbible_parser.renderers import PlainTextRenderer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from pythonbible_parser.events import Event
+
+ELLIPSIS: str = " ... "
+BOOK_ID_DIVISOR: int = 1_000_000
+CHAPTER_DIVISOR: int = 1_000
+
+
+class IndexedOSISParser(BibleParser):
+    """Answer scripture queries by slicing a plain text built from book events.
+
+    IndexedOSISParser returns the same results as OldOSISParser, but instead of
+    searching the element tree for every query, it renders the events of the
+    version once, with and without verse numbers, looks the verses up in the
+    verse indices of the text and slices the text between them. A query only
+    costs a binary search per verse and the length of its output, whatever the
+    size of the version.
+
+    The text is rendered the way OldOSISParser reads the XML file, which is not
+    quite the plain_text rendering of OSISParser: the text of the notes is kept,
+    the text of a verse is always separated from what precedes it, and a verse
+    ends at the end of its paragraph, so the text between paragraphs is not part
+    of any verse.
+
+    Two requested verses are in the same paragraph if no paragraph opens between
+    them in the text, and "..." marks the verses that are left out between them.
+
+    Ranges of verses can be requested with get_scripture_range_text() and
+    get_scripture_ranges_text(), which slice the text from the first to the last
+    verse of each range without listing the verses in between.
+    """
+
+    def __init__(
+        self: IndexedOSISParser,
+        version: Version,
+        osis_parser: OSISParser | None = None,
+    ) -> None:
+        """Initialize the parser from the events of a version.
+
+        :param version: the version of the Bible
+        :param osis_parser: an OSISParser of the version to read the events of the
+        books from (by default, the XML file is read in expat mode)
+        """
+        super().__init__(version)
+
+        if osis_parser is None:
+            osis_parser = OSISParser(version, expat=True)
+
+        self.short_titles: dict[Book, str] = {}
+        self.long_titles: dict[Book, str] = {}
+        renderers: dict[bool, PassageRenderer] = {
+            include_verse_number: PassageRenderer(include_verse_number)
+            for include_verse_number in (True, False)
+        }
+
+        for book, book_events in osis_parser.iter_book_events():
+            self._set_titles(book, book_events)
+
+            for renderer in renderers.values():
+                renderer.render(book_events)
+
+        # The text and verse indices with and without verse numbers.
+        self._texts: dict[bool, str] = {
+            include_verse_number: renderer.get_text()
+            for include_verse_number, renderer in renderers.items()
+        }
+        self._verse_start_indices: dict[bool, dict[int, int]] = {
+            include_verse_number: renderer.verse_start_indices
+            for include_verse_number, renderer in renderers.items()
+        }
+        self._verse_end_indices: dict[bool, dict[int, int]] = {
+            include_verse_number: renderer.verse_end_indices
+            for include_verse_number, renderer in renderers.items()
+        }
+
+        # The verses in the order of the text, to find the verses between two,
+        # and where they start in the text, to find the verse a paragraph opens.
+        start_indices: dict[int, int] = self._verse_start_indices[True]
+        self._verse_ids: list[int] = sorted(start_indices)
+        self._start_indices: list[int] = [
+            start_indices[verse_id] for verse_id in self._verse_ids
+        ]
+
+    def get_book_title(self: IndexedOSISParser, book: Book) -> str:
+        """Given a book, return the full title for that book.
+
+        :param book:
+        :return: the full title string
+        """
+        return self.long_titles.get(book) or ""
+
+    def get_short_book_title(self: IndexedOSISParser, book: Book) -> str:
+        """Given a book, return the short title for that book.
+
+        :param book:
+        :return: the short title string
+        """
+        return self.short_titles.get(book) or ""
+
+    def get_scripture_passage_text(
+        self: IndexedOSISParser,
+        verse_ids: list[int],
+        **kwargs: Any | None,
+    ) -> dict[Book, dict[int, list[str]]]:
+        """Get the scripture passage for the given verse ids.
+
+        Given a list of verse ids, return the structured scripture text passage
+        organized by book, chapter, and paragraph. The chapter of a paragraph is
+        the chapter of its first verse. Verses that are not in this version are
+        left out.
+
+        If the include_verse_number keyword argument is True, include the verse
+        numbers in the scripture passage; otherwise, do not include them.
+
+        :param verse_ids:
+        :param kwargs
+        :return: the scripture passage text in a dictionary of books to
+        dictionary of chapter numbers to lists of paragraph strings
+        :raises InvalidVerseError: if a verse id is not valid
+        """
+        if verse_ids is None or not verse_ids:
+            return {}
+
+        # keyword arguments
+        include_verse_number: bool = kwargs.get("include_verse_number", True)
+
+        paragraphs: dict[Book, dict[int, list[str]]] = {}
+
+        for paragraph_verse_ids in self._iter_paragraph_verse_ids(sorted(verse_ids)):
+            book, chapter = _get_book_chapter(paragraph_verse_ids[0])
+            paragraphs.setdefault(book, {}).setdefault(chapter, []).append(
+                self._get_paragraph_text(paragraph_verse_ids, include_verse_number),
+            )
+
+        return sort_paragraphs(paragraphs)
+
+    def get_scripture_range_text(
+        self: IndexedOSISParser,
+        start_verse_id: int,
+        end_verse_id: int,
+        **kwargs: Any | None,
+    ) -> dict[Book, dict[int, list[str]]]:
+        """Get the scripture passage for the given range of verse ids.
+
+        The result is the same as the result of get_scripture_passage_text() for
+        all the verses of the range, but the verses are not listed, so the cost
+        only depends on the length of the passage.
+
+        If the include_verse_number keyword argument is True, include the verse
+        numbers in the scripture passage; otherwise, do not include them.
+
+        :param start_verse_id: the id of the first verse of the range
+        :param end_verse_id: the id of the last verse of the range
+        :param kwargs:
+        :return: the scripture passage text in a dictionary of books to
+        dictionary of chapter numbers to lists of paragraph strings
+        :raises InvalidVerseError: if a verse id or the range is not valid
+        """
+        return self.get_scripture_ranges_text(
+            [(start_verse_id, end_verse_id)],
+            **kwargs,
+        )
+
+    def get_scripture_ranges_text(
+        self: IndexedOSISParser,
+        verse_ranges: list[tuple[int, int]],
+        **kwargs: Any | None,
+    ) -> dict[Book, dict[int, list[str]]]:
+        """Get the scripture passage for the given ranges of verse ids.
+
+        The ranges can be in any order and can overlap. As in
+        get_scripture_passage_text(), "..." marks the verses that are left out
+        between two ranges in the same paragraph.
+
+        If the include_verse_number keyword argument is True, include the verse
+        numbers in the scripture passage; otherwise, do not include them.
+
+        :param verse_ranges: the ids of the first and last verse of each range
+        :param kwargs:
+        :return: the scripture passage text in a dictionary of books to
+        dictionary of chapter numbers to lists of paragraph strings
+        :raises InvalidVerseError: if a verse id or a range is not valid
+        """
+        if not verse_ranges:
+            return {}
+
+        # keyword arguments
+        include_verse_number: bool = kwargs.get("include_verse_number", True)
+
+        paragraphs: dict[Book, dict[int, list[str]]] = {}
+
+        for paragraph_runs in self._iter_paragraph_runs(self._get_runs(verse_ranges)):
+            book, chapter = _get_book_chapter(self._verse_ids[paragraph_runs[0][0]])
+            paragraphs.setdefault(book, {}).setdefault(chapter, []).append(
+                self._get_runs_text(paragraph_runs, include_verse_number),
+            )
+
+        return sort_paragraphs(paragraphs)
+
+    def verse_text(
+        self: IndexedOSISParser,
+        verse_id: int,
+        **kwargs: Any | None,
+    ) -> str:
+        """Get the scripture text for the given verse id.
+
+        Given a verse id, return the string scripture text passage for that verse.
+
+        If the include_verse_number keyword argument is True, include the verse
+        numbers in the scripture passage; otherwise, do not include them.
+
+        :param verse_id:
+        :param kwargs:
+        :return:
+        :raises InvalidVerseError: if the verse id is not valid
+        :raises VersionMissingVerseError: if the verse is not in this version
+        """
+        if verse_id is None:
+            msg = "Verse id cannot be None."
+            raise InvalidVerseError(msg)
+
+        # keyword arguments
+        include_verse_number: bool = kwargs.get("include_verse_number", True)
+
+        if self._get_position(verse_id) is None:
+            validate_verse_ids(verse_id, None)
+            raise VersionMissingVerseError(self.version.value, verse_id)
+
+        return self._get_paragraph_text([verse_id], include_verse_number)
+
+    def _iter_paragraph_verse_ids(
+        self: IndexedOSISParser,
+        verse_ids: list[int],
+    ) -> Iterator[list[int]]:
+        """Group the sorted verse ids that are in this version by paragraph."""
+        text: str = self._texts[True]
+        start_indices: dict[int, int] = self._verse_start_indices[True]
+        paragraph_verse_ids: list[int] = []
+
+        for verse_id in verse_ids:
+            if self._get_position(verse_id) is None:
+                validate_verse_ids(verse_id, None)
+                continue
+
+            # A verse starts a new paragraph if a paragraph opens after the start
+            # of the previous verse (the end of a verse can be after the opening
+            # of the next paragraph). find() stops at the first paragraph break,
+            # so a gap of many verses costs no more than a gap of one.
+            if (
+                paragraph_verse_ids
+                and text.find(
+                    PLAIN_NEWLINE,
+                    start_indices[paragraph_verse_ids[-1]],
+                    start_indices[verse_id],
+                )
+                >= 0
+            ):
+                yield paragraph_verse_ids
+                paragraph_verse_ids = []
+
+            if not paragraph_verse_ids or verse_id != paragraph_verse_ids[-1]:
+                paragraph_verse_ids.append(verse_id)
+
+        if paragraph_verse_ids:
+            yield paragraph_verse_ids
+
+    def _get_paragraph_text(
+        self: IndexedOSISParser,
+        verse_ids: list[int],
+        include_verse_number: bool,
+    ) -> str:
+        """Return the text of the verses of a paragraph, with "..." at the gaps."""
+        runs: list[tuple[int, int]] = []
+
+        for verse_id in verse_ids:
+            position: int = self._get_position(verse_id)
+
+            if runs and position == runs[-1][1] + 1:
+                runs[-1] = (runs[-1][0], position)
+            else:
+                runs.append((position, position))
+
+        return self._get_runs_text(runs, include_verse_number)
+
+    def _get_runs(
+        self: IndexedOSISParser,
+        verse_ranges: list[tuple[int, int]],
+    ) -> list[tuple[int, int]]:
+        """Return the sorted, merged positions of the verses of the ranges."""
+        runs: list[tuple[int, int]] = []
+
+        for start_verse_id, end_verse_id in verse_ranges:
+            if (
+                self._get_position(start_verse_id) is None
+                or self._get_position(end_verse_id) is None
+            ):
+                validate_verse_ids(start_verse_id, end_verse_id)
+
+            if start_verse_id > end_verse_id:
+                msg = (
+                    f"start verse id ({start_verse_id}) is after end verse id "
+                    f"({end_verse_id})."
+                )
+                raise InvalidVerseError(msg)
+
+            first: int = bisect_left(self._verse_ids, start_verse_id)
+            last: int = bisect_right(self._verse_ids, end_verse_id) - 1
+
+            if first <= last:
+                runs.append((first, last))
+
+        runs.sort()
+        merged_runs: list[tuple[int, int]] = []
+
+        for first, last in runs:
+            if merged_runs and first <= merged_runs[-1][1] + 1:
+                merged_runs[-1] = (merged_runs[-1][0], max(last, merged_runs[-1][1]))
+            else:
+                merged_runs.append((first, last))
+
+        return merged_runs
+
+    def _iter_paragraph_runs(
+        self: IndexedOSISParser,
+        runs: list[tuple[int, int]],
+    ) -> Iterator[list[tuple[int, int]]]:
+        """Group the runs of verses by paragraph, splitting them where one opens."""
+        text: str = self._texts[True]
+        start_indices: list[int] = self._start_indices
+        paragraph_runs: list[tuple[int, int]] = []
+
+        for first, last in runs:
+            # The same test as in _iter_paragraph_verse_ids, between the last
+            # verse of the previous run and the first verse of this one.
+            if (
+                paragraph_runs
+                and text.find(
+                    PLAIN_NEWLINE,
+                    start_indices[paragraph_runs[-1][1]],
+                    start_indices[first],
+                )
+                >= 0
+            ):
+                yield paragraph_runs
+                paragraph_runs = []
+
+            run_first: int = first
+            index: int = text.find(
+                PLAIN_NEWLINE,
+                start_indices[run_first],
+                start_indices[last],
+            )
+
+            while index >= 0:
+                # The paragraph opens before the first verse that starts after it.
+                position: int = bisect_right(start_indices, index, run_first, last)
+                paragraph_runs.append((run_first, position - 1))
+                yield paragraph_runs
+                paragraph_runs = []
+                run_first = position
+                index = text.find(
+                    PLAIN_NEWLINE,
+                    start_indices[run_first],
+                    start_indices[last],
+                )
+
+            paragraph_runs.append((run_first, last))
+
+        if paragraph_runs:
+            yield paragraph_runs
+
+    def _get_runs_text(
+        self: IndexedOSISParser,
+        runs: list[tuple[int, int]],
+        include_verse_number: bool,
+    ) -> str:
+        """Return the text of the runs of verses of a paragraph, joined by "..."."""
+        text: str = self._texts[include_verse_number]
+        start_indices: dict[int, int] = self._verse_start_indices[include_verse_number]
+        end_indices: dict[int, int] = self._verse_end_indices[include_verse_number]
+        parts: list[str] = [
+            text[
+                start_indices[self._verse_ids[first]] : end_indices[
+                    self._verse_ids[last]
+                ]
+            ].strip()
+            for first, last in runs
+        ]
+
+        return clean_paragraph(
+            ELLIPSIS.join(parts).replace(PLAIN_NEWLINE, " "),
+        )
+
+    def _set_titles(
+        self: IndexedOSISParser,
+        book: Book,
+        book_events: Iterable[Event],
+    ) -> None:
+        """Set the titles of the book to its last titles, as OSISBookParser does."""
+        for kind, value, argument in book_events:
+            if kind == events.TITLE:
+                self.long_titles[book] = value
+                self.short_titles[book] = argument
+
+    def _get_position(self: IndexedOSISParser, verse_id: int) -> int | None:
+        position: int = bisect_left(self._verse_ids, verse_id)
+
+        if position < len(self._verse_ids) and self._verse_ids[position] == verse_id:
+            return position
+
+        return None
+
+
+class PassageRenderer(PlainTextRenderer):
+    """Render the plain text of a version the way OldOSISParser reads it.
+
+    The text of the notes is kept, the text of a verse is always separated from
+    what precedes it and a verse ends at the end of its paragraph.
+    """
+
+    no_space_before_verse = (PLAIN_NEWLINE, " ")
+    no_space_before_text = (PLAIN_NEWLINE, " ")
+
+    def __init__(self: PassageRenderer, include_verse_numbers: bool) -> None:
+        """Initialize the PassageRenderer.
+
+        :param include_verse_numbers: True to include the verse numbers
+        """
+        super().__init__("plain_text")
+        self.include_verse_numbers = include_verse_numbers
+        self.include_notes = True
+        self.current_verse: int = 0
+
+    def close_paragraph(self: PassageRenderer) -> None:
+        if self.current_verse:
+            self.end_verse(self.current_verse)
+
+        super().close_paragraph()
+
+    def start_verse(self: PassageRenderer, verse_id: int, verse_number: int) -> None:
+        super().start_verse(verse_id, verse_number)
+        self.current_verse = verse_id
+
+        # The text of a verse is separated from its number, or from the previous
+        # verse, even if it starts with a punctuation mark.
+        if self.buffer and not self.buffer.endswith(self.no_space_before_text):
+            self.buffer.append(" ")
+
+    def end_verse(self: PassageRenderer, verse_id: int) -> None:
+        """End the verse, unless it already ended with its paragraph."""
+        if verse_id != self.current_verse:
+            return
+
+        super().end_verse(verse_id)
+        self.current_verse = 0
+
+
+def _get_book_chapter(verse_id: int) -> tuple[Book, int]:
+    """Return the book and chapter of a verse id that is known to be valid.
+
+    pythonbible's get_book_chapter_verse() validates the verse id first, which
+    costs more than the rest of a query.
+    """
+    return (
+        Book(verse_id // BOOK_ID_DIVISOR),
+        verse_id // CHAPTER_DIVISOR % CHAPTER_DIVISOR,
+    )
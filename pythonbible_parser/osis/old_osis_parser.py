@@ -16,6 +16,8 @@ from pythonbible import get_verse_id
 
 from pythonbible_parser.bible_parser import BibleParser
 from pythonbible_parser.bible_parser import sort_paragraphs
+from pythonbible_parser.bounded_cache import DEFAULT_MAX_ENTRIES
+from pythonbible_parser.bounded_cache import BoundedCache
 from pythonbible_parser.osis.constants import BOOK_IDS
 from pythonbible_parser.osis.osis_utilities import OSISID
 from pythonbible_parser.osis.osis_utilities import get_element_tail
@@ -31,6 +33,7 @@ XPATH_BOOK: str = ".//xmlns:div[@osisID='{}']"
 XPATH_BOOK_TITLE: str = f"{XPATH_BOOK}/xmlns:title"
 XPATH_VERSE: str = ".//xmlns:verse[@osisID='{}.{}.{}']"
 XPATH_VERSE_PARENT: str = f"{XPATH_VERSE}/.."
+VERSE_TAG: str = "{{{}}}verse"
 
 
 class OldOSISParser(BibleParser):
@@ -40,13 +43,25 @@ class OldOSISParser(BibleParser):
     to parse XML files that are in the OSIS format.
     """
 
-    def __init__(self: OldOSISParser, version: Version) -> None:
+    def __init__(
+        self: OldOSISParser,
+        version: Version,
+        cache_entries: int | None = DEFAULT_MAX_ENTRIES,
+        cache_bytes: int | None = None,
+    ) -> None:
         """Initialize the OSIS parser.
 
         Set the version, the element tree from the appropriate version XML file,
         and the namespaces.
 
+        The book titles, verse texts and scripture passages are cached in a
+        BoundedCache that belongs to the parser, so they are freed with it.
+
         :param version:
+        :param cache_entries: the maximum number of cached results (None for no
+        limit)
+        :param cache_bytes: the maximum total size in bytes of the cached results
+        (None for no limit)
         """
         super().__init__(version)
 
@@ -56,26 +71,34 @@ class OldOSISParser(BibleParser):
         self.namespaces: dict[str, str] = {
             "xmlns": get_namespace(self.tree.getroot().tag),
         }
+        self._verse_locations: dict[int, tuple[Any, int]] | None = None
+        self.cache: BoundedCache = BoundedCache(cache_entries, cache_bytes)
 
-    @lru_cache()
     def get_book_title(self: OldOSISParser, book: Book) -> str:
         """Given a book, return the full title for that book from the XML file.
 
         :param book:
         :return: the full title string
         """
-        book_title_element = self._get_book_title_element(book)
-        return book_title_element.text or ""
+        return self.cache.get(
+            ("get_book_title", book),
+            lambda: self._get_book_title_element(book).text or "",
+        )
 
-    @lru_cache()
     def get_short_book_title(self: OldOSISParser, book: Book) -> str:
         """Given a book, return the short title for that book from the XML file.
 
         :param book:
         :return: the short title string
         """
-        book_title_element = self._get_book_title_element(book)
-        return book_title_element.get("short") or ""
+        return self.cache.get(
+            ("get_short_book_title", book),
+            lambda: self._get_book_title_element(book).get("short") or "",
+        )
+
+    def clear(self: OldOSISParser) -> None:
+        """Clear the cached results and their statistics."""
+        self.cache.clear()
 
     def get_scripture_passage_text(
         self: OldOSISParser,
@@ -105,9 +128,12 @@ class OldOSISParser(BibleParser):
         # keyword arguments
         include_verse_number: bool = kwargs.get("include_verse_number", True)
 
-        return self._get_scripture_passage_text_memoized(
-            verse_ids_tuple,
-            include_verse_number,
+        return self.cache.get(
+            ("get_scripture_passage_text", verse_ids_tuple, include_verse_number),
+            lambda: self._get_scripture_passage_text(
+                verse_ids_tuple,
+                include_verse_number,
+            ),
         )
 
     def verse_text(
@@ -133,38 +159,52 @@ class OldOSISParser(BibleParser):
         # keyword arguments
         include_verse_number: bool = kwargs.get("include_verse_number", True)
 
-        return self._get_verse_text_memoized(verse_id, include_verse_number)
+        return self.cache.get(
+            ("verse_text", verse_id, include_verse_number),
+            lambda: self._get_verse_text(verse_id, include_verse_number),
+        )
 
-    @lru_cache()
     def _get_book_title_element(self: OldOSISParser, book: Book) -> Any:
         xpath: str = XPATH_BOOK_TITLE.format(BOOK_IDS.get(book))
         return self.tree.find(xpath, namespaces=self.namespaces)
 
-    @lru_cache()
-    def _get_scripture_passage_text_memoized(
+    def get_verse_locations(self: OldOSISParser) -> dict[int, tuple[Any, int]]:
+        """Return the parent element of each verse and its position in the parent.
+
+        The index is built on the first call with a single pass over the tree, and
+        replaces a search of the whole tree (XPATH_VERSE_PARENT) per paragraph. As
+        with the XPath search, only the first verse element with a given osisID
+        is indexed.
+
+        :return: a dictionary of verse ids to the parent element of the verse
+        element and its position among the children of the parent
+        """
+        if self._verse_locations is None:
+            self._verse_locations = _get_verse_locations(self.tree, self.namespaces)
+
+        return self._verse_locations
+
+    def _get_scripture_passage_text(
         self: OldOSISParser,
         verse_ids: tuple[int],
         include_verse_number: bool,
     ) -> dict[Book, dict[int, list[str]]]:
         paragraphs: dict[Book, dict[int, list[str]]] = _get_paragraphs(
-            self.tree,
-            self.namespaces,
+            self.get_verse_locations(),
             verse_ids,
             include_verse_number,
         )
 
         return sort_paragraphs(paragraphs)
 
-    @lru_cache()
-    def _get_verse_text_memoized(
+    def _get_verse_text(
         self: OldOSISParser,
         verse_id: int,
         include_verse_number: bool,
     ) -> str:
         verse_ids = (verse_id,)
         paragraphs: dict[Book, dict[int, list[str]]] = _get_paragraphs(
-            self.tree,
-            self.namespaces,
+            self.get_verse_locations(),
             verse_ids,
             include_verse_number,
         )
@@ -179,61 +219,139 @@ class OldOSISParser(BibleParser):
         return verse_text
 
 
-def _get_paragraphs(
+def _get_verse_locations(
     tree: ElementTree,
     namespaces: dict[str, str],
+) -> dict[int, tuple[Any, int]]:
+    verse_tag: str = VERSE_TAG.format(namespaces["xmlns"])
+    books: dict[str, Book] = {book_id: book for book, book_id in BOOK_IDS.items()}
+    verse_locations: dict[int, tuple[Any, int]] = {}
+
+    for parent_element in tree.iter():
+        for position, child_element in enumerate(parent_element):
+            if child_element.tag != verse_tag:
+                continue
+
+            verse_id: int | None = _get_verse_id(child_element.get("osisID"), books)
+
+            if verse_id is not None and verse_id not in verse_locations:
+                verse_locations[verse_id] = (parent_element, position)
+
+    return verse_locations
+
+
+def _get_verse_id(osis_id: str | None, books: dict[str, Book]) -> int | None:
+    """Return the verse id of an osisID that XPATH_VERSE would match, if any."""
+    parts: list[str] = (osis_id or "").split(".")
+
+    if len(parts) != 3 or parts[0] not in books:  # noqa: PLR2004
+        return None
+
+    book_id, chapter, verse = parts
+
+    if not (chapter.isdigit() and verse.isdigit()):
+        return None
+
+    # XPATH_VERSE formats the chapter and verse numbers without leading zeros.
+    if osis_id != f"{book_id}.{int(chapter)}.{int(verse)}":
+        return None
+
+    try:
+        return get_verse_id(books[book_id], int(chapter), int(verse))
+    except InvalidVerseError:
+        return None
+
+
+def _get_paragraphs(
+    verse_locations: dict[int, tuple[Any, int]],
     verse_ids: tuple[int, ...],
     include_verse_number: bool,
 ) -> dict[Book, dict[int, list[str]]]:
-    current_verse_id: int = verse_ids[0]
-    book: Book
-    chapter: int
-    verse: int
-    book, chapter, verse = get_book_chapter_verse(current_verse_id)
-    paragraph_element = tree.find(
-        XPATH_VERSE_PARENT.format(BOOK_IDS.get(book), chapter, verse),
-        namespaces,
-    )
-    paragraph: str
-    paragraph, current_verse_id = _get_paragraph_from_element(
-        paragraph_element,
-        verse_ids,
-        current_verse_id,
-        include_verse_number,
-    )
-    current_verse_index: int = verse_ids.index(current_verse_id) + 1
-    paragraph_dictionary: dict[Book, dict[int, list[str]]] = {}
+    """Assemble the paragraphs of the given sorted verse ids, in order.
+
+    A cursor walks the verse ids once: the paragraph of the verse at the cursor
+    is read, and the cursor moves past the last verse included in it. The verse
+    ids are given to the paragraph functions as a frozenset, for constant time
+    membership tests, so the cost of a request is linear in the number of verses.
+
+    :param verse_locations: the index of the parent element of each verse
+    :param verse_ids: the sorted verse ids
+    :param include_verse_number: True to include the verse numbers
+    :return: a dictionary of books to dictionaries of chapter numbers to lists
+    of paragraph strings
+    """
+    requested_verse_ids: frozenset[int] = frozenset(verse_ids)
+    first_positions: dict[int, int] = {}
 
-    if current_verse_index < len(verse_ids):
-        paragraph_dictionary = _get_paragraphs(
-            tree,
-            namespaces,
-            verse_ids[current_verse_index:],
+    for position, verse_id in enumerate(verse_ids):
+        first_positions.setdefault(verse_id, position)
+
+    paragraph_dictionary: dict[Book, dict[int, list[str]]] = {}
+    cursor: int = 0
+
+    while cursor < len(verse_ids):
+        current_verse_id: int = verse_ids[cursor]
+        book: Book
+        chapter: int
+        book, chapter, _ = get_book_chapter_verse(current_verse_id)
+        paragraph_element: Any
+        position: int
+        paragraph_element, position = verse_locations.get(current_verse_id, (None, 0))
+        paragraph: str
+        paragraph, current_verse_id = _get_paragraph_from_element(
+            paragraph_element,
+            requested_verse_ids,
+            current_verse_id,
             include_verse_number,
+            _get_first_child_position(paragraph_element, position),
         )
 
-    book_dictionary: dict[int, list[str]] = paragraph_dictionary.get(book, {})
-    chapter_list: list[str] = book_dictionary.get(int(chapter), [])
-    chapter_list.insert(0, paragraph)
-    book_dictionary[int(chapter)] = chapter_list
-    paragraph_dictionary[book] = book_dictionary
+        # A repeated verse id is read again, as its own paragraph.
+        cursor = max(first_positions[current_verse_id], cursor) + 1
+
+        paragraph_dictionary.setdefault(book, {}).setdefault(int(chapter), []).append(
+            paragraph,
+        )
 
     return paragraph_dictionary
 
 
-@lru_cache()
+def _get_first_child_position(paragraph_element: Any, position: int) -> int:
+    """Return the position of the first child of the paragraph to read.
+
+    Everything after the start of a verse that is not requested is skipped until
+    the first requested verse (see _handle_verse_tag), so reading can start at
+    the first requested verse if the start of another verse precedes it. The
+    children before it are read otherwise, as they may be part of its text.
+    """
+    if paragraph_element is None:
+        return 0
+
+    verse_tag: str = paragraph_element[position].tag
+
+    for child_element in paragraph_element[:position]:
+        if (
+            child_element.tag == verse_tag
+            and (child_element.get("osisID") or "..") != ".."
+        ):
+            return position
+
+    return 0
+
+
 def _get_paragraph_from_element(
     paragraph_element: Any,
-    verse_ids: tuple[int, ...],
+    verse_ids: frozenset[int],
     current_verse_id: int,
     include_verse_number: bool,
+    first_child_position: int = 0,
 ) -> tuple[str, int]:
     new_current_verse_id: int = current_verse_id
     paragraph: str = ""
     skip_till_next_verse: bool = False
     child_paragraph: str
 
-    for child_element in list(paragraph_element):
+    for child_element in list(paragraph_element)[first_child_position:]:
         (
             child_paragraph,
             skip_till_next_verse,
@@ -257,10 +375,9 @@ def _get_paragraph_from_element(
     return clean_paragraph(paragraph), new_current_verse_id
 
 
-@lru_cache()
 def _handle_child_element(
     child_element: Any,
-    verse_ids: tuple[int, ...],
+    verse_ids: frozenset[int],
     skip_till_next_verse: bool,
     current_verse_id: int,
     include_verse_number: bool,
@@ -327,10 +444,9 @@ def _handle_child_element(
     return clean_paragraph(paragraph), skip_till_next_verse, new_current_verse_id
 
 
-@lru_cache()
 def _handle_verse_tag(
     child_element: Any,
-    verse_ids: tuple[int, ...],
+    verse_ids: frozenset[int],
     skip_till_next_verse: bool,
     current_verse_id: int,
     include_verse_number: bool,
@@ -2,25 +2,34 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
 from typing import Any
 
 from pythonbible import get_verse_id
 
+from pythonbible_parser import events
 from pythonbible_parser.osis.osis_utilities import get_element_tail
 from pythonbible_parser.osis.osis_utilities import get_element_text
 from pythonbible_parser.osis.osis_utilities import get_element_text_and_tail
 from pythonbible_parser.osis.osis_utilities import parse_osis_id
 from pythonbible_parser.osis.osis_utilities import strip_namespace_from_tag
+from pythonbible_parser.renderers import get_renderer
+from pythonbible_parser.renderers import get_renderings
 
-HTML_P_OPEN = "<p>"
-HTML_P_CLOSE = "</p>"
-HTML_NEWLINE = "<br/>"
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-PLAIN_NEWLINE = "\n"
+    from pythonbible_parser.events import Event
+    from pythonbible_parser.renderers import Renderer
 
 
 class OSISBookParser:
-    """OSISBookParser parses an OSIS XML file for a specific book of the Bible."""
+    """OSISBookParser parses an OSIS XML file for a specific book of the Bible.
+
+    The book element is walked once into a list of events (see
+    pythonbible_parser.events), which is then rendered by each of the selected
+    renderers.
+    """
 
     def __init__(
         self: OSISBookParser,
@@ -31,8 +40,14 @@ class OSISBookParser:
         plain_text_offset: int,
         plain_text_readers_offset: int,
         plain_text_notes_offset: int,
+        *,
+        renderings: Iterable[str] | None = None,
     ) -> None:
-        """Initialize the OSISBookParser."""
+        """Initialize the OSISBookParser.
+
+        Only the given renderings are built (by default, all of them). The text
+        and verse indices of the other renderings are left empty.
+        """
         self.root: Any = root
         self.html_offset: int = html_offset
         self.html_readers_offset: int = html_readers_offset
@@ -41,8 +56,21 @@ class OSISBookParser:
         self.plain_text_readers_offset: int = plain_text_readers_offset
         self.plain_text_notes_offset: int = plain_text_notes_offset
 
-        self.title: str = self.root.text or ""
-        self.short_title: str = self.root.get("short") or ""
+        offsets: dict[str, int] = {
+            "html": html_offset,
+            "html_readers": html_readers_offset,
+            "html_notes": html_notes_offset,
+            "plain_text": plain_text_offset,
+            "plain_text_readers": plain_text_readers_offset,
+            "plain_text_notes": plain_text_notes_offset,
+        }
+        self.renderers: dict[str, Renderer] = {
+            rendering: get_renderer(rendering, offsets[rendering])
+            for rendering in get_renderings(renderings)
+        }
+
+        self.title: str = ""
+        self.short_title: str = ""
 
         self.html: str = ""
         self.html_readers: str = ""
@@ -51,28 +79,96 @@ class OSISBookParser:
         self.plain_text_readers: str = ""
         self.plain_text_notes: str = ""
 
-        self.html_verse_start_indices: dict[int, int] = {}
-        self.html_readers_verse_start_indices: dict[int, int] = {}
-        self.html_notes_verse_start_indices: dict[int, int] = {}
-        self.plain_text_verse_start_indices: dict[int, int] = {}
-        self.plain_text_readers_verse_start_indices: dict[int, int] = {}
-        self.plain_text_notes_verse_start_indices: dict[int, int] = {}
+        self.html_verse_start_indices: dict[int, int] = self._get_start_indices("html")
+        self.html_readers_verse_start_indices: dict[int, int] = self._get_start_indices(
+            "html_readers",
+        )
+        self.html_notes_verse_start_indices: dict[int, int] = self._get_start_indices(
+            "html_notes",
+        )
+        self.plain_text_verse_start_indices: dict[int, int] = self._get_start_indices(
+            "plain_text",
+        )
+        self.plain_text_readers_verse_start_indices: dict[int, int] = (
+            self._get_start_indices("plain_text_readers")
+        )
+        self.plain_text_notes_verse_start_indices: dict[int, int] = (
+            self._get_start_indices("plain_text_notes")
+        )
 
-        self.html_verse_end_indices: dict[int, int] = {}
-        self.html_readers_verse_end_indices: dict[int, int] = {}
-        self.html_notes_verse_end_indices: dict[int, int] = {}
-        self.plain_text_verse_end_indices: dict[int, int] = {}
-        self.plain_text_readers_verse_end_indices: dict[int, int] = {}
-        self.plain_text_notes_verse_end_indices: dict[int, int] = {}
+        self.html_verse_end_indices: dict[int, int] = self._get_end_indices("html")
+        self.html_readers_verse_end_indices: dict[int, int] = self._get_end_indices(
+            "html_readers",
+        )
+        self.html_notes_verse_end_indices: dict[int, int] = self._get_end_indices(
+            "html_notes",
+        )
+        self.plain_text_verse_end_indices: dict[int, int] = self._get_end_indices(
+            "plain_text",
+        )
+        self.plain_text_readers_verse_end_indices: dict[int, int] = (
+            self._get_end_indices("plain_text_readers")
+        )
+        self.plain_text_notes_verse_end_indices: dict[int, int] = self._get_end_indices(
+            "plain_text_notes",
+        )
 
         self.current_verse: int = 0
+        self.events: list[Event] = []
 
         self.unknown_tags: set[str] = set()
 
+    def __getstate__(self: OSISBookParser) -> dict[str, Any]:
+        """Return the state to pickle, without the XML element.
+
+        The element is only needed while parsing, so parsed books can be sent to
+        other processes or cached on disk without it.
+        """
+        state: dict[str, Any] = self.__dict__.copy()
+        state["root"] = None
+        state["events"] = []
+        return state
+
     def parse(self: OSISBookParser) -> None:
+        self.render(self.walk())
+
+    def walk(self: OSISBookParser) -> list[Event]:
+        """Walk the book element and return its events.
+
+        :return: the list of events of the book
+        """
+        self.events = []
+        self.current_verse = 0
+        self._set_title(self.root.text or "", self.root.get("short") or "")
         self._process_element(self.root)
         self._set_verse_end_indices()
 
+        book_events: list[Event] = self.events
+        self.events = []
+        return book_events
+
+    def render(self: OSISBookParser, book_events: list[Event]) -> None:
+        """Render the given events with each of the selected renderers.
+
+        :param book_events: the events of the book, as returned by walk()
+        """
+        for kind, value, argument in book_events:
+            if kind == events.TITLE:
+                self.title = value
+                self.short_title = argument
+
+        for rendering, renderer in self.renderers.items():
+            renderer.render(book_events)
+            setattr(self, rendering, renderer.get_text())
+
+    def _get_start_indices(self: OSISBookParser, rendering: str) -> dict[int, int]:
+        renderer: Renderer | None = self.renderers.get(rendering)
+        return {} if renderer is None else renderer.verse_start_indices
+
+    def _get_end_indices(self: OSISBookParser, rendering: str) -> dict[int, int]:
+        renderer: Renderer | None = self.renderers.get(rendering)
+        return {} if renderer is None else renderer.verse_end_indices
+
     def _process_element(
         self: OSISBookParser,
         element: Any,
@@ -100,18 +196,9 @@ class OSISBookParser:
         if tag != "p":
             return
 
-        self.html += HTML_P_OPEN
-        self.html_readers += HTML_P_OPEN
-        self.html_notes += HTML_P_OPEN
-        self.plain_text += PLAIN_NEWLINE
-        self.plain_text_readers += PLAIN_NEWLINE
-        self.plain_text_notes += PLAIN_NEWLINE
-
+        self.events.append((events.PARAGRAPH_OPEN, None, None))
         self._process_children(element)
-
-        self.html += HTML_P_CLOSE
-        self.html_readers += HTML_P_CLOSE
-        self.html_notes += HTML_P_CLOSE
+        self.events.append((events.PARAGRAPH_CLOSE, None, None))
 
     def _handle_chapter(self: OSISBookParser, tag: str) -> None:
         if tag != "chapter":
@@ -127,8 +214,7 @@ class OSISBookParser:
         if self.title and self.short_title:
             return
 
-        self.title = element.text or ""
-        self.short_title = element.get("short") or ""
+        self._set_title(element.text or "", element.get("short") or "")
 
     def _handle_verse(
         self: OSISBookParser,
@@ -139,10 +225,10 @@ class OSISBookParser:
         if tag != "verse":
             return
 
-        self._append_text(get_element_text(element), in_notes)
         osis_id_str = element.get("osisID")
 
         if osis_id_str is None:
+            self._append_text(get_element_text(element), in_notes)
             return
 
         osis_id = parse_osis_id(element.get("osisID"))
@@ -151,35 +237,11 @@ class OSISBookParser:
 
         self.current_verse = get_verse_id(osis_id.book, osis_id.chapter, osis_id.verse)
 
-        self._set_verse_start_indices()
-
-        if (
-            self.html
-            and not self.html.endswith(HTML_P_CLOSE)
-            and not self.html.endswith(HTML_P_OPEN)
-        ):
-            self.html += " "
-
-        self.html += f"<sup>{osis_id.verse}</sup>"
-
-        if (
-            self.html_notes
-            and not self.html_notes.endswith(HTML_P_CLOSE)
-            and not self.html_notes.endswith(HTML_P_OPEN)
-        ):
-            self.html_notes += " "
-
-        self.html_notes += f"<sup>{osis_id.verse}</sup>"
-
-        if self.plain_text and not self.plain_text.endswith(PLAIN_NEWLINE):
-            self.plain_text += " "
+        self.events.append((events.VERSE_START, self.current_verse, osis_id.verse))
 
-        self.plain_text += f"{osis_id.verse}."
-
-        if self.plain_text_notes and not self.plain_text_notes.endswith(PLAIN_NEWLINE):
-            self.plain_text_notes += " "
-
-        self.plain_text_notes += f"{osis_id.verse}."
+        # The text of a container verse (<verse osisID="...">text</verse>) is the
+        # start of the verse, as is the tail of a milestone verse.
+        self._append_text(get_element_text(element), in_notes)
         self._append_text(get_element_tail(element), in_notes)
 
     def _handle_q(self: OSISBookParser, element: Any, tag: str, in_notes: bool) -> None:
@@ -237,88 +299,14 @@ class OSISBookParser:
         if not text:
             return
 
-        if text[0].isalpha():
-            if not in_notes:
-                if (
-                    self.html
-                    and not self.html.endswith(HTML_NEWLINE)
-                    and not self.html.endswith(HTML_P_CLOSE)
-                ):
-                    self.html += " "
-
-                if (
-                    self.html_readers
-                    and not self.html_readers.endswith(HTML_NEWLINE)
-                    and not self.html_readers.endswith(HTML_P_CLOSE)
-                ):
-                    self.html_readers += " "
-
-                if self.plain_text and not self.plain_text.endswith(PLAIN_NEWLINE):
-                    self.plain_text += " "
-
-                if self.plain_text_readers and not self.plain_text_readers.endswith(
-                    PLAIN_NEWLINE,
-                ):
-                    self.plain_text_readers += " "
-
-            if (
-                self.html_notes
-                and not self.html_notes.endswith(HTML_NEWLINE)
-                and not self.html_notes.endswith(HTML_P_CLOSE)
-            ):
-                self.html_notes += " "
-
-            if self.plain_text_notes and not self.plain_text_notes.endswith(
-                PLAIN_NEWLINE,
-            ):
-                self.plain_text_notes += " "
-
-        if not in_notes:
-            self.html += text
-            self.html_readers += text
-            self.plain_text += text
-            self.plain_text_readers += text
-
-        self.html_notes += text
-        self.plain_text_notes += text
+        kind: int = events.NOTE_TEXT if in_notes else events.TEXT
+        self.events.append((kind, text, text[0].isalpha()))
+
+    def _set_title(self: OSISBookParser, title: str, short_title: str) -> None:
+        self.title = title
+        self.short_title = short_title
+        self.events.append((events.TITLE, title, short_title))
 
     def _set_verse_end_indices(self: OSISBookParser) -> None:
         if self.current_verse > 0:
-            self.html_verse_end_indices[self.current_verse] = (
-                len(self.html) + self.html_offset
-            )
-            self.html_readers_verse_end_indices[self.current_verse] = (
-                len(self.html_readers) + self.html_readers_offset
-            )
-            self.html_notes_verse_end_indices[self.current_verse] = (
-                len(self.html_notes) + self.html_notes_offset
-            )
-            self.plain_text_verse_end_indices[self.current_verse] = (
-                len(self.plain_text) + self.plain_text_offset
-            )
-            self.plain_text_readers_verse_end_indices[self.current_verse] = (
-                len(self.plain_text_readers) + self.plain_text_readers_offset
-            )
-            self.plain_text_notes_verse_end_indices[self.current_verse] = (
-                len(self.plain_text_notes) + self.plain_text_notes_offset
-            )
-
-    def _set_verse_start_indices(self: OSISBookParser) -> None:
-        self.html_verse_start_indices[self.current_verse] = (
-            len(self.html) + self.html_offset
-        )
-        self.html_readers_verse_start_indices[self.current_verse] = (
-            len(self.html_readers) + self.html_readers_offset
-        )
-        self.html_notes_verse_start_indices[self.current_verse] = (
-            len(self.html_notes) + self.html_notes_offset
-        )
-        self.plain_text_verse_start_indices[self.current_verse] = (
-            len(self.plain_text) + self.plain_text_offset
-        )
-        self.plain_text_readers_verse_start_indices[self.current_verse] = (
-            len(self.plain_text_readers) + self.plain_text_readers_offset
-        )
-        self.plain_text_notes_verse_start_indices[self.current_verse] = (
-            len(self.plain_text_notes) + self.plain_text_notes_offset
-        )
+            self.events.append((events.VERSE_END, self.current_verse, None))
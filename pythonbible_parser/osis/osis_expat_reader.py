@@ -0,0 +1,428 @@
+"""Contains the OSISExpatReader class."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from xml.parsers import expat
+
+from defusedxml import EntitiesForbidden
+from defusedxml import ExternalReferenceForbidden
+from pythonbible import get_verse_id
+
+from pythonbible_parser import events
+from pythonbible_parser.osis.constants import BOOK_IDS
+from pythonbible_parser.osis.constants import get_book_by_id
+from pythonbible_parser.osis.osis_utilities import parse_osis_id
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    import pythonbible as bible
+
+    from pythonbible_parser.events import Event
+
+CHUNK_SIZE: int = 1 << 16
+NAMESPACE_SEPARATOR: str = " "
+
+CONTAINER_TAGS: frozenset[str] = frozenset(
+    ("div", "lg", "l", "list", "item", "divineName", "note"),
+)
+TEXT_AND_TAIL_TAGS: frozenset[str] = frozenset(("w", "transChange", "lb"))
+
+
+class _Frame:
+    """An open element of a book."""
+
+    __slots__ = ("in_notes", "process_children", "tag", "value")
+
+    def __init__(
+        self: _Frame,
+        tag: str,
+        in_notes: bool = False,
+        process_children: bool = False,
+        value: Any = None,
+    ) -> None:
+        self.tag: str = tag
+        self.in_notes: bool = in_notes
+        self.process_children: bool = process_children
+        self.value: Any = value
+
+
+IGNORED_FRAME: _Frame = _Frame("")
+
+
+class OSISExpatReader:
+    """Read the events of each book of an OSIS XML file with an expat parser.
+
+    The expat callbacks emit the same events as OSISBookParser.walk() would for
+    the same book, without building an element tree first. The file is read in
+    chunks, and the events of each book are yielded as soon as the book ends.
+
+    As with defusedxml, entity declarations and external references are not
+    allowed and raise EntitiesForbidden or ExternalReferenceForbidden.
+    """
+
+    def __init__(self: OSISExpatReader, input_path: Path) -> None:
+        """Initialize the reader.
+
+        :param input_path: the path of the OSIS XML file
+        """
+        self.input_path: Path = input_path
+        self.namespace: str = ""
+
+        self._book_ids: set[str] = set(BOOK_IDS.values())
+        self._div_name: str | None = None
+        self._books_seen: set[bible.Book] = set()
+        self._completed_books: list[tuple[bible.Book, list[Event]]] = []
+
+        self._book: bible.Book | None = None
+        self._events: list[Event] = []
+        self._frames: list[_Frame] = []
+        self._characters: list[str] = []
+        self._pending: Callable[[str], None] | None = None
+        self._title: str = ""
+        self._short_title: str = ""
+        self._current_verse: int = 0
+
+        self._start_handlers: dict[
+            str,
+            Callable[[str, dict[str, str], bool], _Frame],
+        ] = {
+            "p": self._start_paragraph,
+            "chapter": self._start_chapter,
+            "title": self._start_title,
+            "verse": self._start_verse,
+            "q": self._start_text,
+            "seg": self._start_container,
+            "rdg": self._start_text,
+            "w": self._start_text_and_tail,
+            "transChange": self._start_text_and_tail,
+            "lb": self._start_text_and_tail,
+        }
+        self._start_handlers.update(
+            (tag, self._start_container) for tag in CONTAINER_TAGS
+        )
+
+    def iter_book_events(
+        self: OSISExpatReader,
+    ) -> Iterator[tuple[bible.Book, list[Event]]]:
+        """Read the XML file and yield the events of each book.
+
+        If a book occurs more than once, only the first occurrence is yielded.
+
+        :return: an iterator of books and their events, in document order
+        """
+        parser = self._create_parser()
+
+        with self.input_path.open(mode="rb") as reader:
+            while chunk := reader.read(CHUNK_SIZE):
+                parser.Parse(chunk, False)
+                yield from self._pop_completed_books()
+
+        parser.Parse(b"", True)
+        yield from self._pop_completed_books()
+
+    def _create_parser(self: OSISExpatReader) -> Any:
+        parser = expat.ParserCreate(namespace_separator=NAMESPACE_SEPARATOR)
+        parser.buffer_text = True
+        parser.StartElementHandler = self._start_element
+        parser.EndElementHandler = self._end_element
+        parser.CharacterDataHandler = self._character_data
+        parser.EntityDeclHandler = _forbid_entity_declaration
+        parser.UnparsedEntityDeclHandler = _forbid_unparsed_entity_declaration
+        parser.ExternalEntityRefHandler = _forbid_external_reference
+        return parser
+
+    def _pop_completed_books(
+        self: OSISExpatReader,
+    ) -> list[tuple[bible.Book, list[Event]]]:
+        completed_books = self._completed_books
+        self._completed_books = []
+        return completed_books
+
+    def _start_element(
+        self: OSISExpatReader,
+        name: str,
+        attributes: dict[str, str],
+    ) -> None:
+        if self._div_name is None:
+            self.namespace, _, _ = name.rpartition(NAMESPACE_SEPARATOR)
+            self._div_name = f"{self.namespace}{NAMESPACE_SEPARATOR}div"
+
+        if self._book is None:
+            self._start_book(name, attributes)
+            return
+
+        self._flush_characters()
+        parent: _Frame = self._frames[-1]
+
+        if not parent.process_children:
+            self._frames.append(IGNORED_FRAME)
+            return
+
+        tag: str = name.rpartition(NAMESPACE_SEPARATOR)[2]
+        start_handler = self._start_handlers.get(tag)
+
+        if start_handler is None or (tag == "rdg" and not parent.in_notes):
+            self._frames.append(IGNORED_FRAME)
+            return
+
+        self._frames.append(start_handler(tag, attributes, parent.in_notes))
+
+    def _start_paragraph(
+        self: OSISExpatReader,
+        tag: str,
+        _attributes: dict[str, str],
+        _in_notes: bool,
+    ) -> _Frame:
+        self._events.append((events.PARAGRAPH_OPEN, None, None))
+        return _Frame(tag, process_children=True)
+
+    def _start_chapter(
+        self: OSISExpatReader,
+        tag: str,
+        _attributes: dict[str, str],
+        _in_notes: bool,
+    ) -> _Frame:
+        self._end_verse()
+        self._current_verse = 0
+        return _Frame(tag)
+
+    def _start_title(
+        self: OSISExpatReader,
+        tag: str,
+        attributes: dict[str, str],
+        _in_notes: bool,
+    ) -> _Frame:
+        self._pending = self._get_title_handler(attributes.get("short") or "")
+        return _Frame(tag)
+
+    def _start_verse(
+        self: OSISExpatReader,
+        tag: str,
+        attributes: dict[str, str],
+        in_notes: bool,
+    ) -> _Frame:
+        frame = _Frame(tag, in_notes, value=attributes.get("osisID"))
+        self._pending = self._get_verse_handler(frame)
+        return frame
+
+    def _start_text(
+        self: OSISExpatReader,
+        tag: str,
+        _attributes: dict[str, str],
+        in_notes: bool,
+    ) -> _Frame:
+        """Start a q element, which has children, or an rdg element, which does not."""
+        self._pending = self._get_text_handler(in_notes)
+        return _Frame(tag, in_notes, process_children=tag == "q")
+
+    def _start_container(
+        self: OSISExpatReader,
+        tag: str,
+        _attributes: dict[str, str],
+        in_notes: bool,
+    ) -> _Frame:
+        return _Frame(tag, in_notes or tag == "note", process_children=True)
+
+    def _start_text_and_tail(
+        self: OSISExpatReader,
+        tag: str,
+        _attributes: dict[str, str],
+        in_notes: bool,
+    ) -> _Frame:
+        frame = _Frame(tag, in_notes)
+        self._pending = self._get_store_handler(frame)
+        return frame
+
+    def _end_element(self: OSISExpatReader, _name: str) -> None:
+        if self._book is None:
+            return
+
+        self._flush_characters()
+        frame: _Frame = self._frames.pop()
+
+        if not self._frames:
+            self._end_book(frame is not IGNORED_FRAME)
+            return
+
+        tag: str = frame.tag
+
+        if tag == "p":
+            self._events.append((events.PARAGRAPH_CLOSE, None, None))
+        elif tag == "verse":
+            if frame.value is not None:
+                self._pending = self._get_text_handler(frame.in_notes)
+        elif tag in {"q", "seg"}:
+            self._pending = self._get_text_handler(frame.in_notes)
+        elif tag in TEXT_AND_TAIL_TAGS:
+            self._pending = self._get_text_and_tail_handler(frame)
+
+    def _character_data(self: OSISExpatReader, data: str) -> None:
+        if self._pending is not None:
+            self._characters.append(data)
+
+    def _flush_characters(self: OSISExpatReader) -> None:
+        """Pass the text or tail read so far to the pending handler, if any."""
+        if self._pending is None:
+            return
+
+        pending = self._pending
+        self._pending = None
+        text: str = "".join(self._characters)
+        self._characters.clear()
+        pending(text)
+
+    def _start_book(
+        self: OSISExpatReader,
+        name: str,
+        attributes: dict[str, str],
+    ) -> None:
+        if name != self._div_name or attributes.get("osisID") not in self._book_ids:
+            return
+
+        book: bible.Book = get_book_by_id(attributes["osisID"])
+
+        if book in self._books_seen:
+            self._frames.append(IGNORED_FRAME)
+        else:
+            self._books_seen.add(book)
+            self._frames.append(_Frame("div", process_children=True))
+            self._pending = self._get_book_title_handler(attributes.get("short") or "")
+
+        self._book = book
+        self._events = []
+        self._current_verse = 0
+
+    def _end_book(self: OSISExpatReader, is_first_occurrence: bool) -> None:
+        if is_first_occurrence:
+            self._end_verse()
+            self._completed_books.append((self._book, self._events))
+
+        self._book = None
+        self._events = []
+
+    def _get_book_title_handler(
+        self: OSISExpatReader,
+        short_title: str,
+    ) -> Callable[[str], None]:
+        def handle_book_title(text: str) -> None:
+            self._set_title(text, short_title)
+
+        return handle_book_title
+
+    def _get_title_handler(
+        self: OSISExpatReader,
+        short_title: str,
+    ) -> Callable[[str], None]:
+        def handle_title(text: str) -> None:
+            if not (self._title and self._short_title):
+                self._set_title(text, short_title)
+
+        return handle_title
+
+    def _get_verse_handler(
+        self: OSISExpatReader,
+        frame: _Frame,
+    ) -> Callable[[str], None]:
+        def handle_verse(text: str) -> None:
+            if frame.value is None:
+                self._append_text(text.replace("\n", " "), frame.in_notes)
+                return
+
+            osis_id = parse_osis_id(frame.value)
+
+            self._end_verse()
+            self._current_verse = get_verse_id(
+                osis_id.book,
+                osis_id.chapter,
+                osis_id.verse,
+            )
+            self._events.append(
+                (events.VERSE_START, self._current_verse, osis_id.verse),
+            )
+            # The text of a container verse is the start of the verse.
+            self._append_text(text.replace("\n", " "), frame.in_notes)
+
+        return handle_verse
+
+    def _get_text_handler(
+        self: OSISExpatReader,
+        in_notes: bool,
+    ) -> Callable[[str], None]:
+        def handle_text(text: str) -> None:
+            self._append_text(text.replace("\n", " "), in_notes)
+
+        return handle_text
+
+    def _get_store_handler(
+        self: OSISExpatReader,
+        frame: _Frame,
+    ) -> Callable[[str], None]:
+        def handle_store(text: str) -> None:
+            frame.value = text.replace("\n", " ")
+
+        return handle_store
+
+    def _get_text_and_tail_handler(
+        self: OSISExpatReader,
+        frame: _Frame,
+    ) -> Callable[[str], None]:
+        def handle_text_and_tail(tail: str) -> None:
+            text: str = (frame.value or "") + tail.replace("\n", " ")
+            self._append_text(text, frame.in_notes)
+
+        return handle_text_and_tail
+
+    def _append_text(self: OSISExpatReader, text: str, in_notes: bool) -> None:
+        text = text.strip().replace("¶", "")
+
+        if not text:
+            return
+
+        kind: int = events.NOTE_TEXT if in_notes else events.TEXT
+        self._events.append((kind, text, text[0].isalpha()))
+
+    def _set_title(self: OSISExpatReader, title: str, short_title: str) -> None:
+        self._title = title
+        self._short_title = short_title
+        self._events.append((events.TITLE, title, short_title))
+
+    def _end_verse(self: OSISExpatReader) -> None:
+        if self._current_verse > 0:
+            self._events.append((events.VERSE_END, self._current_verse, None))
+
+
+# expat calls the handler with seven positional arguments.
+def _forbid_entity_declaration(  # noqa: PLR0913, PLR0917
+    name: str,
+    _is_parameter_entity: bool,
+    value: str | None,
+    base: str | None,
+    sysid: str | None,
+    pubid: str | None,
+    notation_name: str | None,
+) -> None:
+    raise EntitiesForbidden(name, value, base, sysid, pubid, notation_name)
+
+
+def _forbid_unparsed_entity_declaration(
+    name: str,
+    base: str | None,
+    sysid: str | None,
+    pubid: str | None,
+    notation_name: str | None,
+) -> None:
+    raise EntitiesForbidden(name, None, base, sysid, pubid, notation_name)
+
+
+def _forbid_external_reference(
+    context: str,
+    base: str | None,
+    sysid: str | None,
+    pubid: str | None,
+) -> None:
+    raise ExternalReferenceForbidden(context, base, sysid, pubid)
@@ -2,25 +2,109 @@
 
 from __future__ import annotations
 
+import marshal
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
 from datetime import timezone
 from pathlib import Path
+from typing import TYPE_CHECKING
 from typing import Any
 
 import pythonbible as bible
 from defusedxml import ElementTree
+from pythonbible.bible.bible import clean_html
 
+from pythonbible_parser import compressed_bible
+from pythonbible_parser.atomic_files import AtomicFiles
+from pythonbible_parser.events_file import load_events
+from pythonbible_parser.events_file import save_events
+from pythonbible_parser.osis.book_cache import BookCache
 from pythonbible_parser.osis.constants import BOOK_IDS
+from pythonbible_parser.osis.constants import get_book_by_id
 from pythonbible_parser.osis.osis_book_parser import OSISBookParser
+from pythonbible_parser.osis.osis_expat_reader import OSISExpatReader
 from pythonbible_parser.osis.osis_utilities import get_namespace
+from pythonbible_parser.osis.osis_utilities import serialize_element
+from pythonbible_parser.output_buffer import OutputBuffer
+from pythonbible_parser.packed_bible import FILE_EXTENSION
+from pythonbible_parser.packed_bible import write_packed_bible
+from pythonbible_parser.renderers import Renderer
+from pythonbible_parser.renderers import get_renderings
+from pythonbible_parser.renderers import is_html_rendering
+from pythonbible_parser.split_bible import write_split_bible
+from pythonbible_parser.sqlite_export import write_sqlite
+from pythonbible_parser.standoff_text import StandoffText
+from pythonbible_parser.verse_index import VerseIndex
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+    from typing import IO
+    from typing import TextIO
+
+    from pythonbible_parser.events import Event
 
 CURRENT_FOLDER: str = os.path.realpath(__file__)
 CURRENT_FOLDER_NAME: str = Path(CURRENT_FOLDER).parent
 INPUT_FOLDER: str = Path(CURRENT_FOLDER_NAME / "versions")
 OUTPUT_FOLDER: str = Path(CURRENT_FOLDER_NAME / "output")
 
+TEXT_FILE_EXTENSION: str = ".txt"
+INDEX_FILE_EXTENSION: str = ".idx"
+
+# The generated lazy modules only depend on the standard library and pythonbible.
+LAZY_BIBLE_MODULE: str = f'''from __future__ import annotations
+
+import marshal
+from pathlib import Path
+
+from pythonbible.bible.bible import Bible
+from pythonbible.versions import Version
+
+FOLDER: Path = Path(__file__).parent
+
+
+class LazyBible(Bible):
+    """A Bible whose text and verse indices are loaded on first use."""
+
+    def __init__(self, version: Version, rendering: str, is_html: bool) -> None:
+        super().__init__(version, "", {{}}, {{}}, is_html)
+        self.rendering: str = rendering
+        self.is_loaded: bool = False
+
+    def get_scripture(
+        self,
+        start_verse_id: int,
+        end_verse_id: int | None = None,
+    ) -> str:
+        if not self.is_loaded:
+            self.load()
+
+        return super().get_scripture(start_verse_id, end_verse_id)
+
+    def load(self) -> None:
+        text_path = FOLDER / f"{{self.rendering}}{TEXT_FILE_EXTENSION}"
+        index_path = FOLDER / f"{{self.rendering}}{INDEX_FILE_EXTENSION}"
+
+        # marshal.loads is much faster than reading the file with marshal.load.
+        verse_start_indices, verse_end_indices = marshal.loads(index_path.read_bytes())
+
+        # newline="" keeps the text, and so the verse indices, exactly as written.
+        with text_path.open(encoding="utf-8", newline="") as reader:
+            self.scripture_content = reader.read()
+        self.verse_start_indices = verse_start_indices
+        self.verse_end_indices = verse_end_indices
+        self.is_loaded = True
+
+
+'''
+
 XPATH_BOOK: str = ".//xmlns:div[@osisID='{}']"
+DIV_TAG: str = "{{{}}}div"
 
 
 class OSISParser:
@@ -30,22 +114,67 @@ class OSISParser:
     to parse XML files that are in the OSIS format.
     """
 
-    def __init__(self: OSISParser, version: bible.Version) -> None:
+    def __init__(
+        self: OSISParser,
+        version: bible.Version,
+        *,
+        streaming: bool = False,
+        parallel: bool = False,
+        max_workers: int | None = None,
+        cache_folder: Path | None = None,
+        renderings: Iterable[str] | None = None,
+        events_file: Path | None = None,
+        expat: bool = False,
+    ) -> None:
         """Initialize the OSIS parser.
 
         Set the version, the element tree from the appropriate version XML file,
         and the namespaces.
 
+        In streaming mode, the XML file is not loaded up front. Instead, parse()
+        reads it incrementally and only keeps one book element in memory at a time.
+
+        In parallel mode, parse() parses the books in a pool of max_workers
+        processes (by default, one per CPU).
+
+        If a cache folder is given, parse() stores each parsed book in it and only
+        parses the books whose XML has changed since the last time.
+
+        Only the given renderings (by default, all of them) are built and written.
+        The text and verse indices of the other renderings are left empty.
+
+        If an events file (see save_events()) is given, parse() renders the books
+        from the events saved in it, and the XML file is not read at all.
+
+        In expat mode, the XML file is read with an OSISExpatReader, which emits the
+        events of each book directly from the expat callbacks instead of building
+        an element tree first. The parallel and cache options do not apply.
+
         :param version:
+        :param streaming:
+        :param parallel:
+        :param max_workers:
+        :param cache_folder:
+        :param renderings:
+        :param events_file:
+        :param expat:
         """
         self.version: bible.Version = version
-
-        self.tree: ElementTree = ElementTree.parse(
-            Path(INPUT_FOLDER / f"{version.value.lower()}.xml"),
-        )
-        self.namespaces: dict[str, str] = {
-            "xmlns": get_namespace(self.tree.getroot().tag),
-        }
+        self.streaming: bool = streaming
+        self.parallel: bool = parallel
+        self.max_workers: int | None = max_workers
+        self.cache_folder: Path | None = cache_folder
+        self.renderings: tuple[str, ...] = get_renderings(renderings)
+        self.events_file: Path | None = events_file
+        self.expat: bool = expat
+        self.input_path: Path = Path(INPUT_FOLDER / f"{version.value.lower()}.xml")
+
+        self.tree: ElementTree | None = None
+        self.namespaces: dict[str, str] = {}
+
+        if not (streaming or expat) and events_file is None:
+            self.tree = ElementTree.parse(self.input_path)
+            self.namespaces = {"xmlns": get_namespace(self.tree.getroot().tag)}
 
         self.html: str = ""
         self.html_readers: str = ""
@@ -54,6 +183,10 @@ class OSISParser:
         self.plain_text_readers: str = ""
         self.plain_text_notes: str = ""
 
+        self.buffers: dict[str, OutputBuffer] = {
+            rendering: OutputBuffer() for rendering in self.renderings
+        }
+
         self.html_verse_start_indices: dict[int, int] = {}
         self.html_readers_verse_start_indices: dict[int, int] = {}
         self.html_notes_verse_start_indices: dict[int, int] = {}
@@ -68,154 +201,613 @@ class OSISParser:
         self.plain_text_readers_verse_end_indices: dict[int, int] = {}
         self.plain_text_notes_verse_end_indices: dict[int, int] = {}
 
+        self.verse_start_indices: dict[str, dict[int, int]] = {
+            "html": self.html_verse_start_indices,
+            "html_readers": self.html_readers_verse_start_indices,
+            "html_notes": self.html_notes_verse_start_indices,
+            "plain_text": self.plain_text_verse_start_indices,
+            "plain_text_readers": self.plain_text_readers_verse_start_indices,
+            "plain_text_notes": self.plain_text_notes_verse_start_indices,
+        }
+        self.verse_end_indices: dict[str, dict[int, int]] = {
+            "html": self.html_verse_end_indices,
+            "html_readers": self.html_readers_verse_end_indices,
+            "html_notes": self.html_notes_verse_end_indices,
+            "plain_text": self.plain_text_verse_end_indices,
+            "plain_text_readers": self.plain_text_readers_verse_end_indices,
+            "plain_text_notes": self.plain_text_notes_verse_end_indices,
+        }
+
         self.short_titles: dict[bible.Book, str] = {}
         self.long_titles: dict[bible.Book, str] = {}
 
     def parse(self: OSISParser) -> None:
-        """Parse the XML input file."""
-        html_offset: int = 0
-        html_readers_offset: int = 0
-        html_notes_offset: int = 0
-        plain_text_offset: int = 0
-        plain_text_readers_offset: int = 0
-        plain_text_notes_offset: int = 0
+        """Parse the XML input file.
+
+        Each book is parsed on its own, with offsets relative to the start of the
+        book. The books are then combined in canonical order and their verse
+        indices are relocated, so the output is the same in every mode.
+
+        If an events file was given or in expat mode, the books are rendered from
+        their events instead.
+        """
+        if self.events_file is not None:
+            self._render_books(load_events(self.events_file).items())
+            return
+
+        if self.expat:
+            self._render_books(OSISExpatReader(self.input_path).iter_book_events())
+            return
+
+        book_elements: Iterable[tuple[bible.Book, Any]] = (
+            self._iter_book_elements_streaming()
+            if self.streaming
+            else self._get_book_elements().items()
+        )
+        book_cache: BookCache | None = None
+
+        if self.cache_folder is not None:
+            book_cache = BookCache(
+                Path(self.cache_folder / self.version.value.lower()),
+                self.renderings,
+            )
+            book_elements = book_cache.filter(book_elements)
+
+        book_parsers: dict[bible.Book, OSISBookParser] = (
+            self._parse_books_in_parallel(book_elements)
+            if self.parallel
+            else {
+                book: _parse_book_element(element, self.renderings)
+                for book, element in book_elements
+            }
+        )
+
+        if book_cache is not None:
+            book_cache.save(book_parsers)
+            book_parsers.update(book_cache.cached_book_parsers)
+
+        self._add_books(book_parsers)
+
+    def save_events(self: OSISParser, file_path: Path) -> None:
+        """Walk the books of the XML input file and save their events to a file.
+
+        The events file can then be given to other OSISParser instances, which
+        render any of the renderings from it much faster than from the XML file.
+
+        :param file_path: the path of the events file
+        """
+        save_events(file_path, dict(self.iter_book_events()))
+
+    def get_standoff_text(self: OSISParser) -> StandoffText:
+        """Walk the books of the XML input file into a StandoffText.
+
+        The StandoffText keeps the text of the version once, and builds any of the
+        renderings from it on demand.
+
+        :return: the canonical text and overlays of the version
+        """
+        return StandoffText(self.version, self.iter_book_events())
+
+    def iter_book_events(self: OSISParser) -> Iterator[tuple[bible.Book, list[Event]]]:
+        """Walk the books one at a time, in the order they are read, into events.
 
+        The events are read from the events file if one was given.
+
+        :return: an iterator of books and their events
+        """
+        if self.events_file is not None:
+            yield from load_events(self.events_file).items()
+            return
+
+        if self.expat:
+            yield from OSISExpatReader(self.input_path).iter_book_events()
+            return
+
+        book_elements: Iterable[tuple[bible.Book, Any]] = (
+            self._iter_book_elements_streaming()
+            if self.tree is None
+            else self._get_book_elements().items()
+        )
+
+        for book, element in book_elements:
+            yield book, OSISBookParser(element, 0, 0, 0, 0, 0, 0, renderings=()).walk()
+
+    def _iter_book_parsers(
+        self: OSISParser,
+    ) -> Iterator[tuple[bible.Book, OSISBookParser]]:
+        """Parse or render the books one at a time, in the order they are read.
+
+        :return: an iterator of books and their book parsers
+        """
+        if self.events_file is not None or self.expat:
+            for book, book_events in self.iter_book_events():
+                yield book, _render_book_events(book_events, self.renderings)
+
+            return
+
+        book_elements: Iterable[tuple[bible.Book, Any]] = (
+            self._iter_book_elements_streaming()
+            if self.tree is None
+            else self._get_book_elements().items()
+        )
+
+        for book, element in book_elements:
+            yield book, _parse_book_element(element, self.renderings)
+
+    def _render_books(
+        self: OSISParser,
+        all_book_events: Iterable[tuple[bible.Book, list[Event]]],
+    ) -> None:
+        self._add_books(
+            {
+                book: _render_book_events(book_events, self.renderings)
+                for book, book_events in all_book_events
+            },
+        )
+
+    def _add_books(
+        self: OSISParser,
+        book_parsers: dict[bible.Book, OSISBookParser],
+    ) -> None:
         for book in bible.Book:
-            book_element = self._get_book_element(book)
+            book_parser = book_parsers.pop(book, None)
+
+            if book_parser is not None:
+                self._add_book(book, book_parser)
+
+        self._join_buffers()
+
+    def _iter_book_elements_streaming(
+        self: OSISParser,
+    ) -> Iterator[tuple[bible.Book, Any]]:
+        """Read the XML input file incrementally and yield each book div element.
+
+        Each book element is yielded as soon as its closing tag has been read, and
+        it is cleared and detached from the partial tree once the caller is done
+        with it, so memory use does not grow with the size of the input file. If a
+        book occurs more than once, only the first occurrence is yielded.
+
+        :return: an iterator of books and their book div elements
+        """
+        book_ids: set[str] = set(BOOK_IDS.values())
+        books_seen: set[bible.Book] = set()
+        open_elements: list[Any] = []
+        book_element: Any = None
+        div_tag: str = ""
+
+        for event, element in ElementTree.iterparse(
+            self.input_path,
+            events=("start", "end"),
+        ):
+            if event == "start":
+                if not open_elements:
+                    namespace: str = get_namespace(element.tag)
+                    self.namespaces = {"xmlns": namespace}
+                    div_tag = DIV_TAG.format(namespace)
+
+                if (
+                    book_element is None
+                    and element.tag == div_tag
+                    and element.get("osisID") in book_ids
+                ):
+                    book_element = element
+
+                open_elements.append(element)
+                continue
+
+            open_elements.pop()
 
-            if book_element is None:
+            if element is not book_element:
                 continue
 
-            book_parser = OSISBookParser(
-                book_element,
-                html_offset,
-                html_readers_offset,
-                html_notes_offset,
-                plain_text_offset,
-                plain_text_readers_offset,
-                plain_text_notes_offset,
-            )
-            book_parser.parse()
-
-            self.html += book_parser.html
-            self.html_readers += book_parser.html_readers
-            self.html_notes += book_parser.html_notes
-            self.plain_text += book_parser.plain_text
-            self.plain_text_readers += book_parser.plain_text_readers
-            self.plain_text_notes += book_parser.plain_text_notes
-
-            html_offset = len(self.html)
-            html_readers_offset = len(self.html_readers)
-            html_notes_offset = len(self.html_notes)
-            plain_text_offset = len(self.plain_text)
-            plain_text_readers_offset = len(self.plain_text_readers)
-            plain_text_notes_offset = len(self.plain_text_notes)
-
-            self.html_verse_start_indices.update(book_parser.html_verse_start_indices)
-            self.html_readers_verse_start_indices.update(
-                book_parser.html_readers_verse_start_indices,
-            )
-            self.html_notes_verse_start_indices.update(
-                book_parser.html_notes_verse_start_indices,
-            )
-            self.plain_text_verse_start_indices.update(
-                book_parser.plain_text_verse_start_indices,
+            book: bible.Book = get_book_by_id(element.get("osisID"))
+
+            if book not in books_seen:
+                books_seen.add(book)
+                yield book, element
+
+            book_element = None
+            element.clear()
+
+            if open_elements:
+                open_elements[-1].remove(element)
+
+    def _parse_books_in_parallel(
+        self: OSISParser,
+        book_elements: Iterable[tuple[bible.Book, Any]],
+    ) -> dict[bible.Book, OSISBookParser]:
+        """Parse the given book elements in a pool of processes.
+
+        Each element is serialized before it is sent to a worker process, so the
+        streaming mode can still clear each element right away.
+
+        :param book_elements:
+        :return: a dictionary of books to their book parsers
+        """
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                book: executor.submit(
+                    _parse_book_xml,
+                    serialize_element(element),
+                    self.renderings,
+                )
+                for book, element in book_elements
+            }
+
+            return {book: future.result() for book, future in futures.items()}
+
+    def _add_book(
+        self: OSISParser,
+        book: bible.Book,
+        book_parser: OSISBookParser,
+    ) -> None:
+        """Append the output of a parsed book to the output of the whole Bible.
+
+        The verse indices of the book parser are shifted by the difference between
+        the current length of each output and the offset the book was parsed with.
+
+        :param book:
+        :param book_parser:
+        """
+        for rendering, buffer in self.buffers.items():
+            renderer: Renderer = book_parser.renderers[rendering]
+            self._add_verse_indices(rendering, renderer, len(buffer))
+            buffer.append(renderer.get_text())
+
+        self.short_titles[book] = book_parser.short_title
+        self.long_titles[book] = book_parser.title
+
+    def _add_verse_indices(
+        self: OSISParser,
+        rendering: str,
+        renderer: Renderer,
+        length: int,
+    ) -> None:
+        """Add the verse indices of a book, relocated to the end of the output.
+
+        :param rendering: the name of the rendering
+        :param renderer: the renderer of the book
+        :param length: the length of the output before the book
+        """
+        shift: int = length - renderer.offset
+        self.verse_start_indices[rendering].update(
+            _relocate(renderer.verse_start_indices, shift),
+        )
+        self.verse_end_indices[rendering].update(
+            _relocate(renderer.verse_end_indices, shift),
+        )
+
+    def _join_buffers(self: OSISParser) -> None:
+        for rendering, buffer in self.buffers.items():
+            setattr(self, rendering, buffer.getvalue())
+
+    def compact_indices(self: OSISParser) -> None:
+        """Replace the verse index dicts of each rendering with a VerseIndex.
+
+        Call it once the version is parsed. The verse indices then take more than
+        ten times less memory, and can still be read like dicts, written and given
+        to pythonbible's Bible, but they can no longer be changed.
+        """
+        for rendering in self.renderings:
+            verse_index = VerseIndex(
+                self.verse_start_indices[rendering],
+                self.verse_end_indices[rendering],
             )
-            self.plain_text_readers_verse_start_indices.update(
-                book_parser.plain_text_readers_verse_start_indices,
+            self.verse_start_indices[rendering] = verse_index.verse_start_indices
+            self.verse_end_indices[rendering] = verse_index.verse_end_indices
+            setattr(
+                self,
+                f"{rendering}_verse_start_indices",
+                verse_index.verse_start_indices,
             )
-            self.plain_text_notes_verse_start_indices.update(
-                book_parser.plain_text_notes_verse_start_indices,
+            setattr(
+                self,
+                f"{rendering}_verse_end_indices",
+                verse_index.verse_end_indices,
             )
 
-            self.html_verse_end_indices.update(book_parser.html_verse_end_indices)
-            self.html_readers_verse_end_indices.update(
-                book_parser.html_readers_verse_end_indices,
+    def write(
+        self: OSISParser,
+        *,
+        index_files: bool = False,
+        fsync: bool = False,
+    ) -> None:
+        """Write the content out to file(s).
+
+        By default, the verse indices are written to each module as dict
+        literals, which the interpreter has to compile the first time the module
+        is imported. With index_files, they are written to a marshal file next to
+        each module instead, and the module loads them from it.
+
+        The files are written in parallel threads to temporary files, which are
+        only renamed into place once all of them have been written (see
+        AtomicFiles), so a failed or interrupted write leaves the previous files
+        of the version untouched.
+
+        :param index_files: True to write the verse indices to marshal files
+        :param fsync: True to flush the files to disk before they are renamed
+        """
+        version_folder: Path = self._make_version_folder()
+        max_workers: int = len(self.renderings) + 1
+
+        with AtomicFiles(fsync) as files, ThreadPoolExecutor(max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _write_file,
+                    version_folder,
+                    f"{rendering}.py",
+                    self.version,
+                    getattr(self, rendering),
+                    self.verse_start_indices[rendering],
+                    self.verse_end_indices[rendering],
+                    is_html=is_html_rendering(rendering),
+                    index_file=index_files,
+                    files=files,
+                )
+                for rendering in self.renderings
+            ]
+            futures.append(
+                executor.submit(
+                    _write_titles_file,
+                    version_folder,
+                    self.short_titles,
+                    self.long_titles,
+                    files,
+                ),
             )
-            self.html_notes_verse_end_indices.update(
-                book_parser.html_notes_verse_end_indices,
+
+            for future in futures:
+                future.result()
+
+    def write_streaming(self: OSISParser, index_files: bool = False) -> None:
+        """Parse the XML input file and write each book as soon as it is parsed.
+
+        The modules are the same as the ones written by parse() and write(), but
+        the text of each book is written to them as soon as the book is parsed,
+        and only the verse indices and titles are kept until the end. The peak
+        memory use is then bounded by the largest book instead of the whole Bible
+        (unless the element tree was loaded up front, i.e. neither the streaming
+        nor the expat mode is used). The text attributes are left empty.
+
+        The books are written in the order of the input file, which is their
+        canonical order in every version of this package. The parallel and cache
+        options do not apply.
+
+        As in write(), the files are only renamed into place once all of them
+        have been written.
+
+        :param index_files: True to write the verse indices to marshal files
+        """
+        version_folder: Path = self._make_version_folder()
+        lengths: dict[str, int] = dict.fromkeys(self.renderings, 0)
+
+        with AtomicFiles() as files, ExitStack() as stack:
+            writers: dict[str, TextIO] = {}
+
+            for rendering in self.renderings:
+                file_path = Path(version_folder / f"{rendering}.py")
+                writer: TextIO = stack.enter_context(_open_file(file_path, files))
+                _write_module_start(writer, file_path, self.version, index_files)
+                writers[rendering] = writer
+
+            for book, book_parser in self._iter_book_parsers():
+                for rendering, writer in writers.items():
+                    renderer: Renderer = book_parser.renderers[rendering]
+                    text: str = renderer.get_text()
+                    self._add_verse_indices(rendering, renderer, lengths[rendering])
+                    writer.write(text)
+                    lengths[rendering] += len(text)
+
+                self.short_titles[book] = book_parser.short_title
+                self.long_titles[book] = book_parser.title
+
+            for rendering, writer in writers.items():
+                _write_module_end(
+                    writer,
+                    Path(version_folder / f"{rendering}.py"),
+                    self.verse_start_indices[rendering],
+                    self.verse_end_indices[rendering],
+                    is_html=is_html_rendering(rendering),
+                    index_file=index_files,
+                    files=files,
+                )
+
+            _write_titles_file(
+                version_folder,
+                self.short_titles,
+                self.long_titles,
+                files,
             )
-            self.plain_text_verse_end_indices.update(
-                book_parser.plain_text_verse_end_indices,
+
+    def write_lazy(self: OSISParser) -> None:
+        """Write each rendering to a lazy-loading module and its data files.
+
+        The module only defines a Bible object; its text and verse indices are
+        written to a text file and an index file next to it, and are only loaded
+        on the first call to get_scripture(). Importing every rendering of every
+        version is then almost free until a rendering is actually used.
+
+        The titles are written to a Python module, as in write().
+        """
+        version_folder: Path = self._make_version_folder()
+
+        for rendering in self.renderings:
+            _write_lazy_file(
+                Path(version_folder / f"{rendering}.py"),
+                self.version,
+                getattr(self, rendering),
+                self.verse_start_indices[rendering],
+                self.verse_end_indices[rendering],
+                is_html=is_html_rendering(rendering),
             )
-            self.plain_text_readers_verse_end_indices.update(
-                book_parser.plain_text_readers_verse_end_indices,
+
+        _write_titles_file(version_folder, self.short_titles, self.long_titles)
+
+    def write_packed(self: OSISParser) -> None:
+        """Write each rendering to a packed binary file (see PackedBible).
+
+        The titles are written to a Python module, as in write().
+        """
+        version_folder: Path = self._make_version_folder()
+
+        for rendering in self.renderings:
+            write_packed_bible(
+                Path(version_folder / f"{rendering}{FILE_EXTENSION}"),
+                self.version,
+                getattr(self, rendering),
+                self.verse_start_indices[rendering],
+                self.verse_end_indices[rendering],
+                is_html=is_html_rendering(rendering),
             )
-            self.plain_text_notes_verse_end_indices.update(
-                book_parser.plain_text_notes_verse_end_indices,
+
+        _write_titles_file(version_folder, self.short_titles, self.long_titles)
+
+    def write_compressed(self: OSISParser, compression: str = "zlib") -> None:
+        """Write each rendering to a compressed file (see CompressedBible).
+
+        The titles are written to a Python module, as in write().
+
+        :param compression: "zlib" or "lzma"
+        """
+        version_folder: Path = self._make_version_folder()
+
+        for rendering in self.renderings:
+            compressed_bible.write_compressed_bible(
+                Path(version_folder / f"{rendering}{compressed_bible.FILE_EXTENSION}"),
+                self.version,
+                getattr(self, rendering),
+                self.verse_start_indices[rendering],
+                self.verse_end_indices[rendering],
+                is_html=is_html_rendering(rendering),
+                compression=compression,
             )
 
-            self.short_titles[book] = book_parser.short_title
-            self.long_titles[book] = book_parser.title
+        _write_titles_file(version_folder, self.short_titles, self.long_titles)
 
-    def write(self: OSISParser) -> None:
-        """Write the content out to file(s)."""
-        version_str: str = self.version.value.lower()
-        version_folder: str = Path(OUTPUT_FOLDER / version_str)
+    def write_split(self: OSISParser) -> None:
+        """Write each rendering to a folder with one file per book (see SplitBible).
 
-        for folder in (OUTPUT_FOLDER, version_folder):
-            folder_path = Path(folder)
+        The manifest of each rendering contains the titles, which are also
+        written to a Python module, as in write().
+        """
+        version_folder: Path = self._make_version_folder()
+
+        for rendering in self.renderings:
+            write_split_bible(
+                Path(version_folder / rendering),
+                self.version,
+                getattr(self, rendering),
+                self.verse_start_indices[rendering],
+                self.verse_end_indices[rendering],
+                is_html=is_html_rendering(rendering),
+                short_titles=self.short_titles,
+                long_titles=self.long_titles,
+            )
 
-            if not folder_path.exists():
-                folder_path.mkdir()
+        _write_titles_file(version_folder, self.short_titles, self.long_titles)
 
-        _write_file(
-            version_folder,
-            "html.py",
-            self.version,
-            self.html,
-            self.html_verse_start_indices,
-            self.html_verse_end_indices,
-            True,
-        )
-        _write_file(
-            version_folder,
-            "html_readers.py",
-            self.version,
-            self.html_readers,
-            self.html_readers_verse_start_indices,
-            self.html_readers_verse_end_indices,
-            True,
-        )
-        _write_file(
-            version_folder,
-            "html_notes.py",
-            self.version,
-            self.html_notes,
-            self.html_notes_verse_start_indices,
-            self.html_notes_verse_end_indices,
-            True,
-        )
-        _write_file(
-            version_folder,
-            "plain_text.py",
-            self.version,
-            self.plain_text,
-            self.plain_text_verse_start_indices,
-            self.plain_text_verse_end_indices,
+    def write_sqlite(self: OSISParser, database_path: Path) -> None:
+        """Write the verses and titles to a SQLite database (see sqlite_export).
+
+        The plain text of each verse comes from the plain_text_readers rendering
+        and its HTML from the html rendering. If a rendering was not built, the
+        matching column is left empty.
+
+        :param database_path: the path of the SQLite database
+        """
+        verse_ids: list[int] = sorted(
+            {
+                *self.plain_text_readers_verse_start_indices,
+                *self.html_verse_start_indices,
+            },
         )
-        _write_file(
-            version_folder,
-            "plain_text_readers.py",
-            self.version,
-            self.plain_text_readers,
-            self.plain_text_readers_verse_start_indices,
-            self.plain_text_readers_verse_end_indices,
+        verses: Iterator[tuple[int, str | None, str | None]] = (
+            (
+                verse_id,
+                self._get_verse_text("plain_text_readers", verse_id),
+                self._get_verse_text("html", verse_id),
+            )
+            for verse_id in verse_ids
         )
-        _write_file(
-            version_folder,
-            "plain_text_notes.py",
+
+        write_sqlite(
+            database_path,
             self.version,
-            self.plain_text_notes,
-            self.plain_text_notes_verse_start_indices,
-            self.plain_text_notes_verse_end_indices,
+            verses,
+            self.short_titles,
+            self.long_titles,
         )
 
-        _write_titles_file(version_folder, self.short_titles, self.long_titles)
+    def _get_verse_text(self: OSISParser, rendering: str, verse_id: int) -> str | None:
+        start_index: int | None = self.verse_start_indices[rendering].get(verse_id)
+        end_index: int | None = self.verse_end_indices[rendering].get(verse_id)
+
+        if start_index is None or end_index is None:
+            return None
+
+        verse_text: str = getattr(self, rendering)[start_index:end_index].strip()
+        return clean_html(verse_text) if is_html_rendering(rendering) else verse_text
+
+    def _make_version_folder(self: OSISParser) -> Path:
+        version_folder: Path = Path(OUTPUT_FOLDER / self.version.value.lower())
+
+        for folder in (OUTPUT_FOLDER, version_folder):
+            # Other processes may be writing other versions at the same time.
+            Path(folder).mkdir(exist_ok=True)
+
+        return version_folder
+
+    def _get_book_elements(self: OSISParser) -> dict[bible.Book, Any]:
+        """Return the book div elements of the tree in canonical order.
+
+        The tree is traversed only once. If a book occurs more than once, the first
+        occurrence is used.
+
+        :return: a dictionary of books to their book div elements
+        """
+        book_ids: set[str] = set(BOOK_IDS.values())
+        elements_by_id: dict[str, Any] = {}
+
+        for element in self.tree.iter(DIV_TAG.format(self.namespaces["xmlns"])):
+            osis_id: str | None = element.get("osisID")
+
+            if osis_id in book_ids and osis_id not in elements_by_id:
+                elements_by_id[osis_id] = element
+
+        return {
+            book: elements_by_id[book_id]
+            for book in bible.Book
+            if (book_id := BOOK_IDS.get(book)) in elements_by_id
+        }
+
 
-    def _get_book_element(self: OSISParser, book: bible.Book) -> Any:
-        xpath: str = XPATH_BOOK.format(BOOK_IDS.get(book))
-        return self.tree.find(xpath, namespaces=self.namespaces)
+def _parse_book_element(
+    book_element: Any,
+    renderings: tuple[str, ...],
+) -> OSISBookParser:
+    book_parser = OSISBookParser(book_element, 0, 0, 0, 0, 0, 0, renderings=renderings)
+    book_parser.parse()
+    return book_parser
+
+
+def _render_book_events(
+    book_events: list[Event],
+    renderings: tuple[str, ...],
+) -> OSISBookParser:
+    book_parser = OSISBookParser(None, 0, 0, 0, 0, 0, 0, renderings=renderings)
+    book_parser.render(book_events)
+    return book_parser
+
+
+def _parse_book_xml(book_xml: bytes, renderings: tuple[str, ...]) -> OSISBookParser:
+    return _parse_book_element(ElementTree.fromstring(book_xml), renderings)
+
+
+def _relocate(indices: dict[int, int], shift: int) -> dict[int, int]:
+    if not shift:
+        return indices
+
+    return {verse_id: index + shift for verse_id, index in indices.items()}
 
 
 def _write_file(
@@ -225,37 +817,160 @@ def _write_file(
     bible_text: str,
     verse_start_indices: dict[int, int],
     verse_end_indices: dict[int, int],
+    *,
     is_html: bool = False,
+    index_file: bool = False,
+    files: AtomicFiles | None = None,
 ) -> None:
     file_path = Path(folder / filename)
 
-    with file_path.open(mode="w", encoding="utf-8") as writer:
-        writer.write(_file_header())
-        writer.write("from pythonbible.bible.bible import Bible\n")
-        writer.write("from pythonbible.versions import Version\n\n\n")
-        writer.write("bible = Bible(\n")
-        writer.write(f"    Version.{version.name},\n")
-        writer.write(f'    """{bible_text}""",\n')
+    with _open_file(file_path, files) as writer:
+        _write_module_start(writer, file_path, version, index_file)
+        writer.write(bible_text)
+        _write_module_end(
+            writer,
+            file_path,
+            verse_start_indices,
+            verse_end_indices,
+            is_html=is_html,
+            index_file=index_file,
+            files=files,
+        )
+
+
+def _write_module_start(
+    writer: TextIO,
+    file_path: Path,
+    version: bible.Version,
+    index_file: bool = False,
+) -> None:
+    """Write the beginning of a module, up to the start of the text of the Bible."""
+    writer.write(_file_header())
+
+    if index_file:
+        writer.write("import marshal\nfrom pathlib import Path\n\n")
+
+    writer.write("from pythonbible.bible.bible import Bible\n")
+    writer.write("from pythonbible.versions import Version\n\n")
+
+    if index_file:
+        index_path = file_path.with_suffix(INDEX_FILE_EXTENSION)
+        writer.write(
+            "verse_start_indices, verse_end_indices = marshal.loads(\n"
+            f'    (Path(__file__).parent / "{index_path.name}").read_bytes(),\n'
+            ")\n",
+        )
+
+    writer.write("\nbible = Bible(\n")
+    writer.write(f"    Version.{version.name},\n")
+    writer.write('    """')
+
+
+def _write_module_end(
+    writer: TextIO,
+    file_path: Path,
+    verse_start_indices: dict[int, int],
+    verse_end_indices: dict[int, int],
+    *,
+    is_html: bool = False,
+    index_file: bool = False,
+    files: AtomicFiles | None = None,
+) -> None:
+    """Write the rest of a module after the text of the Bible, and its index file."""
+    writer.write('""",\n')
+
+    if index_file:
+        _write_index_file(
+            file_path.with_suffix(INDEX_FILE_EXTENSION),
+            verse_start_indices,
+            verse_end_indices,
+            files,
+        )
+        writer.write("    verse_start_indices,\n")
+        writer.write("    verse_end_indices,\n")
+    else:
         writer.write(f"    {verse_start_indices},\n")
         writer.write(f"    {verse_end_indices},\n")
+
+    writer.write(f"    {is_html},\n")
+    writer.write(")\n")
+
+
+def _write_lazy_file(
+    file_path: Path,
+    version: bible.Version,
+    bible_text: str,
+    verse_start_indices: dict[int, int],
+    verse_end_indices: dict[int, int],
+    *,
+    is_html: bool = False,
+    files: AtomicFiles | None = None,
+) -> None:
+    with _open_file(
+        file_path.with_suffix(TEXT_FILE_EXTENSION),
+        files,
+        newline="",
+    ) as writer:
+        writer.write(bible_text)
+
+    _write_index_file(
+        file_path.with_suffix(INDEX_FILE_EXTENSION),
+        verse_start_indices,
+        verse_end_indices,
+        files,
+    )
+
+    with _open_file(file_path, files) as writer:
+        writer.write(_file_header())
+        writer.write(LAZY_BIBLE_MODULE)
+        writer.write("bible = LazyBible(\n")
+        writer.write(f"    Version.{version.name},\n")
+        writer.write(f"    {file_path.stem!r},\n")
         writer.write(f"    {is_html},\n")
         writer.write(")\n")
 
 
+def _write_index_file(
+    file_path: Path,
+    verse_start_indices: dict[int, int],
+    verse_end_indices: dict[int, int],
+    files: AtomicFiles | None = None,
+) -> None:
+    with _open_file(file_path, files, mode="wb") as writer:
+        # marshal only writes plain dicts, not the views of a VerseIndex.
+        marshal.dump((dict(verse_start_indices), dict(verse_end_indices)), writer)
+
+
 def _write_titles_file(
     folder: str,
     short_titles: dict[bible.Book, str],
     long_titles: dict[bible.Book, str],
+    files: AtomicFiles | None = None,
 ) -> None:
     file_path = Path(folder / "titles.py")
 
-    with file_path.open(mode="w", encoding="utf-8") as writer:
+    with _open_file(file_path, files) as writer:
         writer.write(_file_header())
         writer.write("from pythonbible.books import Book\n\n\n")
         writer.write(f"short_titles = {_titles_dict_to_string(short_titles)}\n\n")
         writer.write(f"long_titles = {_titles_dict_to_string(long_titles)}\n")
 
 
+def _open_file(
+    file_path: Path,
+    files: AtomicFiles | None,
+    mode: str = "w",
+    newline: str | None = None,
+) -> AbstractContextManager[IO[Any]]:
+    """Open a file in place, or its temporary file if it is part of AtomicFiles."""
+    encoding: str | None = None if "b" in mode else "utf-8"
+
+    if files is None:
+        return file_path.open(mode=mode, encoding=encoding, newline=newline)
+
+    return files.open(file_path, mode=mode, encoding=encoding, newline=newline)
+
+
 def _titles_dict_to_string(titles: dict[bible.Book, str]) -> str:
     return (
         "{\n"
@@ -5,6 +5,8 @@ from functools import lru_cache
 from typing import TYPE_CHECKING
 from typing import Any
 
+from defusedxml import ElementTree
+
 from pythonbible_parser.osis.constants import get_book_by_id
 
 if TYPE_CHECKING:
@@ -36,6 +38,17 @@ def get_element_tail(element: Any) -> str:
     return element.tail.replace("\n", " ") if element.tail else ""
 
 
+def serialize_element(element: Any) -> bytes:
+    # The tail is not part of the element and may not be well-formed on its own.
+    tail: str | None = element.tail
+    element.tail = None
+
+    try:
+        return ElementTree.tostring(element, encoding="utf-8")
+    finally:
+        element.tail = tail
+
+
 @dataclass
 class OSISID:
     book: Book
@@ -0,0 +1,61 @@
+"""Contains the OutputBuffer class."""
+
+from __future__ import annotations
+
+TAIL_LENGTH: int = 8
+
+
+class OutputBuffer:
+    """Accumulate output text in linear time.
+
+    Appending to a string attribute with += copies the whole string on every
+    append. OutputBuffer keeps the appended pieces in a list and only joins them
+    when the value is requested. It also keeps track of the total length and the
+    last few characters, so len() and endswith() do not need the joined value.
+    """
+
+    def __init__(self: OutputBuffer) -> None:
+        """Initialize an empty OutputBuffer."""
+        self._parts: list[str] = []
+        self._length: int = 0
+        self._tail: str = ""
+
+    def __len__(self: OutputBuffer) -> int:
+        """Return the total length of the text appended so far."""
+        return self._length
+
+    def append(self: OutputBuffer, text: str) -> None:
+        """Append the given text to the buffer.
+
+        :param text:
+        """
+        if not text:
+            return
+
+        self._parts.append(text)
+        self._length += len(text)
+
+        if len(text) >= TAIL_LENGTH:
+            self._tail = text[-TAIL_LENGTH:]
+        else:
+            self._tail = (self._tail + text)[-TAIL_LENGTH:]
+
+    def endswith(self: OutputBuffer, suffix: str | tuple[str, ...]) -> bool:
+        """Return True if the text appended so far ends with the given suffix.
+
+        Suffixes longer than TAIL_LENGTH characters are not supported.
+
+        :param suffix: a string or a tuple of strings to look for
+        :return: True if the buffer ends with the suffix; otherwise, False
+        """
+        return self._tail.endswith(suffix)
+
+    def getvalue(self: OutputBuffer) -> str:
+        """Return the text appended so far as a single string.
+
+        :return: the text appended so far
+        """
+        if len(self._parts) > 1:
+            self._parts = ["".join(self._parts)]
+
+        return self._parts[0] if self._parts else ""
@@ -0,0 +1,294 @@
+"""Write and read a rendering of a version of the Bible in a packed binary file.
+
+A packed file can be opened in milliseconds, because nothing has to be compiled
+or decoded up front: the reader maps the file into memory and only decodes the
+text of the verses it is asked for.
+
+The file contains, in this order, each part starting at a multiple of 4 bytes:
+
+* a header (magic bytes, format version, HTML flag, length of the version name,
+  number of verses and size of the text)
+* the version name, encoded in UTF-8
+* the sorted verse ids, as little-endian unsigned 32-bit integers
+* the byte offset of the start of each verse in the text (or MISSING)
+* the byte offset of the end of each verse in the text (or MISSING)
+* the text, encoded in UTF-8
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pythonbible as bible
+from pythonbible.bible.bible import clean_html
+from pythonbible.validator import is_valid_verse_id
+
+from pythonbible_parser.errors import InvalidPackedBibleError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+MAGIC: bytes = b"PBPK"
+FORMAT_VERSION: int = 1
+MISSING: int = 0xFFFFFFFF
+ALIGNMENT: int = 4
+ITEM_SIZE: int = 4
+FILE_EXTENSION: str = ".bin"
+
+HEADER: struct.Struct = struct.Struct("<4sHBxIII")
+
+
+def write_packed_bible(
+    file_path: Path,
+    version: bible.Version,
+    scripture_content: str,
+    verse_start_indices: dict[int, int],
+    verse_end_indices: dict[int, int],
+    *,
+    is_html: bool = False,
+) -> None:
+    """Write a rendering of a version of the Bible to a packed file.
+
+    The arguments are the same as the arguments of pythonbible's Bible class.
+
+    :param file_path: the path of the packed file
+    :param version: the version of the Bible
+    :param scripture_content: the text of the rendering
+    :param verse_start_indices: the index of the start of each verse in the text
+    :param verse_end_indices: the index of the end of each verse in the text
+    :param is_html: True if the text is HTML
+    """
+    text: bytes = scripture_content.encode("utf-8")
+    byte_offsets: dict[int, int] = _get_byte_offsets(
+        scripture_content,
+        {*verse_start_indices.values(), *verse_end_indices.values()},
+    )
+    verse_ids: list[int] = sorted({*verse_start_indices, *verse_end_indices})
+    version_name: bytes = version.value.encode("utf-8")
+
+    starts: array[int] = array("I", [MISSING] * len(verse_ids))
+    ends: array[int] = array("I", [MISSING] * len(verse_ids))
+
+    for position, verse_id in enumerate(verse_ids):
+        if verse_id in verse_start_indices:
+            starts[position] = byte_offsets[verse_start_indices[verse_id]]
+
+        if verse_id in verse_end_indices:
+            ends[position] = byte_offsets[verse_end_indices[verse_id]]
+
+    with file_path.open(mode="wb") as writer:
+        writer.write(
+            HEADER.pack(
+                MAGIC,
+                FORMAT_VERSION,
+                is_html,
+                len(version_name),
+                len(verse_ids),
+                len(text),
+            ),
+        )
+        writer.write(_pad(version_name))
+        writer.write(_to_little_endian(array("I", verse_ids)))
+        writer.write(_to_little_endian(starts))
+        writer.write(_to_little_endian(ends))
+        writer.write(text)
+
+
+class PackedBible:
+    """A rendering of a version of the Bible read from a packed file.
+
+    PackedBible has the same get_scripture() method as pythonbible's Bible class,
+    but the file is mapped into memory instead of being loaded, so opening it is
+    fast and only the text of the requested verses is decoded.
+    """
+
+    def __init__(self: PackedBible, file_path: Path) -> None:
+        """Open the packed file.
+
+        :param file_path: the path of the packed file
+        :raises InvalidPackedBibleError: if the file is not a valid packed file
+        """
+        try:
+            with file_path.open(mode="rb") as reader:
+                self._buffer: Any = mmap.mmap(
+                    reader.fileno(),
+                    0,
+                    access=mmap.ACCESS_READ,
+                )
+        except ValueError as error:
+            # mmap cannot map an empty file.
+            msg = f"{file_path} is not a packed Bible file."
+            raise InvalidPackedBibleError(msg) from error
+
+        try:
+            self._load(file_path)
+        except InvalidPackedBibleError:
+            self.close()
+            raise
+        except ValueError as error:
+            self.close()
+            msg = f"{file_path} has an invalid version name."
+            raise InvalidPackedBibleError(msg) from error
+
+    def __enter__(self: PackedBible) -> PackedBible:  # noqa: PYI034
+        """Return the packed Bible itself."""
+        return self
+
+    def __exit__(self: PackedBible, *_exc_info: object) -> None:
+        """Close the packed Bible."""
+        self.close()
+
+    def close(self: PackedBible) -> None:
+        """Release the arrays and unmap the file."""
+        for name in ("_verse_ids", "_starts", "_ends"):
+            values: Any = self.__dict__.pop(name, None)
+
+            if isinstance(values, memoryview):
+                values.release()
+
+        self._buffer.close()
+
+    def get_scripture(
+        self: PackedBible,
+        start_verse_id: int,
+        end_verse_id: int | None = None,
+    ) -> str:
+        """Return the text from the start of a verse to the end of another verse.
+
+        :param start_verse_id: the id of the first verse
+        :param end_verse_id: the id of the last verse (defaults to the first verse)
+        :return: the text of the verses
+        :raises InvalidVerseError: if a verse id is not valid
+        :raises VersionMissingVerseError: if a verse is not in this version
+        """
+        end_verse_id = end_verse_id or start_verse_id
+
+        # Every verse in the file is valid, so the verse ids only need to be
+        # validated (which is slow in pythonbible) if one of them is missing.
+        try:
+            start_index: int = self._get_offset(self._starts, start_verse_id)
+            end_index: int = self._get_offset(self._ends, end_verse_id)
+        except bible.VersionMissingVerseError:
+            validate_verse_ids(start_verse_id, end_verse_id)
+            raise
+
+        scripture_content: str = self._buffer[
+            self._text_offset + start_index : self._text_offset + end_index
+        ].decode("utf-8")
+
+        return clean_scripture(scripture_content, self.is_html)
+
+    def _load(self: PackedBible, file_path: Path) -> None:
+        if len(self._buffer) < HEADER.size:
+            msg = f"{file_path} is not a packed Bible file."
+            raise InvalidPackedBibleError(msg)
+
+        magic, format_version, is_html, name_size, verse_count, text_size = (
+            HEADER.unpack_from(self._buffer)
+        )
+
+        if magic != MAGIC or format_version != FORMAT_VERSION:
+            msg = f"{file_path} is not a packed Bible file of version {FORMAT_VERSION}."
+            raise InvalidPackedBibleError(msg)
+
+        name_offset: int = HEADER.size
+        ids_offset: int = name_offset + _padded_size(name_size)
+        array_size: int = verse_count * ITEM_SIZE
+        self._text_offset: int = ids_offset + 3 * array_size
+
+        if len(self._buffer) != self._text_offset + text_size:
+            msg = f"{file_path} is truncated or corrupted."
+            raise InvalidPackedBibleError(msg)
+
+        version_name: bytes = self._buffer[name_offset : name_offset + name_size]
+        self.version: bible.Version = bible.Version(version_name.decode("utf-8"))
+        self.is_html: bool = bool(is_html)
+
+        self._verse_ids: Any = self._get_array(ids_offset, verse_count)
+        self._starts: Any = self._get_array(ids_offset + array_size, verse_count)
+        self._ends: Any = self._get_array(ids_offset + 2 * array_size, verse_count)
+
+    def _get_offset(self: PackedBible, offsets: Any, verse_id: int) -> int:
+        position: int = bisect_left(self._verse_ids, verse_id)
+
+        if position < len(self._verse_ids) and self._verse_ids[position] == verse_id:
+            offset: int = offsets[position]
+
+            if offset != MISSING:
+                return offset
+
+        raise bible.VersionMissingVerseError(self.version.value, verse_id)
+
+    def _get_array(self: PackedBible, offset: int, length: int) -> Any:
+        data = memoryview(self._buffer)[offset : offset + length * ITEM_SIZE]
+
+        if sys.byteorder == "little":
+            return data.cast("I")
+
+        values: array[int] = array("I", data.tobytes())
+        data.release()
+        values.byteswap()
+        return values
+
+
+def validate_verse_ids(start_verse_id: int, end_verse_id: int | None) -> None:
+    """Validate the verse ids given to get_scripture, as pythonbible's Bible does.
+
+    :param start_verse_id: the id of the first verse
+    :param end_verse_id: the id of the last verse, if any
+    :raises InvalidVerseError: if a verse id is not valid
+    """
+    if not is_valid_verse_id(start_verse_id):
+        msg = f"start verse id ({start_verse_id}) is not a valid verse id."
+        raise bible.InvalidVerseError(msg)
+
+    if end_verse_id and not is_valid_verse_id(end_verse_id):
+        msg = f"end verse id ({end_verse_id}) is not a valid verse id."
+        raise bible.InvalidVerseError(msg)
+
+
+def clean_scripture(scripture_content: str, is_html: bool) -> str:
+    """Clean up a slice of the text, as pythonbible's Bible does.
+
+    :param scripture_content: the text from the start to the end of the verses
+    :param is_html: True if the text is HTML
+    :return: the stripped text, with balanced paragraph tags if it is HTML
+    """
+    scripture_content = scripture_content.strip()
+    return clean_html(scripture_content) if is_html else scripture_content
+
+
+def _get_byte_offsets(text: str, indices: set[int]) -> dict[int, int]:
+    """Return the offset in the UTF-8 encoded text of each character index."""
+    byte_offsets: dict[int, int] = {}
+    byte_offset: int = 0
+    previous_index: int = 0
+
+    for index in sorted(indices):
+        byte_offset += len(text[previous_index:index].encode("utf-8"))
+        byte_offsets[index] = byte_offset
+        previous_index = index
+
+    return byte_offsets
+
+
+def _padded_size(size: int) -> int:
+    return -(-size // ALIGNMENT) * ALIGNMENT
+
+
+def _pad(data: bytes) -> bytes:
+    return data.ljust(_padded_size(len(data)), b"\0")
+
+
+def _to_little_endian(values: array[int]) -> bytes:
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+
+    return values.tobytes()
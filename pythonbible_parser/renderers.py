@@ -0,0 +1,181 @@
+"""Contains the renderers and the names of the available renderings.
+
+A rendering is one of the output formats of a parsed version of the Bible. The
+"readers" renderings do not include verse numbers, and the "notes" renderings
+include the text of the notes.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pythonbible_parser import events
+from pythonbible_parser.errors import InvalidRenderingError
+from pythonbible_parser.output_buffer import OutputBuffer
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pythonbible_parser.events import Event
+
+RENDERINGS: tuple[str, ...] = (
+    "html",
+    "html_readers",
+    "html_notes",
+    "plain_text",
+    "plain_text_readers",
+    "plain_text_notes",
+)
+
+HTML_P_OPEN = "<p>"
+HTML_P_CLOSE = "</p>"
+HTML_NEWLINE = "<br/>"
+
+PLAIN_NEWLINE = "\n"
+
+
+def get_renderings(renderings: Iterable[str] | None = None) -> tuple[str, ...]:
+    """Validate the given rendering names and return them in canonical order.
+
+    :param renderings: the rendering names, or None for all renderings
+    :return: the rendering names in the order of RENDERINGS
+    :raises InvalidRenderingError: if a rendering name is not valid
+    """
+    if renderings is None:
+        return RENDERINGS
+
+    rendering_names: set[str] = set(renderings)
+    invalid_names: set[str] = rendering_names.difference(RENDERINGS)
+
+    if invalid_names:
+        msg = f"Invalid rendering(s): {', '.join(sorted(invalid_names))}."
+        raise InvalidRenderingError(msg)
+
+    return tuple(rendering for rendering in RENDERINGS if rendering in rendering_names)
+
+
+def is_html_rendering(rendering: str) -> bool:
+    return rendering.startswith("html")
+
+
+def get_renderer(rendering: str, offset: int = 0) -> Renderer:
+    """Return a new renderer for the given rendering.
+
+    :param rendering: the name of the rendering
+    :param offset: the offset of the first character of the output
+    :return: an HTMLRenderer or a PlainTextRenderer
+    """
+    if is_html_rendering(rendering):
+        return HTMLRenderer(rendering, offset)
+
+    return PlainTextRenderer(rendering, offset)
+
+
+class Renderer:
+    """Build the text and verse indices of a single rendering from book events.
+
+    The text is accumulated in an OutputBuffer and the verse indices are shifted
+    by the given offset. Subclasses define how paragraphs and verse numbers are
+    formatted.
+    """
+
+    paragraph_open: str = ""
+    paragraph_close: str = ""
+    verse_number_format: str = "{}"
+    no_space_before_verse: tuple[str, ...] = ()
+    no_space_before_text: tuple[str, ...] = ()
+
+    def __init__(self: Renderer, rendering: str, offset: int = 0) -> None:
+        """Initialize the Renderer.
+
+        :param rendering: the name of the rendering
+        :param offset: the offset of the first character of the output
+        """
+        self.rendering: str = rendering
+        self.offset: int = offset
+        self.include_verse_numbers: bool = not rendering.endswith("_readers")
+        self.include_notes: bool = rendering.endswith("_notes")
+
+        self.buffer: OutputBuffer = OutputBuffer()
+        self.verse_start_indices: dict[int, int] = {}
+        self.verse_end_indices: dict[int, int] = {}
+
+    def render(self: Renderer, book_events: Iterable[Event]) -> None:
+        """Append the output of the given events.
+
+        :param book_events: the events of a book, as emitted by OSISBookParser
+        """
+        text_kinds: set[int] = (
+            {events.TEXT, events.NOTE_TEXT} if self.include_notes else {events.TEXT}
+        )
+        append_text = self.append_text
+
+        for kind, value, argument in book_events:
+            if kind in text_kinds:
+                append_text(value, argument)
+            elif kind == events.VERSE_START:
+                self.start_verse(value, argument)
+            elif kind == events.VERSE_END:
+                self.end_verse(value)
+            elif kind == events.PARAGRAPH_OPEN:
+                self.open_paragraph()
+            elif kind == events.PARAGRAPH_CLOSE:
+                self.close_paragraph()
+
+    def open_paragraph(self: Renderer) -> None:
+        self.buffer.append(self.paragraph_open)
+
+    def close_paragraph(self: Renderer) -> None:
+        self.buffer.append(self.paragraph_close)
+
+    def start_verse(self: Renderer, verse_id: int, verse_number: int) -> None:
+        self.verse_start_indices[verse_id] = len(self.buffer) + self.offset
+
+        if not self.include_verse_numbers:
+            return
+
+        if self.buffer and not self.buffer.endswith(self.no_space_before_verse):
+            self.buffer.append(" ")
+
+        self.buffer.append(self.verse_number_format.format(verse_number))
+
+    def end_verse(self: Renderer, verse_id: int) -> None:
+        self.verse_end_indices[verse_id] = len(self.buffer) + self.offset
+
+    def append_text(self: Renderer, text: str, separate: bool) -> None:
+        """Append the given text.
+
+        :param text: the text to append
+        :param separate: True to separate the text from the previous text with a
+        space, unless the output is at the start of a line
+        """
+        if (
+            separate
+            and self.buffer
+            and not self.buffer.endswith(self.no_space_before_text)
+        ):
+            self.buffer.append(" ")
+
+        self.buffer.append(text)
+
+    def get_text(self: Renderer) -> str:
+        return self.buffer.getvalue()
+
+
+class HTMLRenderer(Renderer):
+    """Render paragraphs as <p> elements and verse numbers as superscripts."""
+
+    paragraph_open = HTML_P_OPEN
+    paragraph_close = HTML_P_CLOSE
+    verse_number_format = "<sup>{}</sup>"
+    no_space_before_verse = (HTML_P_CLOSE, HTML_P_OPEN)
+    no_space_before_text = (HTML_NEWLINE, HTML_P_CLOSE)
+
+
+class PlainTextRenderer(Renderer):
+    """Render paragraphs as new lines and verse numbers followed by a period."""
+
+    paragraph_open = PLAIN_NEWLINE
+    verse_number_format = "{}."
+    no_space_before_verse = (PLAIN_NEWLINE,)
+    no_space_before_text = (PLAIN_NEWLINE,)
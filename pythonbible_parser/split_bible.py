@@ -0,0 +1,284 @@
+"""Write and read a rendering of a version of the Bible split into one file per book.
+
+A service that only uses a few books does not need the text of the whole Bible
+in memory. The rendering is written to a folder with:
+
+* a manifest (manifest.marshal): the format version, the version name, the HTML
+  flag, the titles of each book, and the file name, start index and end index in
+  the text of the rendering of each book
+* one data file per book (e.g. genesis.marshal): the text of the book and the
+  start and end index of each of its verses
+
+The verse indices are indices in the text of the whole rendering, as in the
+other output formats, so a range of verses across books is read by joining the
+texts of the books it spans. SplitBible only loads the manifest when it is
+opened, and loads the data file of a book the first time a verse in it is
+requested.
+"""
+
+from __future__ import annotations
+
+import marshal
+from typing import TYPE_CHECKING
+from typing import Any
+
+import pythonbible as bible
+
+from pythonbible_parser.errors import InvalidSplitBibleError
+from pythonbible_parser.packed_bible import clean_scripture
+from pythonbible_parser.packed_bible import validate_verse_ids
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+FORMAT_VERSION: int = 1
+BOOK_ID_DIVISOR: int = 1_000_000
+MANIFEST_FILENAME: str = "manifest.marshal"
+FILE_EXTENSION: str = ".marshal"
+
+# The positions of the text and verse indices in the data of a book.
+TEXT: int = 0
+START_INDICES: int = 1
+END_INDICES: int = 2
+
+
+def write_split_bible(
+    folder: Path,
+    version: bible.Version,
+    scripture_content: str,
+    verse_start_indices: dict[int, int],
+    verse_end_indices: dict[int, int],
+    *,
+    is_html: bool = False,
+    short_titles: dict[bible.Book, str] | None = None,
+    long_titles: dict[bible.Book, str] | None = None,
+) -> None:
+    """Write a rendering of a version of the Bible to a manifest and book files.
+
+    The arguments are the same as the arguments of pythonbible's Bible class,
+    plus the folder to write to and the titles of the books.
+
+    :param folder: the folder of the rendering (created if it does not exist)
+    :param version: the version of the Bible
+    :param scripture_content: the text of the rendering
+    :param verse_start_indices: the index of the start of each verse in the text
+    :param verse_end_indices: the index of the end of each verse in the text
+    :param is_html: True if the text is HTML
+    :param short_titles: the short title of each book
+    :param long_titles: the long title of each book
+    """
+    folder.mkdir(parents=True, exist_ok=True)
+    book_start_indices: dict[int, dict[int, int]] = _group_by_book(verse_start_indices)
+    book_end_indices: dict[int, dict[int, int]] = _group_by_book(verse_end_indices)
+    books: list[tuple[int, str, int, int]] = []
+
+    for book_id, (start, end) in _get_book_ranges(
+        scripture_content,
+        verse_start_indices,
+    ).items():
+        filename: str = f"{bible.Book(book_id).name.lower()}{FILE_EXTENSION}"
+        book_data: tuple[str, dict[int, int], dict[int, int]] = (
+            scripture_content[start:end],
+            book_start_indices.get(book_id, {}),
+            book_end_indices.get(book_id, {}),
+        )
+        (folder / filename).write_bytes(marshal.dumps(book_data))
+        books.append((book_id, filename, start, end))
+
+    manifest: dict[str, Any] = {
+        "format_version": FORMAT_VERSION,
+        "version": version.value,
+        "is_html": is_html,
+        "books": books,
+        "short_titles": _get_titles(short_titles),
+        "long_titles": _get_titles(long_titles),
+    }
+    (folder / MANIFEST_FILENAME).write_bytes(marshal.dumps(manifest))
+
+
+class SplitBible:
+    """A rendering of a version of the Bible read from a manifest and book files.
+
+    SplitBible has the same get_scripture() method as pythonbible's Bible class.
+    Only the manifest is loaded when it is created; the text and verse indices of
+    a book are loaded the first time a verse in it is requested and then kept, so
+    memory use grows with the books that are actually used.
+    """
+
+    def __init__(self: SplitBible, folder: Path) -> None:
+        """Load the manifest of the rendering.
+
+        :param folder: the folder of the rendering
+        :raises InvalidSplitBibleError: if the folder has no valid manifest
+        """
+        self.folder: Path = folder
+
+        try:
+            manifest: Any = marshal.loads((folder / MANIFEST_FILENAME).read_bytes())
+            format_version: int = manifest["format_version"]
+        except (OSError, EOFError, ValueError, TypeError, KeyError) as error:
+            msg = f"{folder} does not contain a valid split Bible manifest."
+            raise InvalidSplitBibleError(msg) from error
+
+        if format_version != FORMAT_VERSION:
+            msg = f"{folder} is not a split Bible of version {FORMAT_VERSION}."
+            raise InvalidSplitBibleError(msg)
+
+        self.version: bible.Version = bible.Version(manifest["version"])
+        self.is_html: bool = manifest["is_html"]
+        self.short_titles: dict[bible.Book, str] = {
+            bible.Book(book_id): title
+            for book_id, title in manifest["short_titles"].items()
+        }
+        self.long_titles: dict[bible.Book, str] = {
+            bible.Book(book_id): title
+            for book_id, title in manifest["long_titles"].items()
+        }
+
+        self._book_ids: list[int] = []
+        self._book_files: dict[int, tuple[str, int, int]] = {}
+
+        for book_id, filename, start, end in manifest["books"]:
+            self._book_ids.append(book_id)
+            self._book_files[book_id] = (filename, start, end)
+
+        self._books: dict[int, tuple[str, dict[int, int], dict[int, int]]] = {}
+
+    @property
+    def loaded_books(self: SplitBible) -> list[bible.Book]:
+        """The books that have been loaded, in canonical order."""
+        return [
+            bible.Book(book_id) for book_id in self._book_ids if book_id in self._books
+        ]
+
+    def get_scripture(
+        self: SplitBible,
+        start_verse_id: int,
+        end_verse_id: int | None = None,
+    ) -> str:
+        """Return the text from the start of a verse to the end of another verse.
+
+        :param start_verse_id: the id of the first verse
+        :param end_verse_id: the id of the last verse (defaults to the first verse)
+        :return: the text of the verses
+        :raises InvalidVerseError: if a verse id is not valid
+        :raises VersionMissingVerseError: if a verse is not in this version
+        """
+        end_verse_id = end_verse_id or start_verse_id
+
+        # Every verse in the files is valid, so the verse ids only need to be
+        # validated (which is slow in pythonbible) if one of them is missing.
+        try:
+            start_index: int = self._get_index(start_verse_id, START_INDICES)
+            end_index: int = self._get_index(end_verse_id, END_INDICES)
+        except bible.VersionMissingVerseError:
+            validate_verse_ids(start_verse_id, end_verse_id)
+            raise
+
+        return clean_scripture(
+            self._get_text(
+                start_verse_id // BOOK_ID_DIVISOR,
+                end_verse_id // BOOK_ID_DIVISOR,
+                start_index,
+                end_index,
+            ),
+            self.is_html,
+        )
+
+    def load_book(
+        self: SplitBible,
+        book_id: int,
+    ) -> tuple[str, dict[int, int], dict[int, int]]:
+        """Return the text and verse indices of a book, loading them if needed.
+
+        :param book_id: the id of the book (its pythonbible Book value)
+        :return: the text of the book and the start and end index of each verse
+        :raises KeyError: if the book is not in this rendering
+        """
+        book_data = self._books.get(book_id)
+
+        if book_data is None:
+            filename, _, _ = self._book_files[book_id]
+            book_data = marshal.loads((self.folder / filename).read_bytes())
+            self._books[book_id] = book_data
+
+        return book_data
+
+    def unload(self: SplitBible) -> None:
+        """Forget the loaded books, so they are loaded again when next used."""
+        self._books.clear()
+
+    def _get_index(self: SplitBible, verse_id: int, indices: int) -> int:
+        book_id: int = verse_id // BOOK_ID_DIVISOR
+
+        if book_id in self._book_files:
+            index: int | None = self.load_book(book_id)[indices].get(verse_id)
+
+            if index is not None:
+                return index
+
+        raise bible.VersionMissingVerseError(self.version.value, verse_id)
+
+    def _get_text(
+        self: SplitBible,
+        start_book_id: int,
+        end_book_id: int,
+        start_index: int,
+        end_index: int,
+    ) -> str:
+        if end_index <= start_index:
+            return ""
+
+        _, book_start, _ = self._book_files[start_book_id]
+
+        # Most ranges are in a single book, so slice it without copying it first.
+        if start_book_id == end_book_id:
+            return self.load_book(start_book_id)[TEXT][
+                start_index - book_start : end_index - book_start
+            ]
+
+        text: str = "".join(
+            self.load_book(book_id)[TEXT]
+            for book_id in self._book_ids
+            if start_book_id <= book_id <= end_book_id
+        )
+
+        return text[start_index - book_start : end_index - book_start]
+
+
+def _get_book_ranges(
+    scripture_content: str,
+    verse_start_indices: dict[int, int],
+) -> dict[int, tuple[int, int]]:
+    """Return the start and end index in the text of each book, in text order.
+
+    Each book starts at its first verse, except the first book, which starts at
+    the beginning of the text, and ends where the next book starts.
+    """
+    book_starts: dict[int, int] = {}
+
+    for verse_id, start_index in verse_start_indices.items():
+        book_id: int = verse_id // BOOK_ID_DIVISOR
+        book_starts[book_id] = min(start_index, book_starts.get(book_id, start_index))
+
+    book_ids: list[int] = sorted(book_starts, key=book_starts.__getitem__)
+    ends: list[int] = [book_starts[book_id] for book_id in book_ids[1:]]
+    ends.append(len(scripture_content))
+
+    return {
+        book_id: (0 if position == 0 else book_starts[book_id], ends[position])
+        for position, book_id in enumerate(book_ids)
+    }
+
+
+def _group_by_book(indices: dict[int, int]) -> dict[int, dict[int, int]]:
+    book_indices: dict[int, dict[int, int]] = {}
+
+    for verse_id, index in indices.items():
+        book_indices.setdefault(verse_id // BOOK_ID_DIVISOR, {})[verse_id] = index
+
+    return book_indices
+
+
+def _get_titles(titles: dict[bible.Book, str] | None) -> dict[int, str]:
+    return {book.value: title for book, title in (titles or {}).items()}
@@ -0,0 +1,145 @@
+"""Export parsed versions of the Bible to a SQLite database.
+
+Several versions can be written to the same database. The database contains:
+
+* verses: one row per verse and version, with its plain text (without verse
+  numbers) and its HTML
+* titles: the short and long title of each book of each version
+* verses_fts: an FTS5 full-text index of the plain text of the verses
+
+For example, to search every version for a phrase::
+
+    SELECT verses.version, verses.verse_id, verses.plain_text
+    FROM verses_fts JOIN verses ON verses.id = verses_fts.rowid
+    WHERE verses_fts MATCH '"in the beginning"'
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    import pythonbible as bible
+
+DATABASE_FILENAME: str = "bible.sqlite"
+TIMEOUT: float = 60.0
+
+SCHEMA: tuple[str, ...] = (
+    """
+    CREATE TABLE IF NOT EXISTS verses (
+        id INTEGER PRIMARY KEY,
+        version TEXT NOT NULL,
+        verse_id INTEGER NOT NULL,
+        book INTEGER NOT NULL,
+        chapter INTEGER NOT NULL,
+        verse INTEGER NOT NULL,
+        plain_text TEXT,
+        html TEXT,
+        UNIQUE (version, verse_id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS titles (
+        version TEXT NOT NULL,
+        book INTEGER NOT NULL,
+        short_title TEXT NOT NULL,
+        long_title TEXT NOT NULL,
+        PRIMARY KEY (version, book)
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS verses_fts USING fts5(
+        plain_text,
+        content='verses',
+        content_rowid='id'
+    )
+    """,
+)
+
+DELETE_VERSION: tuple[str, ...] = (
+    # Rows of an external content FTS5 table are deleted with their old values.
+    (
+        "INSERT INTO verses_fts(verses_fts, rowid, plain_text) "
+        "SELECT 'delete', id, plain_text FROM verses WHERE version = ?"
+    ),
+    "DELETE FROM verses WHERE version = ?",
+    "DELETE FROM titles WHERE version = ?",
+)
+INSERT_VERSE: str = (
+    "INSERT INTO verses (version, verse_id, book, chapter, verse, plain_text, html) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+INSERT_TITLE: str = (
+    "INSERT INTO titles (version, book, short_title, long_title) VALUES (?, ?, ?, ?)"
+)
+INDEX_VERSION: str = (
+    "INSERT INTO verses_fts(rowid, plain_text) "
+    "SELECT id, plain_text FROM verses WHERE version = ?"
+)
+
+
+def write_sqlite(
+    database_path: Path,
+    version: bible.Version,
+    verses: Iterable[tuple[int, str | None, str | None]],
+    short_titles: dict[bible.Book, str],
+    long_titles: dict[bible.Book, str],
+) -> None:
+    """Write a version of the Bible to a SQLite database.
+
+    The database and its tables are created if they do not exist yet, and any
+    rows of the same version are replaced. Everything is written in a single
+    transaction, so readers never see a partially written version.
+
+    :param database_path: the path of the SQLite database
+    :param version: the version of the Bible
+    :param verses: the verse id, plain text and HTML of each verse, in any order
+    :param short_titles: the short title of each book
+    :param long_titles: the long title of each book
+    """
+    connection = sqlite3.connect(database_path, timeout=TIMEOUT, isolation_level=None)
+
+    try:
+        for statement in SCHEMA:
+            connection.execute(statement)
+
+        # Take the write lock up front, so concurrent writers wait for each other.
+        connection.execute("BEGIN IMMEDIATE")
+
+        try:
+            for statement in DELETE_VERSION:
+                connection.execute(statement, (version.value,))
+
+            connection.executemany(INSERT_VERSE, _get_verse_rows(version, verses))
+            connection.execute(INDEX_VERSION, (version.value,))
+            connection.executemany(
+                INSERT_TITLE,
+                (
+                    (version.value, book.value, short_title, long_titles.get(book, ""))
+                    for book, short_title in short_titles.items()
+                ),
+            )
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        connection.execute("COMMIT")
+    finally:
+        connection.close()
+
+
+def _get_verse_rows(
+    version: bible.Version,
+    verses: Iterable[tuple[int, str | None, str | None]],
+) -> Iterator[tuple[str, int, int, int, int, str | None, str | None]]:
+    # Verse ids are book * 1,000,000 + chapter * 1,000 + verse. Decoding them here
+    # is much faster than pythonbible.get_book_chapter_verse, which validates them.
+    for verse_id, plain_text, html in verses:
+        book_and_chapter, verse = divmod(verse_id, 1000)
+        book, chapter = divmod(book_and_chapter, 1000)
+        yield version.value, verse_id, book, chapter, verse, plain_text, html
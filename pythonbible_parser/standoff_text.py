@@ -0,0 +1,321 @@
+"""Contains a store of a parsed version with one canonical text and overlays.
+
+The six renderings of a version are mostly the same text: they only differ in
+their verse numbers, notes and paragraph markup. StandoffText keeps that text
+once, and keeps everything else in standoff overlay tables that point into it:
+
+* the pieces of text, with the offset of each piece in the canonical text and
+  whether it is the text of a note (the note spans) and separated from the
+  previous piece by a space
+* the markers between pieces: paragraph boundaries, verse starts (with their
+  verse numbers), verse ends and titles, each with the number of pieces before it
+
+The events of each book are rebuilt from these tables on demand, and any
+rendering is built from them by the same renderers as the parser uses, so it is
+identical to the rendering built by OSISParser.
+
+get_scripture() only renders the books of the requested verses, and keeps the
+most recently used rendered books in a least recently used cache, so serving
+verses does not need a whole rendering in memory. render() and get_bible() build
+a whole rendering, which is as large as the text of the version again.
+"""
+
+from __future__ import annotations
+
+from array import array
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import pythonbible as bible
+
+from pythonbible_parser import events
+from pythonbible_parser.output_buffer import OutputBuffer
+from pythonbible_parser.packed_bible import clean_scripture
+from pythonbible_parser.packed_bible import validate_verse_ids
+from pythonbible_parser.renderers import get_renderer
+from pythonbible_parser.renderers import get_renderings
+from pythonbible_parser.renderers import is_html_rendering
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from pythonbible_parser.events import Event
+
+SEPARATE_FLAG: int = 0x01
+NOTE_FLAG: int = 0x02
+BOOK_ID_DIVISOR: int = 1_000_000
+DEFAULT_CACHE_SIZE: int = 8
+
+
+class StandoffText:
+    """The canonical text of a parsed version and its standoff overlays."""
+
+    def __init__(
+        self: StandoffText,
+        version: bible.Version,
+        book_events: Iterable[tuple[bible.Book, list[Event]]],
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ) -> None:
+        """Build the canonical text and the overlays from the events of each book.
+
+        :param version: the version of the Bible
+        :param book_events: each book and its events, as emitted by OSISBookParser
+        :param cache_size: the number of rendered books get_scripture() keeps
+        """
+        self.version: bible.Version = version
+        self.titles: list[tuple[str, str]] = []
+
+        self._piece_starts: array[int] = array("I")
+        self._piece_flags: bytearray = bytearray()
+        self._marker_kinds: bytearray = bytearray()
+        self._marker_pieces: array[int] = array("I")
+        self._marker_values: array[int] = array("I")
+        self._marker_arguments: array[int] = array("I")
+        self._book_ranges: dict[bible.Book, tuple[int, int, int, int]] = {}
+
+        buffer = OutputBuffer()
+
+        for book, events_of_book in book_events:
+            first_piece: int = len(self._piece_starts)
+            first_marker: int = len(self._marker_kinds)
+
+            for kind, value, argument in events_of_book:
+                if kind in {events.TEXT, events.NOTE_TEXT}:
+                    self._piece_starts.append(len(buffer))
+                    self._piece_flags.append(
+                        (SEPARATE_FLAG if argument else 0)
+                        | (NOTE_FLAG if kind == events.NOTE_TEXT else 0),
+                    )
+                    buffer.append(value)
+                else:
+                    self._add_marker(kind, value, argument)
+
+            self._book_ranges[book] = (
+                first_piece,
+                len(self._piece_starts),
+                first_marker,
+                len(self._marker_kinds),
+            )
+
+        self.text: str = buffer.getvalue()
+        self.get_rendered_book: Callable[
+            [str, bible.Book],
+            tuple[str, dict[int, int], dict[int, int]],
+        ] = lru_cache(maxsize=cache_size)(self.render_book)
+
+    @property
+    def books(self: StandoffText) -> list[bible.Book]:
+        """The books of the version, in canonical order."""
+        return [book for book in bible.Book if book in self._book_ranges]
+
+    def iter_book_events(
+        self: StandoffText,
+    ) -> Iterator[tuple[bible.Book, list[Event]]]:
+        """Yield each book and its events, in canonical order.
+
+        :return: an iterator over each book and its events
+        """
+        for book in self.books:
+            yield book, self.get_book_events(book)
+
+    def get_book_events(self: StandoffText, book: bible.Book) -> list[Event]:
+        """Return the events of a book, as OSISBookParser emitted them.
+
+        :param book: the book
+        :return: the events of the book
+        """
+        piece, last_piece, marker, last_marker = self._book_ranges[book]
+        book_events: list[Event] = []
+
+        while piece < last_piece or marker < last_marker:
+            if marker < last_marker and (
+                piece == last_piece or self._marker_pieces[marker] <= piece
+            ):
+                book_events.append(self._get_marker_event(marker))
+                marker += 1
+            else:
+                book_events.append(self._get_piece_event(piece))
+                piece += 1
+
+        return book_events
+
+    def get_scripture(
+        self: StandoffText,
+        rendering: str,
+        start_verse_id: int,
+        end_verse_id: int | None = None,
+    ) -> str:
+        """Return the text of a rendering from the start of a verse to the end of one.
+
+        The result is the same as the result of pythonbible's Bible.get_scripture()
+        on the whole rendering, but only the books from the first to the last
+        verse are rendered.
+
+        :param rendering: the name of the rendering
+        :param start_verse_id: the id of the first verse
+        :param end_verse_id: the id of the last verse (defaults to the first verse)
+        :return: the text of the verses
+        :raises InvalidRenderingError: if the rendering is not valid
+        :raises InvalidVerseError: if a verse id is not valid
+        :raises VersionMissingVerseError: if a verse is not in this version
+        """
+        get_renderings([rendering])
+        end_verse_id = end_verse_id or start_verse_id
+        start_book: bible.Book | None = self._get_book(start_verse_id)
+        end_book: bible.Book | None = self._get_book(end_verse_id)
+        verse_start_indices: dict[int, int] = (
+            self.get_rendered_book(rendering, start_book)[1] if start_book else {}
+        )
+        verse_end_indices: dict[int, int] = (
+            self.get_rendered_book(rendering, end_book)[2] if end_book else {}
+        )
+
+        # The verse ids only need to be validated (which is slow in pythonbible)
+        # if one of them is missing.
+        for verse_id, indices in (
+            (start_verse_id, verse_start_indices),
+            (end_verse_id, verse_end_indices),
+        ):
+            if verse_id not in indices:
+                validate_verse_ids(start_verse_id, end_verse_id)
+                raise bible.VersionMissingVerseError(self.version.value, verse_id)
+
+        books: list[bible.Book] = self.books
+        parts: list[str] = [
+            self.get_rendered_book(rendering, book)[0]
+            for book in books[books.index(start_book) : books.index(end_book) + 1]
+        ]
+
+        if not parts:
+            return ""
+
+        # The end index is in the last book, after the text of the other books.
+        end_book_offset: int = sum(len(part) for part in parts[:-1])
+        scripture_content: str = "".join(parts)[
+            verse_start_indices[start_verse_id] : end_book_offset
+            + verse_end_indices[end_verse_id]
+        ]
+
+        return clean_scripture(scripture_content, is_html_rendering(rendering))
+
+    def render_book(
+        self: StandoffText,
+        rendering: str,
+        book: bible.Book,
+    ) -> tuple[str, dict[int, int], dict[int, int]]:
+        """Build a rendering of a single book.
+
+        :param rendering: the name of the rendering
+        :param book: the book
+        :return: the text, verse start indices and verse end indices of the
+        rendering of the book, with indices from the start of the book
+        :raises InvalidRenderingError: if the rendering is not valid
+        """
+        get_renderings([rendering])
+        renderer = get_renderer(rendering)
+        renderer.render(self.get_book_events(book))
+        return (
+            renderer.get_text(),
+            renderer.verse_start_indices,
+            renderer.verse_end_indices,
+        )
+
+    def render(
+        self: StandoffText,
+        rendering: str,
+    ) -> tuple[str, dict[int, int], dict[int, int]]:
+        """Build a rendering of the version.
+
+        The whole rendering is built, so it takes as much memory as the text again;
+        use get_scripture() to serve verses.
+
+        :param rendering: the name of the rendering
+        :return: the text, verse start indices and verse end indices of the rendering
+        :raises InvalidRenderingError: if the rendering is not valid
+        """
+        get_renderings([rendering])
+        buffer = OutputBuffer()
+        verse_start_indices: dict[int, int] = {}
+        verse_end_indices: dict[int, int] = {}
+
+        for _, book_events in self.iter_book_events():
+            renderer = get_renderer(rendering, len(buffer))
+            renderer.render(book_events)
+            buffer.append(renderer.get_text())
+            verse_start_indices.update(renderer.verse_start_indices)
+            verse_end_indices.update(renderer.verse_end_indices)
+
+        return buffer.getvalue(), verse_start_indices, verse_end_indices
+
+    def get_bible(self: StandoffText, rendering: str) -> bible.Bible:
+        """Build a rendering of the version and return it as a pythonbible Bible.
+
+        As with render(), the whole rendering is built and kept by the Bible.
+
+        :param rendering: the name of the rendering
+        :return: the Bible of the rendering
+        :raises InvalidRenderingError: if the rendering is not valid
+        """
+        text, verse_start_indices, verse_end_indices = self.render(rendering)
+        return bible.Bible(
+            self.version,
+            text,
+            verse_start_indices,
+            verse_end_indices,
+            is_html_rendering(rendering),
+        )
+
+    def _get_book(self: StandoffText, verse_id: int) -> bible.Book | None:
+        try:
+            book = bible.Book(verse_id // BOOK_ID_DIVISOR)
+        except ValueError:
+            return None
+
+        return book if book in self._book_ranges else None
+
+    def _add_marker(
+        self: StandoffText,
+        kind: int,
+        value: object,
+        argument: object,
+    ) -> None:
+        if kind == events.TITLE:
+            self.titles.append((value, argument))
+            value = len(self.titles) - 1
+            argument = 0
+
+        self._marker_kinds.append(kind)
+        self._marker_pieces.append(len(self._piece_starts))
+        self._marker_values.append(value or 0)
+        self._marker_arguments.append(argument or 0)
+
+    def _get_marker_event(self: StandoffText, marker: int) -> Event:
+        kind: int = self._marker_kinds[marker]
+
+        if kind == events.VERSE_START:
+            return (kind, self._marker_values[marker], self._marker_arguments[marker])
+
+        if kind == events.VERSE_END:
+            return (kind, self._marker_values[marker], None)
+
+        if kind == events.TITLE:
+            return (kind, *self.titles[self._marker_values[marker]])
+
+        return (kind, None, None)
+
+    def _get_piece_event(self: StandoffText, piece: int) -> Event:
+        start: int = self._piece_starts[piece]
+        end: int = (
+            self._piece_starts[piece + 1]
+            if piece + 1 < len(self._piece_starts)
+            else len(self.text)
+        )
+        flags: int = self._piece_flags[piece]
+
+        return (
+            events.NOTE_TEXT if flags & NOTE_FLAG else events.TEXT,
+            self.text[start:end],
+            bool(flags & SEPARATE_FLAG),
+        )
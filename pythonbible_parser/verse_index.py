@@ -0,0 +1,216 @@
+"""Contains a compact index of the start and end of each verse in a text.
+
+A dict of verse indices keeps a boxed int for every key and value, and a version
+of the Bible has two of them per rendering. VerseIndex keeps the same indices in
+three arrays instead:
+
+* the sorted verse ids
+* the index of the start of each verse in the text (or MISSING)
+* the end of each verse, as its distance to the start of the next verse
+
+Most verses end where the next verse starts, so the distances are small and are
+stored in the smallest integer type that holds all of them.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterator
+
+MISSING: int = -1
+TYPECODES: tuple[str, ...] = ("b", "h", "i", "q")
+
+
+class VerseIndex:
+    """The start and end index of each verse of a rendering, in compact arrays.
+
+    The verse_start_indices and verse_end_indices attributes are read-only
+    mappings that can be used in place of the dicts they were built from, e.g.
+    to create a pythonbible Bible.
+    """
+
+    def __init__(
+        self: VerseIndex,
+        verse_start_indices: Mapping[int, int],
+        verse_end_indices: Mapping[int, int],
+    ) -> None:
+        """Build the index.
+
+        :param verse_start_indices: the index of the start of each verse
+        :param verse_end_indices: the index of the end of each verse
+        """
+        verse_ids: list[int] = sorted({*verse_start_indices, *verse_end_indices})
+        starts: list[int] = [
+            verse_start_indices.get(verse_id, MISSING) for verse_id in verse_ids
+        ]
+        self._verse_ids: array[int] = _get_array(verse_ids)
+        self._starts: array[int] = _get_array(starts)
+        self._missing_ends: frozenset[int] = frozenset(
+            position
+            for position, verse_id in enumerate(verse_ids)
+            if verse_id not in verse_end_indices
+        )
+        self._end_distances: array[int] = _get_array(
+            [
+                self._get_next_start(position) - verse_end_indices.get(verse_id, 0)
+                for position, verse_id in enumerate(verse_ids)
+            ],
+        )
+
+        self.verse_start_indices: VerseIndexView = VerseIndexView(
+            self,
+            self.get_start,
+            len(verse_ids) - starts.count(MISSING),
+        )
+        self.verse_end_indices: VerseIndexView = VerseIndexView(
+            self,
+            self.get_end,
+            len(verse_ids) - len(self._missing_ends),
+        )
+
+    def __len__(self: VerseIndex) -> int:
+        """Return the number of verses."""
+        return len(self._verse_ids)
+
+    def __iter__(self: VerseIndex) -> Iterator[int]:
+        """Return an iterator over the sorted verse ids."""
+        return iter(self._verse_ids)
+
+    def __contains__(self: VerseIndex, verse_id: object) -> bool:
+        """Return True if the verse has a start or an end index."""
+        return self._get_position(verse_id) is not None
+
+    @property
+    def nbytes(self: VerseIndex) -> int:
+        """The number of bytes used by the arrays of the index."""
+        return sum(
+            len(values) * values.itemsize
+            for values in (self._verse_ids, self._starts, self._end_distances)
+        )
+
+    def get_start(self: VerseIndex, verse_id: int) -> int | None:
+        """Return the index of the start of the verse, or None if it has none.
+
+        :param verse_id: the id of the verse
+        :return: the index of the start of the verse in the text
+        """
+        position: int | None = self._get_position(verse_id)
+
+        if position is None or self._starts[position] == MISSING:
+            return None
+
+        return self._starts[position]
+
+    def get_end(self: VerseIndex, verse_id: int) -> int | None:
+        """Return the index of the end of the verse, or None if it has none.
+
+        :param verse_id: the id of the verse
+        :return: the index of the end of the verse in the text
+        """
+        position: int | None = self._get_position(verse_id)
+
+        if position is None or position in self._missing_ends:
+            return None
+
+        return self._get_next_start(position) - self._end_distances[position]
+
+    def _get_position(self: VerseIndex, verse_id: object) -> int | None:
+        if not isinstance(verse_id, int):
+            return None
+
+        position: int = bisect_left(self._verse_ids, verse_id)
+
+        if position < len(self._verse_ids) and self._verse_ids[position] == verse_id:
+            return position
+
+        return None
+
+    def _get_next_start(self: VerseIndex, position: int) -> int:
+        """Return the index the end of the verse is stored relative to.
+
+        That is the start of the next verse, or the start of the verse itself for
+        the last verse and before a verse without a start.
+        """
+        for next_position in (position + 1, position):
+            if next_position < len(self._starts):
+                start: int = self._starts[next_position]
+
+                if start != MISSING:
+                    return start
+
+        return 0
+
+
+class VerseIndexView(Mapping):
+    """A read-only mapping of verse ids to the start or end indices of a VerseIndex."""
+
+    def __init__(
+        self: VerseIndexView,
+        verse_index: VerseIndex,
+        get_index: Callable[[int], int | None],
+        length: int,
+    ) -> None:
+        """Initialize the view.
+
+        :param verse_index: the verse index
+        :param get_index: VerseIndex.get_start or VerseIndex.get_end
+        :param length: the number of verses with an index
+        """
+        self._verse_index: VerseIndex = verse_index
+        self.get_index: Callable[[int], int | None] = get_index
+        self._length: int = length
+
+    def __getitem__(self: VerseIndexView, verse_id: int) -> int:
+        """Return the start or end index of the verse."""
+        index: int | None = self.get_index(verse_id)
+
+        if index is None:
+            raise KeyError(verse_id)
+
+        return index
+
+    def __iter__(self: VerseIndexView) -> Iterator[int]:
+        """Return an iterator over the sorted ids of the verses with an index."""
+        return (
+            verse_id
+            for verse_id in self._verse_index
+            if self.get_index(verse_id) is not None
+        )
+
+    def __contains__(self: VerseIndexView, verse_id: object) -> bool:
+        """Return True if the verse has an index."""
+        return self.get_index(verse_id) is not None
+
+    def __len__(self: VerseIndexView) -> int:
+        """Return the number of verses with an index."""
+        return self._length
+
+    def __repr__(self: VerseIndexView) -> str:
+        """Return the representation of the equivalent dict."""
+        return repr(dict(self.items()))
+
+    def get(
+        self: VerseIndexView,
+        verse_id: int,
+        default: int | None = None,
+    ) -> int | None:
+        """Return the start or end index of the verse, or the default."""
+        index: int | None = self.get_index(verse_id)
+        return default if index is None else index
+
+
+def _get_array(values: list[int]) -> array[int]:
+    """Return the values in an array of the smallest type that holds all of them."""
+    for typecode in TYPECODES[:-1]:
+        try:
+            return array(typecode, values)
+        except OverflowError:
+            continue
+
+    return array(TYPECODES[-1], values)
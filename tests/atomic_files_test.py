@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+import pytest
+
+from pythonbible_parser.atomic_files import AtomicFiles
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize("fsync", [False, True])
+def test_atomic_files(tmp_path: Path, fsync: bool) -> None:
+    # Given an existing file
+    (tmp_path / "html.py").write_text("old", encoding="utf-8")
+
+    # When we write it and a new file in parallel threads
+    with AtomicFiles(fsync) as files:
+
+        def write(name: str) -> None:
+            with files.open(tmp_path / name, encoding="utf-8") as writer:
+                writer.write(f"new {name}")
+
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(write, ["html.py", "titles.py"]))
+
+        # Then the files are not changed until the context exits
+        assert (tmp_path / "html.py").read_text(encoding="utf-8") == "old"
+        assert not (tmp_path / "titles.py").exists()
+
+    # And then both files are written, without any temporary file left
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["html.py", "titles.py"]
+    assert (tmp_path / "html.py").read_text(encoding="utf-8") == "new html.py"
+    assert (tmp_path / "titles.py").read_text(encoding="utf-8") == "new titles.py"
+
+
+def test_atomic_files_error(tmp_path: Path) -> None:
+    # Given an existing file
+    (tmp_path / "html.py").write_text("old", encoding="utf-8")
+
+    # When an error is raised while files are written
+    def write() -> None:
+        with AtomicFiles() as files:
+            with files.open(tmp_path / "html.py", encoding="utf-8") as writer:
+                writer.write("new")
+
+            with files.open(tmp_path / "html.idx", mode="wb") as writer:
+                writer.write(b"new")
+                msg = "disk full"
+                raise RuntimeError(msg)
+
+    with pytest.raises(RuntimeError):
+        write()
+
+    # Then the existing file is unchanged and no temporary file is left
+    assert [path.name for path in tmp_path.iterdir()] == ["html.py"]
+    assert (tmp_path / "html.py").read_text(encoding="utf-8") == "old"
+
+
+def test_atomic_files_commit_error(tmp_path: Path) -> None:
+    # Given a file to write whose target is a folder, so it cannot be replaced
+    (tmp_path / "html.py").mkdir()
+
+    # When the files are committed
+    def write() -> None:
+        with AtomicFiles() as files:
+            with files.open(tmp_path / "titles.py", encoding="utf-8") as writer:
+                writer.write("new")
+
+            with files.open(tmp_path / "html.py", encoding="utf-8") as writer:
+                writer.write("new")
+
+            with files.open(tmp_path / "text.py", encoding="utf-8") as writer:
+                writer.write("new")
+
+    with pytest.raises(OSError):  # noqa: PT011
+        write()
+
+    # Then the error is raised and no temporary file is left
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["html.py", "titles.py"]
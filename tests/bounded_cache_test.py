@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from pythonbible_parser.bounded_cache import BoundedCache
+from pythonbible_parser.bounded_cache import CacheStats
+from pythonbible_parser.bounded_cache import get_size
+
+
+def test_bounded_cache() -> None:
+    # Given an empty cache
+    cache = BoundedCache()
+    calls: list[str] = []
+
+    # When getting the same key twice
+    first_value = cache.get("key", lambda: calls.append("key") or "value")
+    second_value = cache.get("key", lambda: calls.append("key") or "other")
+
+    # Then the value is only computed once
+    assert first_value == second_value == "value"
+    assert calls == ["key"]
+    assert cache.stats == CacheStats(
+        hits=1,
+        misses=1,
+        evictions=0,
+        entries=1,
+        size=0,
+    )
+
+
+def test_bounded_cache_max_entries() -> None:
+    # Given a cache of two entries
+    cache = BoundedCache(max_entries=2)
+
+    # When getting three keys, after using the first one again
+    cache.get(1, lambda: "one")
+    cache.get(2, lambda: "two")
+    cache.get(1, lambda: "one")
+    cache.get(3, lambda: "three")
+
+    # Then the least recently used key is evicted
+    assert len(cache) == cache.max_entries
+    assert cache.stats.evictions == 1
+    assert cache.get(2, lambda: "computed again") == "computed again"
+
+
+def test_bounded_cache_max_bytes() -> None:
+    # Given a cache with room for two values of one kilobyte
+    value_size: int = get_size("a" * 1000)
+    cache = BoundedCache(max_entries=None, max_bytes=value_size * 2)
+
+    # When getting three values of one kilobyte and one too large to store
+    for key in range(3):
+        cache.get(key, lambda: "a" * 1000)
+
+    cache.get("large", lambda: "a" * 10_000)
+
+    # Then the cache stays within its byte budget
+    assert cache.stats == CacheStats(
+        hits=0,
+        misses=4,
+        evictions=1,
+        entries=2,
+        size=value_size * 2,
+    )
+
+
+def test_bounded_cache_clear() -> None:
+    # Given a cache with an entry
+    cache = BoundedCache()
+    cache.get("key", lambda: "value")
+
+    # When clearing it
+    cache.clear()
+
+    # Then the entry and the statistics are gone
+    assert not cache
+    assert cache.stats == CacheStats(
+        hits=0,
+        misses=0,
+        evictions=0,
+        entries=0,
+        size=0,
+    )
+
+
+def test_get_size() -> None:
+    # Given a scripture passage
+    paragraph: str = "1. In the beginning God created the heaven and the earth."
+    passage: dict[int, dict[int, list[str]]] = {1: {1: [paragraph]}}
+
+    # When getting its size
+    size: int = get_size(passage)
+
+    # Then the size includes the size of the paragraph
+    assert size > get_size(paragraph) > len(paragraph)
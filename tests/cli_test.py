@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pythonbible_parser.cli import EXIT_SUCCESS
+from pythonbible_parser.cli import EXIT_USAGE_ERROR
+from pythonbible_parser.cli import main
+
+if TYPE_CHECKING:
+    import pytest
+
+
+def test_build(capsys: pytest.CaptureFixture[str]) -> None:
+    # Given the build command for two versions
+    argv: list[str] = ["build", "--versions", "KJV", "asv", "--jobs", "2"]
+
+    # When we run it
+    exit_code: int = main(argv)
+
+    # Then both versions are built and their timings are printed
+    output: str = capsys.readouterr().out
+    assert exit_code == EXIT_SUCCESS
+    assert "KJV: " in output
+    assert "ASV: " in output
+    assert "Built 2 version(s)" in output
+
+
+def test_build_unknown_version(capsys: pytest.CaptureFixture[str]) -> None:
+    # Given the build command for an unknown version
+    argv: list[str] = ["build", "--versions", "blah"]
+
+    # When we run it
+    exit_code: int = main(argv)
+
+    # Then nothing is built and an error is printed
+    assert exit_code == EXIT_USAGE_ERROR
+    assert "Unknown version: blah" in capsys.readouterr().err
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import pythonbible as bible
+
+from pythonbible_parser.compressed_bible import COMPRESSIONS
+from pythonbible_parser.compressed_bible import CompressedBible
+from pythonbible_parser.compressed_bible import write_compressed_bible
+from pythonbible_parser.errors import InvalidCompressedBibleError
+from tests.sample_bible import HTML
+from tests.sample_bible import VERSE_END_INDICES
+from tests.sample_bible import VERSE_START_INDICES
+from tests.sample_bible import VERSION
+from tests.sample_bible import assert_same_scripture
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(params=list(COMPRESSIONS))
+def compressed_bible(tmp_path: Path, request: pytest.FixtureRequest) -> CompressedBible:
+    file_path = tmp_path / "html.cbin"
+    write_compressed_bible(
+        file_path,
+        VERSION,
+        HTML,
+        VERSE_START_INDICES,
+        VERSE_END_INDICES,
+        is_html=True,
+        compression=request.param,
+    )
+
+    with CompressedBible(file_path, cache_size=1) as compressed_bible:
+        yield compressed_bible
+
+
+def test_get_scripture(compressed_bible: CompressedBible) -> None:
+    # Given a compressed Bible, then it has the same scripture as the Bible in
+    # memory
+    assert_same_scripture(compressed_bible)
+
+
+def test_get_scripture_decompresses_only_the_books_of_the_verses(
+    compressed_bible: CompressedBible,
+) -> None:
+    # When we get a verse of Exodus twice
+    compressed_bible.get_scripture(2001001)
+    compressed_bible.get_scripture(2001001)
+
+    # Then only its book is decompressed, once
+    cache_info = compressed_bible.get_chunk.cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.currsize) == (1, 1, 1)
+
+
+def test_get_scripture_invalid_verse(
+    compressed_bible: CompressedBible,
+    invalid_verse_id: int,
+) -> None:
+    with pytest.raises(bible.InvalidVerseError):
+        compressed_bible.get_scripture(invalid_verse_id)
+
+
+def test_get_scripture_missing_verse(compressed_bible: CompressedBible) -> None:
+    with pytest.raises(bible.VersionMissingVerseError):
+        compressed_bible.get_scripture(1001001, 1001004)
+
+
+def test_invalid_file(tmp_path: Path) -> None:
+    # Given a file that is not a compressed Bible file
+    file_path = tmp_path / "html.py"
+    file_path.write_text("bible = Bible()\n", encoding="utf-8")
+
+    # When we open it, then an error is raised
+    with pytest.raises(InvalidCompressedBibleError):
+        CompressedBible(file_path)
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    # Given an empty file
+    file_path = tmp_path / "html.cbin"
+    file_path.write_bytes(b"")
+
+    # When we open it, then an error is raised
+    with pytest.raises(InvalidCompressedBibleError):
+        CompressedBible(file_path)
+
+
+def test_truncated_file(tmp_path: Path) -> None:
+    # Given a compressed Bible file that is truncated
+    file_path = tmp_path / "html.cbin"
+    write_compressed_bible(
+        file_path,
+        VERSION,
+        HTML,
+        VERSE_START_INDICES,
+        VERSE_END_INDICES,
+    )
+    file_path.write_bytes(file_path.read_bytes()[:-1])
+
+    # When we open it, then an error is raised
+    with pytest.raises(InvalidCompressedBibleError):
+        CompressedBible(file_path)
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import pythonbible as bible
+
+from pythonbible_parser import events
+from pythonbible_parser.errors import InvalidEventsFileError
+from pythonbible_parser.events_file import load_events
+from pythonbible_parser.events_file import save_events
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+BOOK_EVENTS: dict[bible.Book, list[events.Event]] = {
+    bible.Book.GENESIS: [
+        (events.TITLE, "The First Book of Moses, called Genesis", "Genesis"),
+        (events.PARAGRAPH_OPEN, None, None),
+        (events.VERSE_START, 1001001, 1),
+        (events.TEXT, "In the beginning", True),
+        (events.NOTE_TEXT, "Or, at first", True),
+        (events.TEXT, "ĕ.", False),
+        (events.VERSE_END, 1001001, None),
+        (events.PARAGRAPH_CLOSE, None, None),
+    ],
+    bible.Book.JOHN: [
+        (events.TITLE, "", ""),
+        (events.VERSE_START, 43001001, 1),
+        (events.TEXT, "In the beginning was the Word", True),
+        (events.VERSE_END, 43001001, None),
+    ],
+}
+
+
+def test_save_and_load_events(tmp_path: Path) -> None:
+    # Given an events file
+    file_path = tmp_path / "test.events"
+    save_events(file_path, BOOK_EVENTS)
+
+    # When we load the events file
+    book_events = load_events(file_path)
+
+    # Then the events are the same as the saved events
+    assert book_events == BOOK_EVENTS
+    assert list(book_events) == [bible.Book.GENESIS, bible.Book.JOHN]
+
+
+def test_load_events_invalid_file(tmp_path: Path) -> None:
+    # Given a file that is not an events file
+    file_path = tmp_path / "test.events"
+    file_path.write_bytes(b"<?xml version='1.0'?>")
+
+    # When we load the file, then an error is raised
+    with pytest.raises(InvalidEventsFileError):
+        load_events(file_path)
+
+
+def test_load_events_truncated_file(tmp_path: Path) -> None:
+    # Given an events file that has been truncated
+    file_path = tmp_path / "test.events"
+    save_events(file_path, BOOK_EVENTS)
+    file_path.write_bytes(file_path.read_bytes()[:-10])
+
+    # When we load the file, then an error is raised
+    with pytest.raises(InvalidEventsFileError):
+        load_events(file_path)
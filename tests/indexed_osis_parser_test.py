@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+import pytest
+import pythonbible as bible
+
+from pythonbible_parser import events
+from pythonbible_parser.events_file import save_events
+from pythonbible_parser.osis.indexed_osis_parser import IndexedOSISParser
+from pythonbible_parser.osis.old_osis_parser import OldOSISParser
+from pythonbible_parser.osis.osis_parser import OSISParser
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SEED: int = 0
+QUERY_COUNT: int = 150
+WINDOW: int = 30
+
+BOOK_EVENTS: dict[bible.Book, list[events.Event]] = {
+    bible.Book.GENESIS: [
+        (events.TITLE, "The First Book of Moses, called Genesis", "Genesis"),
+        (events.PARAGRAPH_OPEN, None, None),
+        (events.VERSE_START, 1001001, 1),
+        (events.TEXT, "In the beginning.", True),
+        (events.VERSE_END, 1001001, None),
+        (events.PARAGRAPH_CLOSE, None, None),
+        (events.PARAGRAPH_OPEN, None, None),
+        (events.VERSE_START, 1001002, 2),
+        (events.TEXT, "And the earth.", True),
+        (events.NOTE_TEXT, "Or, the land", True),
+        (events.VERSE_END, 1001002, None),
+        (events.VERSE_START, 1001003, 3),
+        (events.TEXT, "And God said.", True),
+        (events.VERSE_END, 1001003, None),
+        (events.VERSE_START, 1001004, 4),
+        (events.TEXT, "And God saw.", True),
+        (events.VERSE_END, 1001004, None),
+        (events.VERSE_START, 1002001, 1),
+        (events.TEXT, "Thus the heavens.", True),
+        (events.VERSE_END, 1002001, None),
+        (events.PARAGRAPH_CLOSE, None, None),
+    ],
+    bible.Book.EXODUS: [
+        (events.TITLE, "The Second Book of Moses, called Exodus", "Exodus"),
+        (events.PARAGRAPH_OPEN, None, None),
+        (events.VERSE_START, 2001001, 1),
+        (events.TEXT, "Now these are the names.", True),
+        (events.VERSE_END, 2001001, None),
+        (events.PARAGRAPH_CLOSE, None, None),
+    ],
+}
+
+
+@pytest.fixture
+def parser(tmp_path: Path) -> IndexedOSISParser:
+    events_path = tmp_path / "kjv.events"
+    save_events(events_path, BOOK_EVENTS)
+    osis_parser = OSISParser(bible.Version.KING_JAMES, events_file=events_path)
+
+    return IndexedOSISParser(bible.Version.KING_JAMES, osis_parser)
+
+
+@pytest.fixture(
+    scope="module",
+    params=[bible.Version.KING_JAMES, bible.Version.AMERICAN_STANDARD],
+)
+def parsers(request: pytest.FixtureRequest) -> tuple[OldOSISParser, IndexedOSISParser]:
+    return OldOSISParser(request.param), IndexedOSISParser(request.param)
+
+
+def test_get_scripture_passage_text(parser: IndexedOSISParser) -> None:
+    # Given verse ids in several paragraphs, chapters and books, out of order
+    verse_ids: list[int] = [2001001, 1001003, 1001001, 1001002, 1002001]
+
+    # When we get the scripture passage for those verses
+    passage = parser.get_scripture_passage_text(verse_ids)
+
+    # Then the verses are grouped by book, by the chapter of the first verse of
+    # each paragraph, and by paragraph, and the verses left out are marked
+    assert passage == {
+        bible.Book.GENESIS: {
+            1: [
+                "1. In the beginning.",
+                (
+                    "2. And the earth. Or, the land 3. And God said. ... "
+                    "1. Thus the heavens."
+                ),
+            ],
+        },
+        bible.Book.EXODUS: {1: ["1. Now these are the names."]},
+    }
+    assert list(passage) == [bible.Book.GENESIS, bible.Book.EXODUS]
+
+
+def test_get_scripture_passage_text_no_numbers(parser: IndexedOSISParser) -> None:
+    # Given verse ids with a gap in a paragraph
+    # When we get the scripture passage for those verses without verse numbers
+    passage = parser.get_scripture_passage_text(
+        [1001002, 1001004],
+        include_verse_number=False,
+    )
+
+    # Then the scripture passage is correct.
+    assert passage == {
+        bible.Book.GENESIS: {1: ["And the earth. Or, the land ... And God saw."]},
+    }
+
+
+def test_get_scripture_range_text(parser: IndexedOSISParser) -> None:
+    # Given a range of verses across several paragraphs, chapters and books
+    # When we get the scripture passage for that range
+    passage = parser.get_scripture_range_text(1001001, 2001001)
+
+    # Then it is the passage of all the verses of the range
+    assert passage == parser.get_scripture_passage_text(
+        [1001001, 1001002, 1001003, 1001004, 1002001, 2001001],
+    )
+    assert passage == {
+        bible.Book.GENESIS: {
+            1: [
+                "1. In the beginning.",
+                (
+                    "2. And the earth. Or, the land 3. And God said. "
+                    "4. And God saw. 1. Thus the heavens."
+                ),
+            ],
+        },
+        bible.Book.EXODUS: {1: ["1. Now these are the names."]},
+    }
+
+
+def test_get_scripture_ranges_text(parser: IndexedOSISParser) -> None:
+    # Given overlapping ranges out of order, with a gap in a paragraph
+    verse_ranges: list[tuple[int, int]] = [
+        (1002001, 1002001),
+        (1001001, 1001002),
+        (1001002, 1001002),
+    ]
+
+    # When we get the scripture passage for those ranges without verse numbers
+    passage = parser.get_scripture_ranges_text(
+        verse_ranges,
+        include_verse_number=False,
+    )
+
+    # Then the verses left out are marked, as for a list of verse ids
+    assert passage == {
+        bible.Book.GENESIS: {
+            1: [
+                "In the beginning.",
+                "And the earth. Or, the land ... Thus the heavens.",
+            ],
+        },
+    }
+    assert passage == parser.get_scripture_passage_text(
+        [1001001, 1001002, 1002001],
+        include_verse_number=False,
+    )
+
+
+def test_get_scripture_range_text_invalid_range(
+    parser: IndexedOSISParser,
+    invalid_verse_id: int,
+) -> None:
+    assert not parser.get_scripture_ranges_text([])
+    assert not parser.get_scripture_range_text(1001005, 1001031)
+
+    with pytest.raises(bible.InvalidVerseError):
+        parser.get_scripture_range_text(1001001, invalid_verse_id)
+
+    with pytest.raises(bible.InvalidVerseError):
+        parser.get_scripture_range_text(1001003, 1001002)
+
+
+def test_get_scripture_range_text_kjv() -> None:
+    # Given the KJV parsed from its XML file
+    parser = IndexedOSISParser(bible.Version.KING_JAMES)
+    references: list[bible.NormalizedReference] = bible.get_references(
+        "Matthew 1:18-2:18",
+    )
+    verse_ids: list[int] = bible.convert_references_to_verse_ids(references)
+
+    # When we get the scripture passage for a range, then it is the passage of
+    # all the verses of the range
+    assert parser.get_scripture_range_text(
+        verse_ids[0],
+        verse_ids[-1],
+    ) == parser.get_scripture_passage_text(verse_ids)
+
+
+def test_get_scripture_passage_null(parser: IndexedOSISParser) -> None:
+    assert not parser.get_scripture_passage_text(None)
+    assert not parser.get_scripture_passage_text([])
+
+
+def test_get_book_title(parser: IndexedOSISParser) -> None:
+    assert parser.get_book_title(bible.Book.EXODUS) == (
+        "The Second Book of Moses, called Exodus"
+    )
+    assert parser.get_short_book_title(bible.Book.EXODUS) == "Exodus"
+    assert parser.get_book_title(bible.Book.JOHN) == ""
+
+
+def test_get_verse_text(parser: IndexedOSISParser) -> None:
+    assert parser.verse_text(1001002) == "2. And the earth. Or, the land"
+    assert parser.verse_text(1001002, include_verse_number=False) == (
+        "And the earth. Or, the land"
+    )
+
+
+def test_get_verse_text_null(parser: IndexedOSISParser) -> None:
+    with pytest.raises(bible.InvalidVerseError):
+        parser.verse_text(None)
+
+
+def test_get_verse_text_invalid_verse(
+    parser: IndexedOSISParser,
+    invalid_verse_id: int,
+) -> None:
+    with pytest.raises(bible.InvalidVerseError):
+        parser.verse_text(invalid_verse_id)
+
+    with pytest.raises(bible.InvalidVerseError):
+        parser.get_scripture_passage_text([1001001, invalid_verse_id])
+
+
+def test_get_verse_text_missing_verse(parser: IndexedOSISParser) -> None:
+    # Given a valid verse that is not in the version
+    verse_id: int = 1001005
+
+    # Then its text cannot be found, and it is left out of passages
+    with pytest.raises(bible.VersionMissingVerseError):
+        parser.verse_text(verse_id)
+
+    assert parser.get_scripture_passage_text([1001004, verse_id]) == {
+        bible.Book.GENESIS: {1: ["4. And God saw."]},
+    }
+
+
+def test_get_verse_text_kjv(verse_id: int, verse_text: str) -> None:
+    # Given the KJV parsed from its XML file
+    parser = IndexedOSISParser(bible.Version.KING_JAMES)
+
+    # When we get the scripture text for a verse, then it is what we expect
+    assert parser.verse_text(verse_id) == verse_text
+
+
+def test_get_scripture_passage_text_old_osis_parser(
+    parsers: tuple[OldOSISParser, IndexedOSISParser],
+) -> None:
+    # Given a version parsed from its XML file by both parsers, and random
+    # passages with gaps, across paragraphs and chapters
+    old_parser, parser = parsers
+    verse_ids: list[int] = sorted(old_parser.get_verse_locations())
+    generator = random.Random(SEED)  # noqa: S311
+
+    for _ in range(QUERY_COUNT):
+        first: int = generator.randrange(len(verse_ids) - WINDOW)
+        window: list[int] = verse_ids[first : first + WINDOW]
+        passage_verse_ids: list[int] = generator.sample(
+            window,
+            generator.randint(1, WINDOW),
+        )
+
+        # When we get the text of the passages and of their first verse, then it
+        # is the same as with OldOSISParser
+        for include_verse_number in (True, False):
+            assert parser.get_scripture_passage_text(
+                passage_verse_ids,
+                include_verse_number=include_verse_number,
+            ) == old_parser.get_scripture_passage_text(
+                passage_verse_ids,
+                include_verse_number=include_verse_number,
+            )
+            assert parser.verse_text(
+                passage_verse_ids[0],
+                include_verse_number=include_verse_number,
+            ) == old_parser.verse_text(
+                passage_verse_ids[0],
+                include_verse_number=include_verse_number,
+            )
+
+
+def test_get_scripture_ranges_text_old_osis_parser(
+    parsers: tuple[OldOSISParser, IndexedOSISParser],
+) -> None:
+    # Given a version parsed from its XML file by both parsers, and random
+    # ranges, alone or in pairs with a gap, across paragraphs and chapters
+    old_parser, parser = parsers
+    verse_ids: list[int] = sorted(old_parser.get_verse_locations())
+    generator = random.Random(SEED)  # noqa: S311
+
+    for _ in range(QUERY_COUNT):
+        first: int = generator.randrange(len(verse_ids) - WINDOW)
+        start, middle, end = sorted(generator.sample(range(WINDOW), 3))
+        verse_range: tuple[int, int] = (
+            verse_ids[first + start],
+            verse_ids[first + end],
+        )
+        gap_ranges: list[tuple[int, int]] = [
+            (verse_ids[first], verse_ids[first + start]),
+            (verse_ids[first + middle], verse_ids[first + end]),
+        ]
+
+        # When we get the text of the ranges, then it is the same as the text of
+        # all their verses with OldOSISParser
+        for include_verse_number in (True, False):
+            assert parser.get_scripture_range_text(
+                *verse_range,
+                include_verse_number=include_verse_number,
+            ) == old_parser.get_scripture_passage_text(
+                verse_ids[first + start : first + end + 1],
+                include_verse_number=include_verse_number,
+            )
+            assert parser.get_scripture_ranges_text(
+                gap_ranges,
+                include_verse_number=include_verse_number,
+            ) == old_parser.get_scripture_passage_text(
+                [
+                    *verse_ids[first : first + start + 1],
+                    *verse_ids[first + middle : first + end + 1],
+                ],
+                include_verse_number=include_verse_number,
+            )
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import sys
 import time
 from typing import TYPE_CHECKING
 
 import pytest
 import pythonbible as bible
 
+from pythonbible_parser.bounded_cache import CacheStats
 from pythonbible_parser.osis.old_osis_parser import OldOSISParser
 
 if TYPE_CHECKING:
@@ -84,6 +86,43 @@ def test_get_scripture_passage_ellipsis() -> None:
     assert "..." in chapter_1_paragraphs[0]
 
 
+def test_get_verse_locations(verse_id: int) -> None:
+    # Given a parser that has not answered any query yet
+    parser = OldOSISParser(bible.Version.KING_JAMES)
+    assert parser._verse_locations is None  # noqa: SLF001
+
+    # When we get the text of a verse
+    parser.verse_text(verse_id)
+
+    # Then the verse index has been built, and it points to the verse element
+    paragraph_element, position = parser.get_verse_locations()[verse_id]
+    assert paragraph_element[position].get("osisID") == "Gen.1.1"
+    assert paragraph_element is parser.tree.find(
+        ".//xmlns:verse[@osisID='Gen.1.1']/..",
+        parser.namespaces,
+    )
+
+
+def test_get_scripture_passage_text_many_paragraphs() -> None:
+    # Given the verse ids of more paragraphs than the recursion limit
+    parser = OldOSISParser(bible.Version.KING_JAMES)
+    verse_ids: list[int] = sorted(parser.get_verse_locations())
+
+    # When we get the scripture text for those verse ids
+    scripture_text = parser.get_scripture_passage_text(verse_ids)
+
+    # Then every paragraph is returned, in order
+    paragraphs: list[str] = [
+        paragraph
+        for chapters in scripture_text.values()
+        for chapter_paragraphs in chapters.values()
+        for paragraph in chapter_paragraphs
+    ]
+    assert len(paragraphs) > sys.getrecursionlimit()
+    assert paragraphs[0].startswith("1. In the beginning")
+    assert list(scripture_text) == sorted(scripture_text, key=lambda book: book.value)
+
+
 def test_get_book_title() -> None:
     book_title: str = DEFAULT_PARSER.get_book_title(bible.Book.GENESIS)
     assert book_title == "The First Book of Moses, called Genesis"
@@ -288,3 +327,28 @@ def test_verse_text_caching() -> None:
     # time
     assert first_time * 0.1 > second_time
     assert first_verses == second_verses
+
+
+def test_cache_stats_and_clear() -> None:
+    # Given a parser with room for a single cached result
+    parser = OldOSISParser(bible.Version.KING_JAMES, cache_entries=1)
+
+    # When getting the text of a verse twice, then the text of another verse
+    first_text: str = parser.verse_text(1001001)
+    second_text: str = parser.verse_text(1001001)
+    parser.verse_text(1001002)
+
+    # Then the first result is reused and then evicted
+    assert first_text == second_text
+    assert parser.cache.stats == CacheStats(
+        hits=1,
+        misses=2,
+        evictions=1,
+        entries=1,
+        size=0,
+    )
+
+    # And clearing the parser empties its cache
+    parser.clear()
+    assert not parser.cache
+    assert parser.cache.stats.misses == 0
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import pythonbible as bible
+from defusedxml import ElementTree
+from defusedxml import EntitiesForbidden
+
+from pythonbible_parser import events
+from pythonbible_parser.osis.osis_book_parser import OSISBookParser
+from pythonbible_parser.osis.osis_expat_reader import OSISExpatReader
+from pythonbible_parser.osis.osis_parser import OSISParser
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+NAMESPACE: str = "http://www.bibletechnologies.net/2003/OSIS/namespace"
+OSIS_XML: str = f"""<?xml version="1.0" encoding="UTF-8"?>
+<osis xmlns="{NAMESPACE}">
+<osisText>
+<div type="bookGroup">
+<div type="book" osisID="Gen">
+<title short="Genesis">The First Book of Moses<foo>ignored</foo> tail</title>
+<chapter sID="Gen.1"/>
+<p>
+<verse sID="Gen.1.1" osisID="Gen.1.1"/>¶ In the <w lemma="H7225">beginning
+God</w> created<note><rdg>Or, at first</rdg> ignored <verse osisID="Gen.1.1">in
+note</verse></note>.<verse eID="Gen.1.1"/>
+<verse osisID="Gen.1.2">text</verse>tail <q who="God">Let <seg>there</seg> be
+<transChange>light</transChange><lb/>.</q>: <unknown>skipped <w>word</w></unknown>
+<lg><l>line <divineName>Lord</divineName></l></lg>
+</p>
+<chapter eID="Gen.1"/>
+<chapter sID="Gen.2"/>
+<p><verse osisID="Gen.2.1"/>Thus<rdg>not in a note</rdg> were</p>
+</div>
+<div type="book" osisID="Exod">
+<p><verse osisID="Exod.1.1"/>Now</p>
+</div>
+<div type="book" osisID="Gen">
+<p><verse osisID="Gen.3.1"/>A duplicate</p>
+</div>
+</div>
+</osisText>
+</osis>
+"""
+
+
+def test_iter_book_events(tmp_path: Path) -> None:
+    # Given an OSIS XML file
+    input_path = tmp_path / "test.xml"
+    input_path.write_text(OSIS_XML, encoding="utf-8")
+
+    # When we read the events of each book with expat
+    book_events = dict(OSISExpatReader(input_path).iter_book_events())
+
+    # Then they are the same as the events of the first element of each book
+    root = ElementTree.parse(input_path).getroot()
+    expected = {}
+
+    for element in root.iter(f"{{{NAMESPACE}}}div"):
+        if element.get("osisID") == "Gen" and bible.Book.GENESIS not in expected:
+            expected[bible.Book.GENESIS] = _walk(element)
+        elif element.get("osisID") == "Exod":
+            expected[bible.Book.EXODUS] = _walk(element)
+
+    assert book_events == expected
+
+
+def test_iter_book_events_container_verse(tmp_path: Path) -> None:
+    # Given an OSIS XML file with a verse element that contains its text
+    input_path = tmp_path / "test.xml"
+    input_path.write_text(OSIS_XML, encoding="utf-8")
+
+    # When we read the events of the book
+    book_events = dict(OSISExpatReader(input_path).iter_book_events())
+    genesis_events = book_events[bible.Book.GENESIS]
+
+    # Then the text and the tail of the element follow the start of the verse
+    position: int = genesis_events.index((events.VERSE_START, 1001002, 2))
+
+    assert genesis_events[position - 1] == (events.VERSE_END, 1001001, None)
+    assert genesis_events[position + 1 : position + 3] == [
+        (events.TEXT, "text", True),
+        (events.TEXT, "tail", True),
+    ]
+
+
+def test_iter_book_events_entities_forbidden(tmp_path: Path) -> None:
+    # Given an OSIS XML file that declares an entity
+    input_path = tmp_path / "test.xml"
+    input_path.write_text(
+        '<?xml version="1.0"?><!DOCTYPE osis [<!ENTITY a "aaaaaaaaaa">]>'
+        "<osis>&a;&a;</osis>",
+        encoding="utf-8",
+    )
+
+    # When we read the file, then the entity is rejected
+    with pytest.raises(EntitiesForbidden):
+        list(OSISExpatReader(input_path).iter_book_events())
+
+
+def test_parse_expat() -> None:
+    # Given an OSIS parser in expat mode
+    parser = OSISParser(bible.Version.KING_JAMES, expat=True)
+
+    # When we parse the XML file
+    parser.parse()
+
+    # Then the output is the same as the output of the tree-based parser
+    expected = OSISParser(bible.Version.KING_JAMES)
+    expected.parse()
+
+    assert parser.tree is None
+    assert parser.html_notes == expected.html_notes
+    assert parser.plain_text_readers == expected.plain_text_readers
+    assert parser.html_verse_start_indices == expected.html_verse_start_indices
+    assert parser.plain_text_verse_end_indices == expected.plain_text_verse_end_indices
+    assert parser.long_titles == expected.long_titles
+    assert parser.short_titles == expected.short_titles
+
+
+def _walk(book_element: object) -> list[object]:
+    return OSISBookParser(book_element, 0, 0, 0, 0, 0, 0, renderings=()).walk()
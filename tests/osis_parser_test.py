@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+import importlib.util
+import sqlite3
 from functools import lru_cache
+from typing import TYPE_CHECKING
+from typing import Any
 
+import pytest
 import pythonbible as bible
 
+from pythonbible_parser.compressed_bible import CompressedBible
+from pythonbible_parser.errors import InvalidRenderingError
+from pythonbible_parser.osis import osis_parser
+from pythonbible_parser.osis.osis_parser import OUTPUT_FOLDER
 from pythonbible_parser.osis.osis_parser import OSISParser
+from pythonbible_parser.packed_bible import PackedBible
+from pythonbible_parser.renderers import is_html_rendering
+from pythonbible_parser.split_bible import SplitBible
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from pythonbible_parser.osis.osis_book_parser import OSISBookParser
 
 
 @lru_cache()
@@ -281,7 +298,487 @@ def test_1_chronicles_16_8_kjv() -> None:
     assert verse_text_html_notes == verse_text_html
 
 
+def test_streaming_parse() -> None:
+    # Given an OSIS parser in streaming mode
+    parser = OSISParser(bible.Version.KING_JAMES, streaming=True)
+
+    # When we parse the XML file
+    parser.parse()
+
+    # Then the output is identical to the output of the default mode
+    _assert_same_output(parser, get_parser(bible.Version.KING_JAMES))
+
+
+def test_parallel_parse() -> None:
+    # Given an OSIS parser in parallel mode
+    parser = OSISParser(bible.Version.KING_JAMES, parallel=True, max_workers=2)
+
+    # When we parse the XML file
+    parser.parse()
+
+    # Then the output is identical to the output of the serial mode
+    _assert_same_output(parser, get_parser(bible.Version.KING_JAMES))
+
+
+def test_parse_with_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Given an OSIS parser with a cache folder that has already been filled
+    OSISParser(bible.Version.KING_JAMES, cache_folder=tmp_path).parse()
+    parser = OSISParser(bible.Version.KING_JAMES, cache_folder=tmp_path)
+    parsed_books: list[str] = _record_parsed_books(monkeypatch)
+
+    # When we parse the XML file again
+    parser.parse()
+
+    # Then no book is parsed, as they are all loaded from the cache, and the
+    # output is identical
+    assert list(tmp_path.glob("kjv/*.pickle"))
+    assert not parsed_books
+    _assert_same_output(parser, get_parser(bible.Version.KING_JAMES))
+
+
+def test_parse_with_cache_changed_book(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Given a filled cache folder and a change to the book div of Genesis
+    OSISParser(bible.Version.KING_JAMES, cache_folder=tmp_path).parse()
+    get_book_elements = OSISParser._get_book_elements  # noqa: SLF001
+
+    def get_changed_book_elements(parser: OSISParser) -> dict[bible.Book, Any]:
+        book_elements = get_book_elements(parser)
+        book_elements[bible.Book.GENESIS].set("changed", "true")
+        return book_elements
+
+    monkeypatch.setattr(OSISParser, "_get_book_elements", get_changed_book_elements)
+    parsed_books: list[str] = _record_parsed_books(monkeypatch)
+
+    # When we parse the XML file again
+    OSISParser(bible.Version.KING_JAMES, cache_folder=tmp_path).parse()
+
+    # Then only the changed book is parsed again
+    assert parsed_books == ["Gen"]
+
+
+def test_parse_with_truncated_cache(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Given a cache folder with a truncated cache file, as left by a crash
+    OSISParser(bible.Version.KING_JAMES, cache_folder=tmp_path).parse()
+    cache_file = tmp_path / "kjv" / "Gen.pickle"
+    cache_file.write_bytes(cache_file.read_bytes()[:100])
+    parser = OSISParser(bible.Version.KING_JAMES, cache_folder=tmp_path)
+    parsed_books: list[str] = _record_parsed_books(monkeypatch)
+
+    # When we parse the XML file again
+    parser.parse()
+
+    # Then the truncated file is a cache miss and the output is identical
+    assert parsed_books == ["Gen"]
+    assert not list(tmp_path.glob("kjv/.*.tmp"))
+    _assert_same_output(parser, get_parser(bible.Version.KING_JAMES))
+
+
+def _record_parsed_books(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    parsed_books: list[str] = []
+    parse_book_element = osis_parser._parse_book_element  # noqa: SLF001
+
+    def record_book_element(
+        book_element: Any,
+        renderings: tuple[str, ...],
+    ) -> OSISBookParser:
+        parsed_books.append(book_element.get("osisID"))
+        return parse_book_element(book_element, renderings)
+
+    monkeypatch.setattr(osis_parser, "_parse_book_element", record_book_element)
+    return parsed_books
+
+
+def test_parse_events_file(tmp_path: Path) -> None:
+    # Given an OSIS parser for an events file that has been saved
+    events_file = tmp_path / "kjv.events"
+    OSISParser(bible.Version.KING_JAMES, streaming=True).save_events(events_file)
+    parser = OSISParser(bible.Version.KING_JAMES, events_file=events_file)
+
+    # When we parse the events file
+    parser.parse()
+
+    # Then the XML file is not read and the output is identical
+    assert parser.tree is None
+    _assert_same_output(parser, get_parser(bible.Version.KING_JAMES))
+
+
+def test_parse_selected_renderings() -> None:
+    # Given an OSIS parser for only two of the renderings
+    parser = OSISParser(
+        bible.Version.KING_JAMES,
+        renderings=["plain_text_readers", "html"],
+    )
+
+    # When we parse the XML file
+    parser.parse()
+
+    # Then only those renderings are built
+    expected = get_parser(bible.Version.KING_JAMES)
+    assert parser.renderings == ("html", "plain_text_readers")
+    assert parser.html == expected.html
+    assert parser.html_verse_start_indices == expected.html_verse_start_indices
+    assert parser.html_verse_end_indices == expected.html_verse_end_indices
+    assert parser.plain_text_readers == expected.plain_text_readers
+    assert (
+        parser.plain_text_readers_verse_start_indices
+        == expected.plain_text_readers_verse_start_indices
+    )
+    assert (
+        parser.plain_text_readers_verse_end_indices
+        == expected.plain_text_readers_verse_end_indices
+    )
+    assert not parser.html_notes
+    assert not parser.plain_text
+    assert not parser.plain_text_verse_start_indices
+    assert not parser.plain_text_verse_end_indices
+
+
+def test_invalid_rendering() -> None:
+    with pytest.raises(InvalidRenderingError):
+        OSISParser(bible.Version.KING_JAMES, renderings=["html", "blah"])
+
+
 def test_write() -> None:
     # actually test this once the functionality is more complete
     get_parser(bible.Version.KING_JAMES).write()
     get_parser(bible.Version.AMERICAN_STANDARD).write()
+
+
+def test_write_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Given a version that has been written
+    parser = get_parser(bible.Version.KING_JAMES)
+    parser.write(fsync=True)
+    version_folder = OUTPUT_FOLDER / "kjv"
+    expected_files = {
+        path.name: path.read_bytes() for path in version_folder.glob("*.py")
+    }
+
+    # When writing it again fails in one of the writer threads
+    def fail(*_args: object) -> None:
+        msg = "disk full"
+        raise OSError(msg)
+
+    monkeypatch.setattr(
+        "pythonbible_parser.osis.osis_parser._write_titles_file",
+        fail,
+    )
+
+    with pytest.raises(OSError, match="disk full"):
+        parser.write()
+
+    # Then the files written before are unchanged, and no temporary file is left
+    assert {
+        path.name: path.read_bytes() for path in version_folder.glob("*.py")
+    } == expected_files
+    assert not list(version_folder.glob(".*.tmp"))
+
+
+def test_get_standoff_text() -> None:
+    # Given an OSIS parser
+    parser = OSISParser(bible.Version.KING_JAMES, expat=True)
+
+    # When we walk its XML file into a standoff text
+    standoff_text = parser.get_standoff_text()
+
+    # Then each rendering built from it is the same as the parsed rendering
+    expected = get_parser(bible.Version.KING_JAMES)
+
+    for rendering in expected.renderings:
+        text, verse_start_indices, verse_end_indices = standoff_text.render(rendering)
+        assert text == getattr(expected, rendering)
+        assert verse_start_indices == expected.verse_start_indices[rendering]
+        assert verse_end_indices == expected.verse_end_indices[rendering]
+
+
+@pytest.mark.parametrize(
+    ("start_verse_id", "end_verse_id", "book_count"),
+    [(1001001, None, 1), (19023001, 19023006, 1), (39004006, 40001025, 2)],
+)
+def test_get_standoff_text_scripture(
+    start_verse_id: int,
+    end_verse_id: int | None,
+    book_count: int,
+) -> None:
+    # Given a standoff text
+    standoff_text = OSISParser(
+        bible.Version.KING_JAMES,
+        expat=True,
+    ).get_standoff_text()
+    expected = get_parser(bible.Version.KING_JAMES)
+
+    # When we get the scripture of some verses from it, then it is the same as
+    # the scripture of the whole rendering, and only their books are rendered
+    for rendering in expected.renderings:
+        expected_bible = bible.Bible(
+            expected.version,
+            getattr(expected, rendering),
+            expected.verse_start_indices[rendering],
+            expected.verse_end_indices[rendering],
+            is_html_rendering(rendering),
+        )
+        assert standoff_text.get_scripture(
+            rendering,
+            start_verse_id,
+            end_verse_id,
+        ) == expected_bible.get_scripture(start_verse_id, end_verse_id)
+
+    assert standoff_text.get_rendered_book.cache_info().misses == book_count * len(
+        expected.renderings,
+    )
+
+
+def test_compact_indices(verse_id: int) -> None:
+    # Given a parsed version
+    parser = OSISParser(bible.Version.KING_JAMES, renderings=["html", "plain_text"])
+    parser.parse()
+    expected = get_parser(bible.Version.KING_JAMES)
+
+    # When we replace its verse index dicts with verse indices
+    parser.compact_indices()
+
+    # Then they have the same indices, and can still be written
+    assert parser.html_verse_start_indices == expected.html_verse_start_indices
+    assert parser.html_verse_end_indices == expected.html_verse_end_indices
+    assert parser.verse_start_indices["plain_text"] == (
+        expected.plain_text_verse_start_indices
+    )
+    assert parser.verse_end_indices["plain_text"] == (
+        expected.plain_text_verse_end_indices
+    )
+
+    parser.write_packed()
+
+    with PackedBible(OUTPUT_FOLDER / "kjv" / "html.bin") as packed_bible:
+        assert packed_bible.get_scripture(verse_id) == get_html_bible(
+            bible.Version.KING_JAMES,
+        ).get_scripture(verse_id)
+
+
+def test_write_index_files(verse_id: int) -> None:
+    # Given a parsed version
+    parser = get_parser(bible.Version.KING_JAMES)
+
+    # When we write it with the verse indices in index files and import a module
+    parser.write(index_files=True)
+    module_path = OUTPUT_FOLDER / "kjv" / "html.py"
+    spec = importlib.util.spec_from_file_location("kjv_html_indexed", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # Then the module loads its indices from the index file instead of having
+    # them as dict literals, and it has the same Bible as the parser
+    module_source: str = module_path.read_text(encoding="utf-8")
+    assert (OUTPUT_FOLDER / "kjv" / "html.idx").exists()
+    assert "{1001001:" not in module_source
+    assert '(Path(__file__).parent / "html.idx").read_bytes()' in module_source
+    assert module.bible.scripture_content == parser.html
+    assert module.bible.verse_start_indices == parser.html_verse_start_indices
+    assert module.bible.verse_end_indices == parser.html_verse_end_indices
+    assert module.bible.get_scripture(verse_id).startswith("<p><sup>1</sup>")
+
+
+@pytest.mark.parametrize("index_files", [False, True])
+@pytest.mark.parametrize("expat", [False, True])
+def test_write_streaming(index_files: bool, expat: bool) -> None:
+    # Given a parsed version written to modules
+    expected = get_parser(bible.Version.KING_JAMES)
+    expected.write(index_files=index_files)
+    expected_modules: dict[str, list[str]] = _read_modules(expected.renderings)
+
+    # When we write it again while streaming it
+    parser = OSISParser(bible.Version.KING_JAMES, streaming=True, expat=expat)
+    parser.write_streaming(index_files=index_files)
+
+    # Then the modules and the verse indices are the same, and the text of the
+    # renderings is not kept in memory
+    assert _read_modules(parser.renderings) == expected_modules
+    assert parser.verse_start_indices == expected.verse_start_indices
+    assert parser.verse_end_indices == expected.verse_end_indices
+    assert parser.long_titles == expected.long_titles
+    assert parser.html == ""
+
+
+def _read_modules(renderings: tuple[str, ...]) -> dict[str, list[str]]:
+    # The first line is the generation timestamp.
+    return {
+        rendering: (OUTPUT_FOLDER / "kjv" / f"{rendering}.py")
+        .read_text(encoding="utf-8")
+        .splitlines()[1:]
+        for rendering in renderings
+    }
+
+
+def test_write_lazy(verse_id: int) -> None:
+    # Given a parsed version
+    parser = get_parser(bible.Version.KING_JAMES)
+
+    # When we write it to lazy-loading modules and import one of them
+    parser.write_lazy()
+    module_path = OUTPUT_FOLDER / "kjv" / "html.py"
+    spec = importlib.util.spec_from_file_location("kjv_html", module_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    # Then the text is only loaded on the first call to get_scripture
+    assert not module.bible.is_loaded
+    assert module.bible.get_scripture(verse_id).startswith("<p><sup>1</sup>")
+    assert module.bible.is_loaded
+    assert module.bible.scripture_content == parser.html
+    assert module.bible.verse_start_indices == parser.html_verse_start_indices
+    assert module.bible.verse_end_indices == parser.html_verse_end_indices
+
+
+def test_write_sqlite(tmp_path: Path, verse_id: int) -> None:
+    # Given two parsed versions
+    kjv_parser = get_parser(bible.Version.KING_JAMES)
+    asv_parser = get_parser(bible.Version.AMERICAN_STANDARD)
+    database_path = tmp_path / "bible.sqlite"
+
+    # When we write them to the same SQLite database, the first one twice
+    kjv_parser.write_sqlite(database_path)
+    asv_parser.write_sqlite(database_path)
+    kjv_parser.write_sqlite(database_path)
+
+    # Then each version has one row per verse and the verses can be searched
+    connection = sqlite3.connect(database_path)
+
+    try:
+        assert connection.execute(
+            "SELECT version, COUNT(*) FROM verses GROUP BY version ORDER BY version",
+        ).fetchall() == [
+            ("ASV", len(asv_parser.plain_text_readers_verse_start_indices)),
+            ("KJV", len(kjv_parser.plain_text_readers_verse_start_indices)),
+        ]
+        assert connection.execute(
+            "SELECT book, chapter, verse, plain_text, html FROM verses "
+            "WHERE version = 'KJV' AND verse_id = ?",
+            (verse_id,),
+        ).fetchone() == (
+            1,
+            1,
+            1,
+            "In the beginning God created the heaven and the earth.",
+            (
+                "<p><sup>1</sup> In the beginning God created the heaven and the "
+                "earth.</p>"
+            ),
+        )
+        assert connection.execute(
+            "SELECT short_title, long_title FROM titles "
+            "WHERE version = 'KJV' AND book = 1",
+        ).fetchone() == (
+            kjv_parser.short_titles[bible.Book.GENESIS],
+            kjv_parser.long_titles[bible.Book.GENESIS],
+        )
+        assert (
+            "KJV",
+            verse_id,
+        ) in connection.execute(
+            "SELECT verses.version, verses.verse_id "
+            "FROM verses_fts JOIN verses ON verses.id = verses_fts.rowid "
+            "WHERE verses_fts MATCH '\"God created the heaven\"'",
+        ).fetchall()
+    finally:
+        connection.close()
+
+
+def test_write_packed(verse_id: int) -> None:
+    # Given a parsed version
+    parser = get_parser(bible.Version.KING_JAMES)
+
+    # When we write it to packed files
+    parser.write_packed()
+
+    # Then each rendering can be read with PackedBible
+    with PackedBible(OUTPUT_FOLDER / "kjv" / "plain_text.bin") as packed_bible:
+        expected = parser.plain_text[
+            parser.plain_text_verse_start_indices[verse_id] : (
+                parser.plain_text_verse_end_indices[verse_id]
+            )
+        ]
+        assert packed_bible.get_scripture(verse_id) == expected.strip()
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma"])
+def test_write_compressed(verse_id: int, compression: str) -> None:
+    # Given a parsed version
+    parser = get_parser(bible.Version.KING_JAMES)
+
+    # When we write it to compressed files
+    parser.write_compressed(compression)
+
+    # Then each rendering can be read with CompressedBible
+    with CompressedBible(OUTPUT_FOLDER / "kjv" / "html.cbin") as compressed_bible:
+        expected = get_html_bible(bible.Version.KING_JAMES)
+        assert compressed_bible.get_scripture(verse_id) == expected.get_scripture(
+            verse_id,
+        )
+
+
+def test_write_split(verse_id: int) -> None:
+    # Given a parsed version
+    parser = get_parser(bible.Version.KING_JAMES)
+
+    # When we write it to one file per book
+    parser.write_split()
+
+    # Then each rendering can be read with SplitBible
+    split_bible = SplitBible(OUTPUT_FOLDER / "kjv" / "html")
+    expected = get_html_bible(bible.Version.KING_JAMES)
+
+    assert split_bible.get_scripture(verse_id) == expected.get_scripture(verse_id)
+    assert split_bible.long_titles == parser.long_titles
+    assert split_bible.loaded_books == [bible.Book.GENESIS]
+
+
+def _assert_same_output(actual: OSISParser, expected: OSISParser) -> None:
+    assert actual.html == expected.html
+    assert actual.html_readers == expected.html_readers
+    assert actual.html_notes == expected.html_notes
+    assert actual.plain_text == expected.plain_text
+    assert actual.plain_text_readers == expected.plain_text_readers
+    assert actual.plain_text_notes == expected.plain_text_notes
+
+    assert actual.html_verse_start_indices == expected.html_verse_start_indices
+    assert (
+        actual.html_readers_verse_start_indices
+        == expected.html_readers_verse_start_indices
+    )
+    assert (
+        actual.html_notes_verse_start_indices == expected.html_notes_verse_start_indices
+    )
+    assert (
+        actual.plain_text_verse_start_indices == expected.plain_text_verse_start_indices
+    )
+    assert (
+        actual.plain_text_readers_verse_start_indices
+        == expected.plain_text_readers_verse_start_indices
+    )
+    assert (
+        actual.plain_text_notes_verse_start_indices
+        == expected.plain_text_notes_verse_start_indices
+    )
+
+    assert actual.html_verse_end_indices == expected.html_verse_end_indices
+    assert (
+        actual.html_readers_verse_end_indices == expected.html_readers_verse_end_indices
+    )
+    assert actual.html_notes_verse_end_indices == expected.html_notes_verse_end_indices
+    assert actual.plain_text_verse_end_indices == expected.plain_text_verse_end_indices
+    assert (
+        actual.plain_text_readers_verse_end_indices
+        == expected.plain_text_readers_verse_end_indices
+    )
+    assert (
+        actual.plain_text_notes_verse_end_indices
+        == expected.plain_text_notes_verse_end_indices
+    )
+
+    assert actual.short_titles == expected.short_titles
+    assert actual.long_titles == expected.long_titles
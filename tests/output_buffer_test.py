@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from pythonbible_parser.output_buffer import OutputBuffer
+
+
+def test_output_buffer() -> None:
+    # Given an output buffer
+    buffer = OutputBuffer()
+
+    # When appending several pieces of text
+    buffer.append("<p>")
+    buffer.append("In the beginning")
+    buffer.append("")
+    buffer.append("</")
+    buffer.append("p>")
+
+    # Then the length, suffix, and value match the concatenated string
+    assert len(buffer) == len("<p>In the beginning</p>")
+    assert buffer.endswith("</p>")
+    assert buffer.endswith(("<br/>", "</p>"))
+    assert not buffer.endswith("<p>")
+    assert buffer.getvalue() == "<p>In the beginning</p>"
+
+
+def test_output_buffer_empty() -> None:
+    # Given an empty output buffer
+    buffer = OutputBuffer()
+
+    # Then it is falsy and its value is an empty string
+    assert not buffer
+    assert not buffer.endswith("\n")
+    assert buffer.getvalue() == ""
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import pythonbible as bible
+
+from pythonbible_parser.errors import InvalidPackedBibleError
+from pythonbible_parser.packed_bible import PackedBible
+from pythonbible_parser.packed_bible import write_packed_bible
+from tests.sample_bible import HTML
+from tests.sample_bible import VERSE_END_INDICES
+from tests.sample_bible import VERSE_START_INDICES
+from tests.sample_bible import VERSION
+from tests.sample_bible import assert_same_scripture
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def packed_bible(tmp_path: Path) -> PackedBible:
+    file_path = tmp_path / "html.bin"
+    write_packed_bible(
+        file_path,
+        VERSION,
+        HTML,
+        VERSE_START_INDICES,
+        VERSE_END_INDICES,
+        is_html=True,
+    )
+
+    with PackedBible(file_path) as packed_bible:
+        yield packed_bible
+
+
+def test_get_scripture(packed_bible: PackedBible) -> None:
+    # Given a packed Bible, then it has the same scripture as the Bible in memory
+    assert_same_scripture(packed_bible)
+
+
+def test_get_scripture_invalid_verse(
+    packed_bible: PackedBible,
+    invalid_verse_id: int,
+) -> None:
+    with pytest.raises(bible.InvalidVerseError):
+        packed_bible.get_scripture(invalid_verse_id)
+
+
+def test_get_scripture_missing_verse(packed_bible: PackedBible) -> None:
+    with pytest.raises(bible.VersionMissingVerseError):
+        packed_bible.get_scripture(1001001, 1001004)
+
+
+def test_invalid_file(tmp_path: Path) -> None:
+    # Given a file that is not a packed Bible file
+    file_path = tmp_path / "html.py"
+    file_path.write_text("bible = Bible()\n", encoding="utf-8")
+
+    # When we open it, then an error is raised
+    with pytest.raises(InvalidPackedBibleError):
+        PackedBible(file_path)
+
+
+def test_empty_file(tmp_path: Path) -> None:
+    # Given an empty file
+    file_path = tmp_path / "html.bin"
+    file_path.write_bytes(b"")
+
+    # When we open it, then an error is raised
+    with pytest.raises(InvalidPackedBibleError):
+        PackedBible(file_path)
+
+
+def test_unknown_version(tmp_path: Path) -> None:
+    # Given a packed file with the name of a version that does not exist
+    file_path = tmp_path / "html.bin"
+    write_packed_bible(
+        file_path,
+        VERSION,
+        HTML,
+        VERSE_START_INDICES,
+        VERSE_END_INDICES,
+        is_html=True,
+    )
+    file_path.write_bytes(file_path.read_bytes().replace(b"KJV", b"XYZ", 1))
+
+    # When we open it, then an error is raised
+    with pytest.raises(InvalidPackedBibleError):
+        PackedBible(file_path)
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from pythonbible_parser import events
+from pythonbible_parser.renderers import HTMLRenderer
+from pythonbible_parser.renderers import PlainTextRenderer
+from pythonbible_parser.renderers import Renderer
+from pythonbible_parser.renderers import get_renderer
+
+BOOK_EVENTS: list[events.Event] = [
+    (events.TITLE, "The First Book of Moses, called Genesis", "Genesis"),
+    (events.PARAGRAPH_OPEN, None, None),
+    (events.VERSE_START, 1001001, 1),
+    (events.TEXT, "In the beginning", True),
+    (events.NOTE_TEXT, "Or, at first", True),
+    (events.TEXT, ".", False),
+    (events.VERSE_END, 1001001, None),
+    (events.VERSE_START, 1001002, 2),
+    (events.TEXT, "And the earth.", True),
+    (events.VERSE_END, 1001002, None),
+    (events.PARAGRAPH_CLOSE, None, None),
+]
+
+
+def test_get_renderer() -> None:
+    assert isinstance(get_renderer("html_notes"), HTMLRenderer)
+    assert isinstance(get_renderer("plain_text_readers"), PlainTextRenderer)
+
+
+def test_render_html() -> None:
+    # Given an HTML renderer
+    renderer = get_renderer("html", 10)
+
+    # When rendering the events of a book
+    renderer.render(BOOK_EVENTS)
+
+    # Then the text and verse indices match the events
+    assert (
+        renderer.get_text()
+        == "<p><sup>1</sup> In the beginning. <sup>2</sup> And the earth.</p>"
+    )
+    assert renderer.verse_start_indices == {1001001: 13, 1001002: 43}
+    assert renderer.verse_end_indices == {1001001: 43, 1001002: 71}
+
+
+def test_render_plain_text_notes() -> None:
+    # Given a plain text renderer that includes notes but not verse numbers
+    renderer = get_renderer("plain_text_notes")
+    renderer.include_verse_numbers = False
+
+    # When rendering the events of a book
+    renderer.render(BOOK_EVENTS)
+
+    # Then the note text is included
+    assert renderer.get_text() == "\nIn the beginning Or, at first. And the earth."
+
+
+def test_render_custom_renderer() -> None:
+    # Given a renderer for a new format
+    class MarkdownRenderer(Renderer):
+        paragraph_open = "\n\n"
+        verse_number_format = "**{}**"
+        no_space_before_verse = ("\n",)
+        no_space_before_text = ("\n",)
+
+    renderer = MarkdownRenderer("markdown")
+
+    # When rendering the events of a book
+    renderer.render(BOOK_EVENTS)
+
+    # Then the events are rendered in the new format
+    assert renderer.get_text() == "\n\n**1** In the beginning. **2** And the earth."
@@ -0,0 +1,56 @@
+"""A short HTML rendering of two books, shared by the tests of the file formats."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pythonbible as bible
+from pythonbible.bible.bible import Bible
+
+VERSION: bible.Version = bible.Version.KING_JAMES
+HTML: str = (
+    "<p><sup>1</sup> In the beginning. <sup>2</sup> Ĕ and the earth.</p>"
+    "<p><sup>3</sup> And God said.</p>"
+    "<p><sup>1</sup> Now these are the names.</p>"
+)
+VERSE_START_INDICES: dict[int, int] = {
+    1001001: 3,
+    1001002: 34,
+    1001003: 71,
+    2001001: 103,
+}
+VERSE_END_INDICES: dict[int, int] = {
+    1001001: 33,
+    1001002: 63,
+    1001003: 96,
+    2001001: 140,
+}
+
+
+def assert_same_scripture(reader: Any) -> None:
+    """Assert that a reader of the sample returns the same scripture as a Bible.
+
+    The scripture of each verse and range of verses, within a book and across
+    books, is compared with the sample Bible loaded in memory.
+
+    :param reader: a PackedBible, CompressedBible or SplitBible of the sample
+    """
+    expected = Bible(
+        VERSION,
+        HTML,
+        VERSE_START_INDICES,
+        VERSE_END_INDICES,
+        is_html=True,
+    )
+
+    assert reader.version == VERSION
+    assert reader.is_html
+
+    for start_verse_id in VERSE_START_INDICES:
+        for end_verse_id in VERSE_END_INDICES:
+            assert reader.get_scripture(
+                start_verse_id,
+                end_verse_id,
+            ) == expected.get_scripture(start_verse_id, end_verse_id)
+
+    assert reader.get_scripture(1001002) == "<p><sup>2</sup> Ĕ and the earth.</p>"
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+import pythonbible as bible
+
+from pythonbible_parser.errors import InvalidSplitBibleError
+from pythonbible_parser.split_bible import MANIFEST_FILENAME
+from pythonbible_parser.split_bible import SplitBible
+from pythonbible_parser.split_bible import write_split_bible
+from tests.sample_bible import HTML
+from tests.sample_bible import VERSE_END_INDICES
+from tests.sample_bible import VERSE_START_INDICES
+from tests.sample_bible import VERSION
+from tests.sample_bible import assert_same_scripture
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+SHORT_TITLES: dict[bible.Book, str] = {
+    bible.Book.GENESIS: "Genesis",
+    bible.Book.EXODUS: "Exodus",
+}
+LONG_TITLES: dict[bible.Book, str] = {
+    bible.Book.GENESIS: "The First Book of Moses, called Genesis",
+    bible.Book.EXODUS: "The Second Book of Moses, called Exodus",
+}
+
+
+@pytest.fixture
+def split_bible(tmp_path: Path) -> SplitBible:
+    write_split_bible(
+        tmp_path / "html",
+        VERSION,
+        HTML,
+        VERSE_START_INDICES,
+        VERSE_END_INDICES,
+        is_html=True,
+        short_titles=SHORT_TITLES,
+        long_titles=LONG_TITLES,
+    )
+
+    return SplitBible(tmp_path / "html")
+
+
+def test_write_split_bible(tmp_path: Path) -> None:
+    # When we write a rendering to a split Bible folder
+    write_split_bible(
+        tmp_path / "html",
+        VERSION,
+        HTML,
+        VERSE_START_INDICES,
+        VERSE_END_INDICES,
+        is_html=True,
+    )
+
+    # Then it contains a manifest and one file per book
+    assert sorted(path.name for path in (tmp_path / "html").iterdir()) == [
+        "exodus.marshal",
+        "genesis.marshal",
+        MANIFEST_FILENAME,
+    ]
+
+
+def test_get_scripture(split_bible: SplitBible) -> None:
+    # Given a split Bible, then it has the same titles and scripture as the Bible
+    # in memory
+    assert split_bible.short_titles == SHORT_TITLES
+    assert split_bible.long_titles == LONG_TITLES
+    assert_same_scripture(split_bible)
+
+
+def test_get_scripture_loads_only_the_books_of_the_verses(
+    split_bible: SplitBible,
+) -> None:
+    # Given a split Bible that has not been used yet
+    assert split_bible.loaded_books == []
+
+    # When we get a verse of Exodus
+    split_bible.get_scripture(2001001)
+
+    # Then only its book is loaded
+    assert split_bible.loaded_books == [bible.Book.EXODUS]
+
+    # And when we unload the books, then none is loaded
+    split_bible.unload()
+    assert split_bible.loaded_books == []
+
+
+def test_get_scripture_invalid_verse(
+    split_bible: SplitBible,
+    invalid_verse_id: int,
+) -> None:
+    with pytest.raises(bible.InvalidVerseError):
+        split_bible.get_scripture(invalid_verse_id)
+
+
+def test_get_scripture_missing_verse(split_bible: SplitBible) -> None:
+    with pytest.raises(bible.VersionMissingVerseError):
+        split_bible.get_scripture(1001001, 1001004)
+
+    with pytest.raises(bible.VersionMissingVerseError):
+        split_bible.get_scripture(3001001)
+
+
+def test_invalid_folder(tmp_path: Path) -> None:
+    # Given a folder without a manifest
+    # When we open it, then an error is raised
+    with pytest.raises(InvalidSplitBibleError):
+        SplitBible(tmp_path)
+
+    # Given a folder with a manifest that is not valid
+    (tmp_path / MANIFEST_FILENAME).write_bytes(b"not a manifest")
+
+    # When we open it, then an error is raised
+    with pytest.raises(InvalidSplitBibleError):
+        SplitBible(tmp_path)
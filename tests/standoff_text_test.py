@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import pytest
+import pythonbible as bible
+
+from pythonbible_parser import events
+from pythonbible_parser.errors import InvalidRenderingError
+from pythonbible_parser.renderers import RENDERINGS
+from pythonbible_parser.renderers import get_renderer
+from pythonbible_parser.standoff_text import StandoffText
+
+BOOK_EVENTS: dict[bible.Book, list[events.Event]] = {
+    bible.Book.JOHN: [
+        (events.TITLE, "", ""),
+        (events.VERSE_START, 43001001, 1),
+        (events.TEXT, "In the beginning was the Word", True),
+        (events.VERSE_END, 43001001, None),
+    ],
+    bible.Book.GENESIS: [
+        (events.TITLE, "The First Book of Moses, called Genesis", "Genesis"),
+        (events.PARAGRAPH_OPEN, None, None),
+        (events.VERSE_START, 1001001, 1),
+        (events.TEXT, "In the beginning", True),
+        (events.NOTE_TEXT, "Or, at first", True),
+        (events.TEXT, "ĕ.", False),
+        (events.VERSE_END, 1001001, None),
+        (events.PARAGRAPH_CLOSE, None, None),
+        (events.TITLE, "A title in the book", ""),
+        (events.PARAGRAPH_OPEN, None, None),
+        (events.PARAGRAPH_CLOSE, None, None),
+    ],
+}
+
+
+def test_standoff_text() -> None:
+    # Given the events of some books
+    # When we build a standoff text from them
+    standoff_text = StandoffText(bible.Version.KING_JAMES, BOOK_EVENTS.items())
+
+    # Then the text is stored once, and the events are rebuilt in canonical order
+    assert standoff_text.text == (
+        "In the beginning was the WordIn the beginningOr, at firstĕ."
+    )
+    assert standoff_text.books == [bible.Book.GENESIS, bible.Book.JOHN]
+    assert dict(standoff_text.iter_book_events()) == BOOK_EVENTS
+
+
+@pytest.mark.parametrize("rendering", RENDERINGS)
+def test_render(rendering: str) -> None:
+    # Given a standoff text
+    standoff_text = StandoffText(bible.Version.KING_JAMES, BOOK_EVENTS.items())
+
+    # When we build a rendering from it
+    text, verse_start_indices, verse_end_indices = standoff_text.render(rendering)
+
+    # Then it is the same as the rendering of each book, in canonical order
+    genesis = get_renderer(rendering)
+    genesis.render(BOOK_EVENTS[bible.Book.GENESIS])
+    john = get_renderer(rendering, len(genesis.get_text()))
+    john.render(BOOK_EVENTS[bible.Book.JOHN])
+
+    assert text == genesis.get_text() + john.get_text()
+    assert verse_start_indices == {
+        **genesis.verse_start_indices,
+        **john.verse_start_indices,
+    }
+    assert verse_end_indices == {**genesis.verse_end_indices, **john.verse_end_indices}
+
+
+def test_get_bible() -> None:
+    # Given a standoff text
+    standoff_text = StandoffText(bible.Version.KING_JAMES, BOOK_EVENTS.items())
+
+    # When we get the Bible of a rendering
+    notes_bible = standoff_text.get_bible("plain_text_notes")
+
+    # Then it has the text of the rendering
+    assert notes_bible.get_scripture(1001001) == "1. In the beginning Or, at firstĕ."
+    assert not notes_bible.is_html
+
+
+def test_render_invalid_rendering() -> None:
+    standoff_text = StandoffText(bible.Version.KING_JAMES, BOOK_EVENTS.items())
+
+    with pytest.raises(InvalidRenderingError):
+        standoff_text.render("html_invalid")
+
+
+def test_get_scripture() -> None:
+    # Given a standoff text
+    standoff_text = StandoffText(bible.Version.KING_JAMES, BOOK_EVENTS.items())
+
+    # When we get the scripture of some verses of a rendering
+    # Then it is the same as the scripture of the whole rendering
+    for rendering in RENDERINGS:
+        expected = standoff_text.get_bible(rendering)
+
+        for start_verse_id, end_verse_id in [(1001001, None), (1001001, 43001001)]:
+            assert standoff_text.get_scripture(
+                rendering,
+                start_verse_id,
+                end_verse_id,
+            ) == expected.get_scripture(start_verse_id, end_verse_id)
+
+
+def test_get_scripture_missing_verse(invalid_verse_id: int) -> None:
+    # Given a standoff text
+    standoff_text = StandoffText(bible.Version.KING_JAMES, BOOK_EVENTS.items())
+
+    # When we get the scripture of verses that are not in it, then an error is
+    # raised
+    with pytest.raises(bible.VersionMissingVerseError):
+        standoff_text.get_scripture("html", 1001002)
+
+    with pytest.raises(bible.VersionMissingVerseError):
+        standoff_text.get_scripture("html", 1001001, 2001001)
+
+    with pytest.raises(bible.InvalidVerseError):
+        standoff_text.get_scripture("html", invalid_verse_id)
+
+    with pytest.raises(InvalidRenderingError):
+        standoff_text.get_scripture("invalid", 1001001)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pythonbible as bible
+from pythonbible.bible.bible import Bible
+
+from pythonbible_parser.verse_index import VerseIndex
+
+PLAIN_TEXT: str = "1 In the beginning. 2 And the earth. 3 And God said. 1 Now these."
+VERSE_START_INDICES: dict[int, int] = {
+    1001001: 0,
+    1001002: 20,
+    1001003: 37,
+    2001001: 53,
+}
+VERSE_END_INDICES: dict[int, int] = {
+    1001001: 20,
+    1001002: 37,
+    1001003: 53,
+    2001001: 65,
+}
+
+
+def test_verse_index() -> None:
+    # Given the verse indices of a text
+    # When we build a verse index from them
+    verse_index = VerseIndex(VERSE_START_INDICES, VERSE_END_INDICES)
+
+    # Then it has the same indices
+    assert list(verse_index) == [1001001, 1001002, 1001003, 2001001]
+    assert verse_index.verse_start_indices == VERSE_START_INDICES
+    assert verse_index.verse_end_indices == VERSE_END_INDICES
+    assert repr(verse_index.verse_end_indices) == repr(VERSE_END_INDICES)
+    assert verse_index.get_start(1001002) == VERSE_START_INDICES[1001002]
+    assert verse_index.get_end(2001001) == VERSE_END_INDICES[2001001]
+    assert verse_index.verse_start_indices.get(2001002) is None
+    assert verse_index.get_end(2001002) is None
+    assert "1001001" not in verse_index.verse_start_indices
+
+
+def test_verse_index_missing_and_unordered_indices() -> None:
+    # Given verse indices with a verse that has no end, one that has no start, and
+    # verses that are not in the order of their verse ids
+    verse_start_indices = {1001001: 100, 1001002: 0, 1001004: 2_000_000_000}
+    verse_end_indices = {1001001: 150, 1001003: 90, 1001004: 2_000_000_010}
+
+    # When we build a verse index from them
+    verse_index = VerseIndex(verse_start_indices, verse_end_indices)
+
+    # Then it has the same indices
+    assert verse_index.verse_start_indices == verse_start_indices
+    assert verse_index.verse_end_indices == verse_end_indices
+    assert list(verse_index) == [1001001, 1001002, 1001003, 1001004]
+    assert len(verse_index.verse_start_indices) == len(verse_start_indices)
+    assert len(verse_index.verse_end_indices) == len(verse_end_indices)
+    assert verse_index.get_end(1001002) is None
+    assert verse_index.get_start(1001003) is None
+
+
+def test_verse_index_len() -> None:
+    # Given a verse index
+    verse_index = VerseIndex(VERSE_START_INDICES, VERSE_END_INDICES)
+    looked_up: list[int] = []
+    verse_index.verse_end_indices.get_index = looked_up.append
+
+    # When we get the number of verses with an end
+    length: int = len(verse_index.verse_end_indices)
+
+    # Then it is known without looking up any verse
+    assert length == len(VERSE_END_INDICES)
+    assert not looked_up
+
+
+def test_verse_index_bible() -> None:
+    # Given a verse index
+    verse_index = VerseIndex(VERSE_START_INDICES, VERSE_END_INDICES)
+
+    # When we use it to create a Bible
+    actual = Bible(
+        bible.Version.KING_JAMES,
+        PLAIN_TEXT,
+        verse_index.verse_start_indices,
+        verse_index.verse_end_indices,
+    )
+
+    # Then the scripture is the same as with the dicts
+    expected = Bible(
+        bible.Version.KING_JAMES,
+        PLAIN_TEXT,
+        VERSE_START_INDICES,
+        VERSE_END_INDICES,
+    )
+
+    for start_verse_id in VERSE_START_INDICES:
+        for end_verse_id in VERSE_END_INDICES:
+            assert actual.get_scripture(
+                start_verse_id,
+                end_verse_id,
+            ) == expected.get_scripture(start_verse_id, end_verse_id)